@@ -1,16 +1,69 @@
-from fidget.backend.QtGui import QIcon
-# noinspection PyUnresolvedReferences
-import fidget.backend._resources
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from fidget.backend.QtGui import QIcon, QIconEngine, QPainter, QPixmap
+from fidget.backend.QtCore import QRect, QSize
+from fidget.backend.QtWidgets import QApplication
+
+
+def load_resources():
+    """
+    register fidget's embedded resources with Qt, if they weren't registered already
+    """
+    # the resources are registered when the module is first imported
+    # noinspection PyUnresolvedReferences
+    import fidget.backend._resources
+
+
+class _CachingIconEngine(QIconEngine):
+    """
+    An icon engine that draws the rasterized pixmaps of a LazyIcon
+    """
+
+    def __init__(self, lazy_icon: LazyIcon):
+        super().__init__()
+        self.lazy_icon = lazy_icon
+
+    def pixmap(self, size: QSize, mode, state) -> QPixmap:
+        return self.lazy_icon.pixmap(size, mode)
+
+    def paint(self, painter: QPainter, rect: QRect, mode, state):
+        painter.drawPixmap(rect, self.pixmap(rect.size(), mode, state))
+
+    def clone(self):
+        return _CachingIconEngine(self.lazy_icon)
 
 
 class LazyIcon:
     def __init__(self, path):
         self.path = path
         self._instance = None
+        # (width, height, mode) -> pixmap
+        self._pixmaps: Dict[Tuple[int, int, int], QPixmap] = {}
+        self._renderer: QIcon = None
+
+    def pixmap(self, size: QSize, mode=QIcon.Normal) -> QPixmap:
+        """
+        :return: the icon rasterized to a size, only rendering it on the first request
+        """
+        key = (size.width(), size.height(), mode)
+        ret = self._pixmaps.get(key)
+        if ret is None:
+            if self._renderer is None:
+                load_resources()
+                self._renderer = QIcon(self.path)
+            ret = self._pixmaps[key] = self._renderer.pixmap(size, mode)
+        return ret
 
     def __call__(self, *args, **kwargs):
         if not self._instance:
-            self._instance = QIcon(self.path)
+            load_resources()
+            if QApplication.instance() is None:
+                # pixmaps can only be created once there is an application, so the icon isn't cached until then
+                return QIcon(self.path)
+            # each size and mode is only rasterized when the icon is first drawn in it
+            self._instance = QIcon(_CachingIconEngine(self))
         return self._instance
 
 
@@ -1,6 +1,10 @@
 from typing import Dict, Union, Optional
 
+from pathlib import Path
 from warnings import warn
+import json
+import os
+import sys
 
 from fidget.backend.qtbackend import QtBackend, PyQt5_backend, PySide2_backend
 
@@ -11,6 +15,65 @@ backends: Dict[str, QtBackend] = {'PySide2': PySide2_backend, 'PyQt5': PyQt5_bac
 
 loaded: Optional[QtBackend] = None
 
+BACKEND_ENV_VAR = 'FIDGET_BACKEND'
+"""if set, the name of the backend to use when no preference was set with prefer"""
+CACHE_ENV_VAR = 'FIDGET_BACKEND_CACHE'
+"""if set, the path of the backend cache file, or empty to disable the cache"""
+
+
+def cache_path() -> Optional[Path]:
+    """
+    :return: the path of the file that stores the last successfully loaded backend of every interpreter, or None if
+     the cache is disabled or no cache directory can be found
+    """
+    ret = os.environ.get(CACHE_ENV_VAR)
+    if ret is not None:
+        return Path(ret) if ret else None
+    cache_dir = os.environ.get('XDG_CACHE_HOME')
+    if not cache_dir:
+        try:
+            cache_dir = Path.home() / '.cache'
+        except (RuntimeError, KeyError):
+            # the home directory cannot be resolved (e.g. HOME is unset and the user has no passwd entry)
+            return None
+    return Path(cache_dir, 'fidget', 'backend.json')
+
+
+def _read_cache() -> Dict[str, str]:
+    path = cache_path()
+    if not path:
+        return {}
+    try:
+        ret = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(ret, dict):
+        return {}
+    return ret
+
+
+def cached_backend() -> Optional[QtBackend]:
+    """
+    :return: the backend that was last loaded successfully by the current interpreter, if any
+    """
+    return backends.get(_read_cache().get(sys.executable))
+
+
+def _write_cache(backend: QtBackend):
+    path = cache_path()
+    if not path:
+        return
+    cache = _read_cache()
+    if cache.get(sys.executable) == backend.__name__:
+        return
+    cache[sys.executable] = backend.__name__
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache))
+    except OSError:
+        # the cache is only an optimization
+        pass
+
 
 def prefer(backend: Union[QtBackend, str], try_all=False):
     """
@@ -37,6 +100,9 @@ def prefer(backend: Union[QtBackend, str], try_all=False):
 def load() -> QtBackend:
     """
     load backends until one succeeds and returns that backend.
+    The backends are tried in order: the backend set with prefer, else the backend named by the FIDGET_BACKEND
+    environment variable, then the backend last loaded by the current interpreter (see cache_path), and then all the
+    rest.
     :return: the first successful backend
     """
     global loaded
@@ -46,19 +112,35 @@ def load() -> QtBackend:
 
     first_err = None
 
-    if priority:
+    preferred, preferred_fail_ok = priority, fail_ok
+    if not preferred and os.environ.get(BACKEND_ENV_VAR):
+        name = os.environ[BACKEND_ENV_VAR]
         try:
-            priority.load()
+            preferred = backends[name]
+        except KeyError:
+            raise ValueError(f'{BACKEND_ENV_VAR} must be one of {", ".join(backends)}, got {name!r}') from None
+        preferred_fail_ok = False
+
+    if preferred:
+        try:
+            preferred.load()
         except ImportError as e:
-            if not fail_ok:
+            if not preferred_fail_ok:
                 raise
             first_err = e
         else:
-            loaded = priority
+            loaded = preferred
             return loaded
 
-    for backend in backends.values():
-        if backend is priority:
+    # the cached backend is tried first, so that other bindings aren't needlessly imported
+    cached = cached_backend()
+    candidates = list(backends.values())
+    if cached:
+        candidates.remove(cached)
+        candidates.insert(0, cached)
+
+    for backend in candidates:
+        if backend is preferred:
             continue
 
         try:
@@ -68,6 +150,7 @@ def load() -> QtBackend:
                 first_err = e
         else:
             loaded = backend
+            _write_cache(loaded)
             return loaded
 
     if not first_err:
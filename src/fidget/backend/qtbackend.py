@@ -61,8 +61,13 @@ class NamePrefixQtBackend(QtBackend):
         self.modules: Dict[str, ModuleType] = {}
         self.__name__ = name
 
+    LOAD_SUBMODULES = ('', 'QtCore')
+    """
+    the submodules imported on load, to check that the backend works, other submodules are imported when first used
+    """
+
     def load(self):
-        for submodule in ['', 'QtWidgets', 'QtCore', 'QtGui']:
+        for submodule in self.LOAD_SUBMODULES:
             self.load_module(submodule)
 
     def load_module(self, sub_name):
@@ -0,0 +1,163 @@
+"""
+Evaluate many plaintext inputs against a Fidget template, without creating any widgets.
+
+usage: python -m fidget.batch <module:template> <inputs.jsonl> [-o output.jsonl] [-w workers] [-c chunk_size]
+
+Each line of the input is a JSON record. String records are parsed as they are, any other record is re-encoded as
+JSON text (so that it can be parsed by the template's JSON parsers). Each output line is a JSON object with the
+record's index, whether it is ok, and either the value's details or the error's details. A record that raises any
+error is reported as failed, it does not stop the run.
+"""
+from __future__ import annotations
+
+from typing import Union, Iterable, Iterator, List, Dict, Any, Optional, Tuple, Type
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from itertools import islice, count
+import argparse
+import json
+import os
+import sys
+
+from fidget.core import Fidget, TemplateLike, FidgetTemplate
+from fidget.core.__util__ import error_details
+
+TemplateSpec = Union[str, TemplateLike, Type[Fidget]]
+
+_worker_model: Optional[Fidget] = None
+
+
+def load_template(spec: TemplateSpec) -> FidgetTemplate:
+    """
+    get a template from a template specification
+    :param spec: either a template-like, a Fidget class, or a string of the form "module:attribute"
+    :return: the specified template
+    """
+    if isinstance(spec, str):
+        module_name, sep, attr_path = spec.partition(':')
+        if not sep or not attr_path:
+            raise ValueError(f'template specification must be of the form module:attribute, got {spec!r}')
+        spec = import_module(module_name)
+        for attr in attr_path.split('.'):
+            spec = getattr(spec, attr)
+    if isinstance(spec, type) and issubclass(spec, Fidget):
+        return spec.template()
+    if isinstance(spec, TemplateLike):
+        return spec.template_of()
+    raise TypeError(f'cannot make a template out of {spec!r}')
+
+
+def record_text(record) -> str:
+    """
+    :return: the plaintext to parse for a record
+    """
+    if isinstance(record, str):
+        return record
+    return json.dumps(record)
+
+
+def evaluate_text(model: Fidget, text: str) -> Dict[str, Any]:
+    """
+    parse and validate a single plaintext with a (headless) Fidget
+    :return: a dict with "ok", and either "value" (the details of the value) or "error" and "details"
+    """
+    try:
+        model.fill_from_text(text)
+        value = model.value()
+        if value.is_ok():
+            return {'ok': True, 'value': value.details}
+        return {'ok': False, 'error': value.type_details, 'details': value.details}
+    except Exception as e:
+        # a single bad record must not stop the whole run
+        return {'ok': False, 'error': type(e).__name__, 'details': error_details(e)}
+
+
+def _init_worker(spec: TemplateSpec):
+    global _worker_model
+    _worker_model = load_template(spec).headless()
+
+
+def _evaluate_chunk(start: int, texts: List[str]) -> List[Dict[str, Any]]:
+    ret = []
+    for i, text in enumerate(texts, start):
+        result = evaluate_text(_worker_model, text)
+        ret.append({'index': i, **result})
+    return ret
+
+
+def _chunks(texts: Iterable[str], chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    texts = iter(texts)
+    for start in count(0, chunk_size):
+        chunk = list(islice(texts, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+
+
+def evaluate(spec: TemplateSpec, texts: Iterable[str], workers: Optional[int] = None, chunk_size: int = 64) \
+        -> Iterator[Dict[str, Any]]:
+    """
+    parse and validate plaintexts against a template, in parallel, yielding the results in order
+    :param spec: the template specification, see load_template. When evaluating in worker processes, the
+        specification must be picklable (a "module:attribute" string always is).
+    :param texts: the plaintexts to evaluate
+    :param workers: the number of worker processes, 0 to evaluate in the current process, None to use the
+        executor's default
+    :param chunk_size: the number of texts sent to a worker at once
+    :return: an iterator of dicts with the text's "index", "ok", and either "value" or "error" and "details"
+    """
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+    chunks = _chunks(texts, chunk_size)
+
+    if workers == 0:
+        _init_worker(spec)
+        for start, chunk in chunks:
+            yield from _evaluate_chunk(start, chunk)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(spec,)) as executor:
+        # keep a bounded number of chunks in flight, so that the inputs are read lazily
+        max_in_flight = 2 * (workers or os.cpu_count() or 1)
+        in_flight = deque()
+        for start, chunk in chunks:
+            in_flight.append(executor.submit(_evaluate_chunk, start, chunk))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m fidget.batch',
+                                     description='parse and validate a JSON-lines file of plaintext inputs against a '
+                                                 'Fidget template, without creating any widgets')
+    parser.add_argument('template', help='the template, in the form module:attribute')
+    parser.add_argument('inputs', help='a JSON-lines file of records, or - for stdin')
+    parser.add_argument('-o', '--output', default='-', help='the JSON-lines output file, or - for stdout (default)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='the number of worker processes, 0 to run in-process (default: one per CPU)')
+    parser.add_argument('-c', '--chunk-size', type=int, default=64,
+                        help='the number of records sent to a worker at once (default: 64)')
+    args = parser.parse_args(args)
+
+    in_file = sys.stdin if args.inputs == '-' else open(args.inputs, encoding='utf-8')
+    out_file = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    failures = 0
+    try:
+        texts = (record_text(json.loads(line)) for line in in_file if line.strip())
+        for result in evaluate(args.template, texts, workers=args.workers, chunk_size=args.chunk_size):
+            failures += not result['ok']
+            out_file.write(json.dumps(result) + '\n')
+    finally:
+        if in_file is not sys.stdin:
+            in_file.close()
+        if out_file is not sys.stdout:
+            out_file.close()
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -6,5 +6,7 @@ from fidget.core.plaintext_adapter import \
     explicit, low_priority, mid_priority, high_priority,\
     wrap_plaintext_parser, wrap_plaintext_printer,\
     inner_plaintext_printer, inner_plaintext_parser
-from fidget.core.fidget_value import ParseError, ValidationError
+from fidget.core.fidget_value import ParseError, ValidationError, PendingValidation
+from fidget.core.validation_cache import ValidationCache
+from fidget.core.profiler import FidgetProfiler
 from fidget.core.user_util import wrap_parser, wrap_validator, validator
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Tuple, Set, ClassVar
+
+from heapq import heappush, heappop
+from itertools import count
+
+from fidget.backend.QtCore import QTimer
+
+if TYPE_CHECKING:
+    from fidget.core.fidget import Fidget
+
+
+class ChangeScheduler:
+    """
+    Coalesces the change notifications of a Fidget tree. Changed Fidgets are marked as dirty, and are re-indicated
+    (and their on_change emitted) once per event loop turn, deepest first. So that each ancestor is re-parsed at most
+    once per flush, regardless of how many of its descendants changed.
+    While a batch is open on the scheduler, it is not flushed until the outermost batch closes.
+    """
+    active: ClassVar[int] = 0
+    """the number of attached schedulers, when 0, Fidgets don't bother looking for a scheduler"""
+    pending: ClassVar[Set[ChangeScheduler]] = set()
+    """all the schedulers that have unflushed changes"""
+
+    def __init__(self, owner: Fidget):
+        """
+        :param owner: the root Fidget of the tree to schedule
+        """
+        self.owner = owner
+        self._heap: List[Tuple[int, int, Fidget]] = []
+        self._queued: Set[Fidget] = set()
+        self._counter = count()
+        self.flushing = False
+        self.flush_scheduled = False
+        self.batch_depth = 0
+
+    def attach(self):
+        assert getattr(self.owner, '_change_scheduler', None) is None, 'owner already has a change scheduler'
+        self.owner._change_scheduler = self
+        type(self).active += 1
+
+    def detach(self):
+        assert self.owner._change_scheduler is self, 'scheduler is not attached'
+        self.flush()
+        self.owner._change_scheduler = None
+        type(self).active -= 1
+
+    def mark(self, fidget: Fidget, depth: int):
+        """
+        mark a Fidget as changed, its indicator will be updated and its on_change emitted on the next flush
+        :param fidget: the changed Fidget
+        :param depth: the depth of the Fidget from the owner
+        """
+        if fidget in self._queued:
+            return
+        self._queued.add(fidget)
+        # deepest nodes are popped first, ties are broken by the order of marking
+        heappush(self._heap, (-depth, next(self._counter), fidget))
+        self.pending.add(self)
+        if not (self.flushing or self.flush_scheduled or self.batch_depth):
+            self.flush_scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """
+        update and emit all the marked Fidgets, deepest first
+        """
+        self.flush_scheduled = False
+        if self.flushing or self.batch_depth:
+            return
+        self.flushing = True
+        try:
+            while self._heap:
+                *_, fidget = heappop(self._heap)
+                self._queued.discard(fidget)
+                fidget._flush_change()
+        finally:
+            self.flushing = False
+            if not self._heap:
+                self.pending.discard(self)
+
+    @classmethod
+    def flush_pending(cls):
+        """
+        flush all the schedulers that have unflushed changes
+        """
+        for scheduler in list(cls.pending):
+            scheduler.flush()
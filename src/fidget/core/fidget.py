@@ -2,26 +2,36 @@ from __future__ import annotations
 
 from typing import Generic, TypeVar, Optional, Callable, Tuple, Iterable, Type, Dict, Any, Union, List
 
+from weakref import WeakSet
+
 from abc import abstractmethod
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from functools import partial, wraps, reduce
+from functools import partial, wraps, reduce, lru_cache
+from time import perf_counter
 from itertools import chain
 
 from fidget.backend.QtWidgets import QWidget, QPlainTextEdit, QPushButton, QComboBox, QLabel, QHBoxLayout, QVBoxLayout, \
     QMessageBox, QFileDialog, QGroupBox, QGridLayout, QDialog, QSizePolicy, QBoxLayout
-from fidget.backend.QtCore import Qt, pyqtSignal, __backend__
+from fidget.backend.QtCore import Qt, pyqtSignal, QEvent, __backend__
 
 from fidget.core.plaintext_adapter import PlaintextParseError, PlaintextPrintError, \
-    join_parsers, join_printers, PlaintextParser, PlaintextPrinter, \
+    join_sorted_parsers, join_sorted_printers, PlaintextParser, PlaintextPrinter, \
     format_spec_input_printer, formatted_string_input_printer, exec_printer, eval_printer, \
-    sort_adapters
-from fidget.core.fidget_value import FidgetValue, BadValue, GoodValue, ParseError, ValidationError
+    sort_adapters, AdapterPriority
+from fidget.core.fidget_value import FidgetValue, BadValue, GoodValue, ParseError, ValidationError, Pending, \
+    PendingValidation
+from fidget.core.change_scheduler import ChangeScheduler
+from fidget.core.validation_executor import validation_executor
+from fidget.core.validation_cache import ValidationCache
+from fidget.core.profiler import FidgetProfiler
 from fidget.core.primitive_questions import FontQuestion
 from fidget.core.__util__ import error_details, first_valid, error_attrs, optional_valid
 
 T = TypeVar('T')
 
+SortedAdapters = Tuple[Tuple[T, AdapterPriority], ...]
+
 
 # todo automatically create template if QApplication isn't instantiated?⌡
 
@@ -51,6 +61,11 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
         self.args = args
         self.kwargs = kwargs
         self._instance: Optional[Fidget[T]] = None
+        # the singleton headless instances of the template and of wrappers around it, by wrapper class
+        self._headless_instances: Dict[Optional[Type[Fidget]], Fidget] = {}
+        # the factories are created once, templates are instantiated many times (e.g. as cells of a matrix)
+        self._factory: Optional[Callable[..., Fidget[T]]] = None
+        self._headless_factory: Optional[Callable[..., Fidget[T]]] = None
 
     @property
     def title(self) -> Optional[str]:
@@ -72,7 +87,18 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
         """
         Create a widget form the template. args and kwargs are forwarded to the class constructor.
         """
-        return self._partial()(*args, **kwargs)
+        if self._factory is None:
+            self._factory = self._partial()
+        return self._factory(*args, **kwargs)
+
+    def headless(self, *args, **kwargs) -> Fidget[T]:
+        """
+        Create a headless Fidget from the template (see Fidget.headless). args and kwargs are forwarded to the class
+        constructor.
+        """
+        if self._headless_factory is None:
+            self._headless_factory = partial(self.widget_cls.headless, *self.args, **self.kwargs)
+        return self._headless_factory(*args, **kwargs)
 
     def set_default(self, **kwargs):
         for key in list(kwargs.keys()):
@@ -84,8 +110,11 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
         """
         Create a further template from additional parameters
         """
+        # templates are never mutated, so they can share their arguments
+        if not args and not kwargs:
+            return self
         args = self.args + args
-        kwargs = {**self.kwargs, **kwargs}
+        kwargs = {**self.kwargs, **kwargs} if kwargs else self.kwargs
         return type(self)(self.widget_cls, args, kwargs)
 
     def template_of(self):
@@ -105,29 +134,14 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
             filled into sink.
         :param keys: a list of keys to extract
         :param union: whether to perform a union or intersect in case of multiple, conflicting default values
+        :note: the extracted defaults are cached, so changes to the UPPERCASE class variables of the templates' classes
+            or of upper_space after they are first extracted are not reflected.
         """
-
-        def combine_key(k):
-            ret = None
-            for t in templates:
-                v = t.kwargs.get(k)
-                if v is None:
-                    v = getattr(t.widget_cls, k.upper(), None)
-                if v is not None:
-                    if v == union:
-                        return union
-                    else:
-                        ret = v
-            return ret
-
         if keys is ...:
             keys = ('make_plaintext', 'make_indicator', 'make_title', 'auto_func')
 
-        for k in keys:
-            if k in sink or getattr(upper_space, k.upper(), None) is not None:
-                continue
-            v = combine_key(k)
-            if v is not None:
+        for k, v in _extracted_defaults(templates, upper_space, tuple(keys), union):
+            if k not in sink:
                 sink[k] = v
 
     def __repr__(self):
@@ -145,6 +159,90 @@ class FidgetTemplate(Generic[T], TemplateLike[T]):
             self._instance = self()
         return self._instance
 
+    def headless_instance(self, wrapper_cls: Optional[Type[Fidget]] = None) -> Fidget:
+        """
+        :param wrapper_cls: a Fidget class that wraps a single template, or None for the template itself
+        :return: a singleton headless instantiation of this template, or of wrapper_cls wrapping this template
+        """
+        ret = self._headless_instances.get(wrapper_cls)
+        if ret is None:
+            ret = self.headless() if wrapper_cls is None else wrapper_cls.headless(self)
+            self._headless_instances[wrapper_cls] = ret
+        return ret
+
+
+@lru_cache(maxsize=1024)
+def _extracted_defaults(templates: Tuple[FidgetTemplate, ...], upper_space, keys: Tuple[str, ...], union) \
+        -> Tuple[Tuple[str, Any], ...]:
+    """
+    :return: the key-value pairs that FidgetTemplate.extract_default would set in an empty sink
+    """
+
+    def combine_key(k):
+        ret = None
+        for t in templates:
+            v = t.kwargs.get(k)
+            if v is None:
+                v = getattr(t.widget_cls, k.upper(), None)
+            if v is not None:
+                if v == union:
+                    return union
+                else:
+                    ret = v
+        return ret
+
+    ret = []
+    for k in keys:
+        if getattr(upper_space, k.upper(), None) is not None:
+            continue
+        v = combine_key(k)
+        if v is not None:
+            ret.append((k, v))
+    return tuple(ret)
+
+
+class IndicatorLabel(QLabel):
+    """
+    A label indicating a Fidget's value, only computing the tooltip of the value when it is requested
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.indicated_value: Optional[FidgetValue] = None
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip and self.indicated_value is not None:
+            self.setToolTip(self.indicated_value.short_details)
+            self.indicated_value = None
+        return super().event(event)
+
+
+def _headless_aware(init_ui):
+    """
+    wrap an init_ui method so that for headless Fidgets, init_headless is called (once) instead
+    """
+    if getattr(init_ui, '__headless_aware__', False):
+        return init_ui
+
+    @wraps(init_ui)
+    def ret(self, *args, **kwargs):
+        if not self._headless:
+            if FidgetProfiler.active and not self._profiling_init_ui:
+                # only the outermost init_ui of the class hierarchy is timed
+                self._profiling_init_ui = True
+                try:
+                    return self._profiled('init_ui', init_ui, self, *args, **kwargs)
+                finally:
+                    self._profiling_init_ui = False
+            return init_ui(self, *args, **kwargs)
+        if not self._headless_initialized:
+            self._headless_initialized = True
+            self.init_headless()
+        return None
+
+    ret.__headless_aware__ = True
+    return ret
+
 
 class Fidget(QWidget, Generic[T], TemplateLike[T]):
     """
@@ -177,17 +275,44 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     * plaintext_parsers: yield from super().plaintext_parsers (empty by default), and yield whatever parsers you want.
         * NOTE: you can also just wrap class function with InnerParser / InnerPrinter
     * fill: optional, set the widget's values based on a value
+    * init_headless: optional, initialize the non-widget structure needed to parse, validate and print values without
+        widgets (inner Fidgets should be created headless). Called instead of init_ui for headless Fidgets.
     """
     MAKE_TITLE: bool = None
     MAKE_INDICATOR: bool = None
     MAKE_PLAINTEXT: bool = None
+    COALESCE_CHANGES = False
+    ASYNC_VALIDATION = False
+    VALIDATION_CACHE_SIZE = 0
     FLAGS = Qt.WindowFlags()
 
+    _headless = False
+    _headless_initialized = False
+    NO_HEADLESS_STATE = object()
+
+    _profiler: Optional[FidgetProfiler] = None
+    _profiling_init_ui = False
+
     def __new__(cls, *args, **kwargs):
         ret = super().__new__(cls, *args, **kwargs)
         ret.__new_args = (args, kwargs)
         return ret
 
+    @classmethod
+    def headless(cls, *args, **kwargs) -> Fidget[T]:
+        """
+        Create a headless Fidget, that has no widgets and so does not require a QApplication.
+        A headless Fidget can parse and print plaintext, be filled, and validate its value, but holds its value
+        directly, instead of in widgets. Inner Fidgets of a headless Fidget are also headless, and only the Fidget that
+        was filled holds the filled value.
+        :param args: forwarded to the constructor
+        :param kwargs: forwarded to the constructor
+        """
+        ret = cls.__new__(cls, *args, **kwargs)
+        ret._headless = True
+        ret.__init__(*args, **kwargs)
+        return ret
+
     def __init__(self, title,
                  *args,
                  validation_func: Callable[[T], None] = None,
@@ -196,6 +321,9 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
                  make_indicator: bool = None,
                  make_plaintext: bool = None,
                  help: str = None,
+                 coalesce_changes: bool = None,
+                 async_validation: bool = None,
+                 validation_cache_size: int = None,
                  **kwargs):
         """
         :param title: the title of the Fidget
@@ -206,6 +334,13 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         :param make_indicator: whether to make an indicator widget
         :param make_plaintext: whether to make a plaintext_edit widget
         :param help: a help string to describe the widget
+        :param coalesce_changes: whether to coalesce the change notifications of all the Fidget's descendants, updating
+            them once per event loop turn, deepest first. Usually only set for top-level Fidgets.
+        :param async_validation: whether to run validation_func in a background thread. The rest of the validation,
+            which may read the widgets, still runs in the GUI thread. While validation_func runs, the Fidget's value
+            is Pending. validation_func must not access any widgets.
+        :param validation_cache_size: the number of validation results to remember, keyed by the validated value.
+            Only use with validations that are pure functions of the value. 0 to disable the cache.
         :param kwargs: additional arguments forwarded to QWidget
 
         :inheritors: don't set default values for these parameters, change the uppercase class variables instead.
@@ -216,19 +351,16 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         if 'flags' in kwargs and __backend__.__name__ == 'PySide2':
             kwargs['f'] = kwargs.pop('flags')
 
-        try:
+        if not self._headless:
             super().__init__(*args, **kwargs)
-        except (TypeError, AttributeError):
-            print(f'args: {args}, kwargs: {kwargs}')
-            raise
         self.title = title
         self.help = help
 
-        self.make_title = first_valid(make_title=make_title, MAKE_TITLE=self.MAKE_TITLE, _self=self)
-        self.make_indicator = first_valid(make_indicator=make_indicator, MAKE_INDICATOR=self.MAKE_INDICATOR, _self=self)
-        self.make_plaintext = first_valid(make_plaintext=make_plaintext, MAKE_PLAINTEXT=self.MAKE_PLAINTEXT, _self=self)
+        self.make_title = self.resolve_param('make_title', make_title)
+        self.make_indicator = self.resolve_param('make_indicator', make_indicator)
+        self.make_plaintext = self.resolve_param('make_plaintext', make_plaintext)
 
-        self.indicator_label: Optional[QLabel] = None
+        self.indicator_label: Optional[IndicatorLabel] = None
         self.auto_button: Optional[QPushButton] = None
         self.plaintext_button: Optional[QPushButton] = None
         self.title_label: Optional[QLabel] = None
@@ -236,13 +368,33 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         self._plaintext_widget: Optional[PlaintextEditWidget[T]] = None
 
         self.validation_func = validation_func
-        self.auto_func = optional_valid(auto_func=auto_func, AUTO_FUNC=self.AUTO_FUNC, _self=self)
+        # set while validate runs in the GUI thread ahead of a background validation_func
+        self._defer_validation_func = False
+        # headless Fidgets have no event loop to deliver the results to
+        self.async_validation = self.resolve_param('async_validation', async_validation) and not self._headless
+        self.auto_func = self.resolve_optional_param('auto_func', auto_func)
+
+        validation_cache_size = self.resolve_param('validation_cache_size', validation_cache_size)
+        self.validation_cache: Optional[ValidationCache] = \
+            ValidationCache(validation_cache_size) if validation_cache_size else None
 
         self._suppress_update = False
+        # the headless counterpart of on_change's connections
+        self._headless_change_listeners: List[Callable[[], None]] = []
+        self._change_scheduler: Optional[ChangeScheduler] = None
+        if self.resolve_param('coalesce_changes', coalesce_changes):
+            ChangeScheduler(self).attach()
 
         self._value: FidgetValue[T] = None
+        self._headless_state = self.NO_HEADLESS_STATE
         self._joined_plaintext_printer = None
         self._joined_plaintext_parser = None
+        # the compiled adapter chains, or None if they need to be compiled
+        self._sorted_plaintext_printers: Optional[SortedAdapters[PlaintextPrinter[T]]] = None
+        self._sorted_plaintext_parsers: Optional[SortedAdapters[PlaintextParser[T]]] = None
+        # the Fidgets (other than ancestors) whose adapters are derived from this Fidget's adapters, created when the
+        # first one is added, since most Fidgets have none
+        self._plaintext_adapter_dependents: Optional[WeakSet[Fidget]] = None
 
         self._plaintext_printer_delegates: List[Callable[[], Iterable[PlaintextPrinter[T]]]] = []
         self._plaintext_parser_delegates: List[Callable[[], Iterable[PlaintextParser[T]]]] = []
@@ -255,6 +407,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         else:
             self.make_auto = False
 
+    @_headless_aware
     def init_ui(self) -> Optional[QBoxLayout]:
         """
         initialise the internal widgets of the Fidget
@@ -263,7 +416,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         self.setWindowTitle(self.title)
 
         if self.make_indicator:
-            self.indicator_label = QLabel('')
+            self.indicator_label = IndicatorLabel('')
             self.indicator_label.setTextInteractionFlags(Qt.LinksAccessibleByMouse)
             self.indicator_label.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
             self.indicator_label.linkActivated.connect(self._detail_button_clicked)
@@ -277,8 +430,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
             self.plaintext_button = QPushButton('text')
             self.plaintext_button.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
             self.plaintext_button.clicked.connect(self._plaintext_btn_click)
-
-            self._plaintext_widget = PlaintextEditWidget(parent=self)
+            # the plaintext dialog itself is only created when it is first opened
 
         if self.make_title:
             self.title_label = QLabel(self.title)
@@ -300,13 +452,44 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         """
         pass
 
+    def init_headless(self):
+        """
+        initialise the structure of a headless Fidget, called instead of init_ui
+        :inheritors: always call super().init_headless
+        """
+        pass
+
+    def fill_headless(self, v: T):
+        """
+        fill a headless Fidget with a value
+        :inheritors: override to normalize the value the same way filling and parsing the widgets would.
+        """
+        self._headless_state = v
+
+    def parse_headless(self) -> T:
+        """
+        parse the value of a headless Fidget
+        """
+        if self._headless_state is self.NO_HEADLESS_STATE:
+            return self.parse_headless_default()
+        return self._headless_state
+
+    def parse_headless_default(self) -> T:
+        """
+        parse the value of a headless Fidget that was never filled, this should be the value the widgets would show
+        when first created.
+        :inheritors: override if the widgets have a value before being filled, Fidgets that parse only their inners
+            can return self.parse()
+        """
+        raise ParseError('no value was filled', offender=self)
+
     def validate(self, value: T) -> None:
         """
         Raise a ValidationError if the value is invalid
         :param value: the parsed value
         :inheritors: always call super().validate
         """
-        if self.validation_func:
+        if self.validation_func and not self._defer_validation_func:
             self.validation_func(value)
 
     @classmethod
@@ -344,6 +527,9 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     def indication_changed(self, value: Union[GoodValue[T], BadValue]):
         pass
 
+    _sorted_cls_plaintext_printers: SortedAdapters[PlaintextPrinter[T]] = ()
+    _sorted_cls_plaintext_parsers: SortedAdapters[PlaintextParser[T]] = ()
+
     # endregion
 
     # region call_me
@@ -365,7 +551,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         :return: A joining of the widget's plaintext parsers
         """
         if not self._joined_plaintext_parser:
-            self._joined_plaintext_parser = join_parsers(self.plaintext_parsers)
+            self._joined_plaintext_parser = join_sorted_parsers(self.sorted_plaintext_parsers)
         return self._joined_plaintext_parser
 
     @property
@@ -374,35 +560,105 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         :return: A joining of the widget's plaintext printers
         """
         if not self._joined_plaintext_printer:
-            self._joined_plaintext_printer = join_printers(self.plaintext_printers)
+            self._joined_plaintext_printer = join_sorted_printers(self.sorted_plaintext_printers)
+        if FidgetProfiler.active:
+            return partial(self._profiled, 'print', self._joined_plaintext_printer)
         return self._joined_plaintext_printer
 
+    def sorted_plaintext_parsers(self) -> SortedAdapters[PlaintextParser[T]]:
+        """
+        :return: the widget's plaintext parsers, de-duplicated and sorted by priority, each paired with its priority.
+            The result is compiled once, and only recompiled after the adapters change.
+        """
+        ret = self._sorted_plaintext_parsers
+        if ret is None:
+            ret = self._sorted_plaintext_parsers = tuple(sort_adapters(self.plaintext_parsers()))
+        return ret
+
+    def sorted_plaintext_printers(self) -> SortedAdapters[PlaintextPrinter[T]]:
+        """
+        :return: the widget's plaintext printers, de-duplicated and sorted by priority, each paired with its priority.
+            The result is compiled once, and only recompiled after the adapters change.
+        """
+        ret = self._sorted_plaintext_printers
+        if ret is None:
+            ret = self._sorted_plaintext_printers = tuple(sort_adapters(self.plaintext_printers()))
+        return ret
+
+    @classmethod
+    def sorted_cls_plaintext_parsers(cls) -> SortedAdapters[PlaintextParser[T]]:
+        """
+        :return: the class's plaintext parsers, de-duplicated and sorted by priority, each paired with its priority.
+        """
+        return cls._sorted_cls_plaintext_parsers
+
+    @classmethod
+    def sorted_cls_plaintext_printers(cls) -> SortedAdapters[PlaintextPrinter[T]]:
+        """
+        :return: the class's plaintext printers, de-duplicated and sorted by priority, each paired with its priority.
+        """
+        return cls._sorted_cls_plaintext_printers
+
     def implicit_plaintext_parsers(self):
-        for parser, priority in sort_adapters(self.plaintext_parsers()):
+        for parser, priority in self.sorted_plaintext_parsers():
             if priority < 0:
                 return
             yield parser
 
     def implicit_plaintext_printers(self):
-        for printer, priority in sort_adapters(self.plaintext_printers()):
+        for printer, priority in self.sorted_plaintext_printers():
             if priority < 0:
                 return
             yield printer
 
     @classmethod
     def implicit_cls_plaintext_parsers(cls):
-        for parser, priority in sort_adapters(cls.cls_plaintext_parsers()):
+        for parser, priority in cls.sorted_cls_plaintext_parsers():
             if priority < 0:
                 return
             yield parser
 
     @classmethod
     def implicit_cls_plaintext_printers(cls):
-        for printer, priority in sort_adapters(cls.cls_plaintext_printers()):
+        for printer, priority in cls.sorted_cls_plaintext_printers():
             if priority < 0:
                 return
             yield printer
 
+    def invalidate_plaintext_adapters(self):
+        """
+        force the compiled plaintext adapter chains of the Fidget to be recompiled, along with those of its ancestors
+        and of all the Fidgets that depend on its adapters (see add_plaintext_adapters_dependent).
+        Call this whenever the adapters of a Fidget change other than by adding delegates (for example, when a
+        stacked Fidget changes its current page).
+        """
+        visited = set()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            node._sorted_plaintext_parsers = node._sorted_plaintext_printers = None
+            if node._plaintext_adapter_dependents:
+                stack.extend(node._plaintext_adapter_dependents)
+
+            # the ancestors might derive their adapters from ours, note that ancestors might be non-Fidget widgets
+            parent = node.parent() if not node._headless else None
+            while parent is not None and not isinstance(parent, Fidget):
+                parent = parent.parent()
+            if parent is not None:
+                stack.append(parent)
+
+    def add_plaintext_adapters_dependent(self, dependent: Fidget):
+        """
+        mark a Fidget as deriving its plaintext adapters from this Fidget's, so that its compiled adapter chains are
+        recompiled whenever this Fidget's are invalidated. Ancestors and delegating Fidgets are marked automatically.
+        """
+        if self._plaintext_adapter_dependents is None:
+            self._plaintext_adapter_dependents = WeakSet()
+        self._plaintext_adapter_dependents.add(dependent)
+
     def provided_pre(self, exclude=()):
         """
         Get an iterator of the widget's provided widgets that are to appear before the main UI.
@@ -446,14 +702,32 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     # endregion
 
     # region call_me_from_outside
+    @property
+    def is_headless(self) -> bool:
+        """
+        whether the Fidget is headless (see Fidget.headless)
+        """
+        return self._headless
+
     def maybe_parse(self):
         if self._value is None or not self._value.is_ok():
-            return self.parse()
+            return self._parse()
         return self._value.value
 
     def maybe_validate(self, v):
-        if self._value is None:
-            self.validate(v)
+        if self._headless:
+            # a headless inner's cached value is not necessarily the one being validated, since its parent might
+            # hold a value that was never filled into it, or share it between several values (like a matrix's cells)
+            self._cached_validate(v)
+            return
+        cached = self._value
+        if cached is None:
+            self._cached_validate(v)
+        elif cached.is_pending():
+            raise PendingValidation(offender=self)
+        elif not cached.is_ok() and isinstance(cached.exception, ValidationError):
+            # the cached value was already found invalid
+            raise ValidationError(offender=self) from cached.exception
 
     def fill_from_text(self, s: str):
         """
@@ -468,6 +742,9 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         """
         :return: the current value of the widget
         """
+        if ChangeScheduler.pending:
+            # deliver all deferred changes, so that we don't read a stale value
+            ChangeScheduler.flush_pending()
         if self._value is None:
             self._reload_value()
         return self._value
@@ -477,8 +754,7 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         a slot to refresh the value of the widget
         """
         self._invalidate_value()
-        self._update_indicator()
-        self.on_change.emit()
+        self._notify_change()
 
     _template_class: Type[FidgetTemplate[T]] = FidgetTemplate
 
@@ -512,20 +788,86 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
     def __str__(self):
         try:
             return super().__str__() + ': ' + self.title
-        except AttributeError:
+        except (AttributeError, RuntimeError):
+            # RuntimeError is raised by the bindings for missing attributes of headless Fidgets
             return super().__str__()
 
+    @contextmanager
+    def batch(self):
+        """
+        A context manager, that buffers all the change notifications in the Fidget's tree until the outermost batch
+        exits, and then delivers them at once, each changed Fidget updating and emitting once.
+        :note: inside a batch, ancestors of changed Fidgets might still hold stale values.
+        """
+        scheduler, _ = self._find_change_scheduler()
+        temporary = scheduler is None
+        if temporary:
+            scheduler = ChangeScheduler(self)
+            scheduler.attach()
+        scheduler.batch_depth += 1
+        try:
+            yield scheduler
+        finally:
+            scheduler.batch_depth -= 1
+            if not scheduler.batch_depth:
+                scheduler.flush()
+                if temporary:
+                    scheduler.detach()
+
+    def profile(self) -> FidgetProfiler:
+        """
+        A context manager, that times the parse, validate, print, fill and init_ui calls of all the Fidgets in the
+        Fidget's tree while it is open. Timings are accumulated across uses, see perf_report.
+        :note: Fidgets are usually constructed before they are added to a tree, so init_ui is only timed by global
+            profilers (see FidgetProfiler).
+        """
+        profiler = self._profiler if self._profiler is not None else FidgetProfiler(self)
+        return profiler
+
+    def perf_report(self, limit: Optional[int] = None) -> str:
+        """
+        :param limit: the maximum number of rows to include, or None to include all
+        :return: a table of the timings collected while profiling the Fidget's tree, slowest first
+        """
+        if self._profiler is None:
+            raise ValueError(f'{self} was never profiled')
+        return self._profiler.report(limit)
+
     def fill_value(self, *args, **kwargs):
-        with self.suppress_update():
+        if self._headless:
+            if FidgetProfiler.active:
+                self._profiled('fill', self.fill_headless, *args, **kwargs)
+            else:
+                self.fill_headless(*args, **kwargs)
+            self.change_value()
+            return None
+        scheduler = self._find_change_scheduler()[0] if ChangeScheduler.active else None
+        # an enclosing scheduler delivers the fill's changes with everything else it coalesces, otherwise they are
+        # buffered for the duration of the fill and delivered when it is done
+        with (nullcontext() if scheduler else self.batch()), self.suppress_update():
+            if FidgetProfiler.active:
+                return self._profiled('fill', self.fill, *args, **kwargs)
             return self.fill(*args, **kwargs)
 
+    def add_headless_change_listener(self, listener: Callable[[], None]):
+        """
+        call a listener whenever the value of a headless Fidget changes, headless Fidgets don't emit on_change
+        """
+        self._headless_change_listeners.append(listener)
+
     def add_plaintext_printers_delegate(self, delegate: Callable[[], Iterable[PlaintextPrinter[T]]]):
         self._plaintext_printer_delegates.append(delegate)
-        self._joined_plaintext_printer = None
+        self._delegate_added(delegate)
 
     def add_plaintext_parsers_delegate(self, delegate: Callable[[], Iterable[PlaintextParser[T]]]):
         self._plaintext_parser_delegates.append(delegate)
-        self._joined_plaintext_parser = None
+        self._delegate_added(delegate)
+
+    def _delegate_added(self, delegate: Callable[[], Iterable]):
+        owner = getattr(delegate, '__self__', None)
+        if isinstance(owner, Fidget):
+            owner.add_plaintext_adapters_dependent(self)
+        self.invalidate_plaintext_adapters()
 
     def add_plaintext_delegates(self, clone: Union[Fidget, Type[Fidget]]):
         if isinstance(clone, Fidget):
@@ -543,8 +885,77 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         """
         Mark the cached value is invalid, forcing it to be re-processed when needed next
         """
+        if self._value is not None and self._value.is_pending() and self._value.future:
+            self._value.future.cancel()
         self._value = None
 
+    def _notify_change(self):
+        """
+        update the indicator and emit on_change, or defer both to the change scheduler of the Fidget's tree, if any
+        """
+        if self._headless:
+            # headless Fidgets have no indicators
+            for listener in self._headless_change_listeners:
+                listener()
+            return
+        if ChangeScheduler.active:
+            scheduler, depth = self._find_change_scheduler()
+            if scheduler:
+                scheduler.mark(self, depth)
+                return
+        self._flush_change()
+
+    def _find_change_scheduler(self) -> Tuple[Optional[ChangeScheduler], int]:
+        """
+        :return: the change scheduler of the nearest ancestor (or self) that has one, and the depth of self from that
+            ancestor. Or None if no ancestor has a scheduler.
+        """
+        depth = 0
+        node = self
+        while node is not None:
+            scheduler = getattr(node, '_change_scheduler', None)
+            if scheduler:
+                return scheduler, depth
+            # headless Fidgets have no parent widget, note that ancestors might be non-Fidget widgets
+            node = node.parent() if not getattr(node, '_headless', False) else None
+            depth += 1
+        return None, depth
+
+    def _profiled(self, op: str, func: Callable, *args, **kwargs):
+        """
+        call a function, recording its duration as an operation of the Fidget in all the profilers that profile it
+        """
+        profilers = list(FidgetProfiler.global_profilers)
+        path = [self.title]
+        node = self.parent() if not self._headless else None
+        while node is not None:
+            profiler = getattr(node, '_profiler', None)
+            if profiler is not None and profiler.attached:
+                profilers.append(profiler)
+            if isinstance(node, Fidget):
+                path.append(node.title)
+            node = node.parent() if not getattr(node, '_headless', False) else None
+        if self._profiler is not None and self._profiler.attached:
+            profilers.append(self._profiler)
+        if not profilers:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = perf_counter() - start
+            path = '/'.join(reversed(path))
+            for profiler in profilers:
+                profiler.record(path, op, duration)
+
+    def _flush_change(self):
+        """
+        update the indicator and emit on_change
+        """
+        self._update_indicator()
+        self.on_change.emit()
+
     def _auto_btn_click(self, click_args):
         """
         autofill the widget
@@ -560,8 +971,9 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
 
     def _plaintext_btn_click(self):
         """
-        open the plaintext dialog
+        open the plaintext dialog of the Fidget's window, targeted at the Fidget
         """
+        self._plaintext_widget = PlaintextEditWidget.shared(self)
         self._plaintext_widget.prep_for_show()
         self._plaintext_widget.show()
 
@@ -577,15 +989,17 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         if self.indicator_label and self.indicator_label.parent():
             if value.is_ok():
                 text = "<a href='...'>OK</a>"
+            elif value.is_pending():
+                text = "<a href='...'>...</a>"
             else:
                 text = "<a href='...'>ERR</a>"
-            tooltip = value.short_details
 
             self.indicator_label.setText(text)
-            self.indicator_label.setToolTip(tooltip)
+            # the tooltip is only computed when the label is hovered
+            self.indicator_label.indicated_value = value
 
         if self.plaintext_button:
-            self.plaintext_button.setEnabled(value.is_ok() or any(self.plaintext_parsers()))
+            self.plaintext_button.setEnabled(value.is_ok() or bool(self.sorted_plaintext_parsers()))
 
         self.indication_changed(value)
 
@@ -595,17 +1009,102 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
         """
         assert self._value is None, '_reload called when a value is cached'
         try:
-            value = self.parse()
-            self.validate(value)
-        except (ValidationError, ParseError) as e:
+            value = self._parse()
+            if self.async_validation:
+                cached = ValidationCache.MISSING
+                if self.validation_cache is not None:
+                    cached = self.validation_cache.get(value)
+                if cached is ValidationCache.MISSING:
+                    self._validate_for_background(value)
+                    if self.validation_func:
+                        self._value = validation_executor.submit(self, self.validation_func, value)
+                        return
+                    if self.validation_cache is not None:
+                        self.validation_cache.store(value, None)
+                elif cached is not None:
+                    raise cached
+            else:
+                self._cached_validate(value)
+        except (ValidationError, ParseError, PendingValidation) as e:
             self._value = BadValue.from_error(e)
             return
 
+        self._value = GoodValue(value, partial(self._value_details, value))
+
+    def _parse(self):
+        """
+        parse the Fidget's value, from its widgets or, if headless, from its filled value
+        """
+        parse = self.parse_headless if self._headless else self.parse
+        if FidgetProfiler.active:
+            return self._profiled('parse', parse)
+        return parse()
+
+    def _validation_done(self, pending: Pending, future):
+        """
+        called (in the GUI thread) when a background validation is done
+        """
+        if self._value is not pending or future.cancelled():
+            # the value has since been superseded
+            return
+
+        exc = future.exception()
+        value = pending.parsed_value
+        if exc is None:
+            if self.validation_cache is not None:
+                self.validation_cache.store(value, None)
+            self._value = GoodValue(value, partial(self._value_details, value))
+        elif isinstance(exc, (ValidationError, ParseError)):
+            if self.validation_cache is not None:
+                self.validation_cache.store(value, exc)
+            self._value = BadValue.from_error(exc)
+        else:
+            # this runs in a queued slot, where raising would abort the application and leave the value pending, so
+            # unexpected errors are reported as invalid values instead (and are not cached)
+            error = ValidationError('validation_func raised an unexpected error', offender=self)
+            error.__cause__ = exc
+            self._value = BadValue.from_error(error)
+        self._notify_change()
+
+    def _validate_for_background(self, value: T):
+        """
+        run all of validate but validation_func in the GUI thread, since it may read the widgets and the caches of the
+        Fidget and its inners
+        """
+        validate = self.validate
+        if FidgetProfiler.active:
+            validate = partial(self._profiled, 'validate', validate)
+        self._defer_validation_func = True
+        try:
+            validate(value)
+        except (ValidationError, ParseError) as e:
+            if self.validation_cache is not None:
+                self.validation_cache.store(value, e)
+            raise
+        finally:
+            self._defer_validation_func = False
+
+    def _cached_validate(self, value: T):
+        """
+        validate a value, using the validation cache if there is one
+        """
+        validate = self.validate
+        if FidgetProfiler.active:
+            validate = partial(self._profiled, 'validate', validate)
+        if self.validation_cache is not None:
+            # pending inners are not a property of the value, so PendingValidation is never cached
+            self.validation_cache.validate(value, validate, (ValidationError, ParseError))
+        else:
+            validate(value)
+
+    def _value_details(self, value: T) -> str:
+        """
+        get the details of a parsed value, called only when the details are requested
+        """
         try:
-            details = self.joined_plaintext_printer(value)
+            return self.joined_plaintext_printer(value)
         except PlaintextPrintError as e:
-            details = 'details could not be loaded because of a parser error:\n' + error_details(e)
-        self._value = GoodValue(value, details)
+            return 'details could not be loaded because of a parser error:\n' + error_details(e)
 
     def _detail_button_clicked(self, event):
         """
@@ -693,6 +1192,76 @@ class Fidget(QWidget, Generic[T], TemplateLike[T]):
 
             cls._inner_cls_plaintext_parsers = classmethod(inner_cls_parsers_func)
 
+        init_ui = cls.__dict__.get('init_ui')
+        if init_ui:
+            cls.init_ui = _headless_aware(init_ui)
+
+        cls._compile_cls_plaintext_adapters()
+        # subclass hooks and class decorators might still set class variables after this point (see inner_fidget),
+        # so the defaults table is only resolved when the class is first instantiated
+        cls._resolved_defaults = None
+
+    @classmethod
+    def _defaults_table(cls) -> Dict[str, Any]:
+        """
+        :return: a mapping of every lowercase parameter name to its UPPERCASE class variable, for all the variables
+            that are not None
+        :note: the table is resolved once per class, changes to the class variables after the class is first
+            instantiated are not reflected.
+        """
+        ret = cls.__dict__.get('_resolved_defaults')
+        if ret is None:
+            ret = {}
+            for name in dir(cls):
+                if not name.isupper():
+                    continue
+                v = getattr(cls, name, None)
+                if v is not None:
+                    ret[name.lower()] = v
+            cls._resolved_defaults = ret
+        return ret
+
+    def resolve_param(self, name: str, value):
+        """
+        resolve a parameter from its argument, or from the UPPERCASE class variable of the same name.
+        Equivalent to first_valid(name=value, NAME=self.NAME, _self=self), but uses the class's defaults table.
+        :param name: the name of the parameter
+        :param value: the argument, None if not provided
+        """
+        if value is not None:
+            return value
+        ret = self._defaults_table().get(name)
+        if ret is None:
+            # raise the same error as first_valid
+            return first_valid(_self=self, **{name: value, name.upper(): None})
+        return ret
+
+    def resolve_optional_param(self, name: str, value):
+        """
+        resolve an optional parameter from its argument, or from the UPPERCASE class variable of the same name.
+        Equivalent to optional_valid(name=value, NAME=self.NAME, _self=self), but uses the class's defaults table.
+        :param name: the name of the parameter
+        :param value: the argument, None if not provided
+        """
+        default = self._defaults_table().get(name)
+        if value is None:
+            return default
+        if default is not None:
+            # raise the same error as optional_valid
+            return optional_valid(_self=self, **{name: value, name.upper(): default})
+        return value
+
+    @classmethod
+    def _compile_cls_plaintext_adapters(cls):
+        """
+        resolve the class's plaintext adapters once, so that they don't need to be re-sorted on each use
+        """
+        cls._sorted_cls_plaintext_printers = tuple(sort_adapters(cls.cls_plaintext_printers()))
+        cls._sorted_cls_plaintext_parsers = tuple(sort_adapters(cls.cls_plaintext_parsers()))
+
+
+Fidget._compile_cls_plaintext_adapters()
+
 
 class DoNotFill(Exception):
     """
@@ -725,6 +1294,8 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
     MAKE_TITLE = False
     FLAGS = Qt.Dialog
 
+    SHARED_OBJECT_NAME = 'fidget_shared_plaintext_edit'
+
     def __init__(self, *args, **kwargs):
         super().__init__('plaintext edit', *args, **kwargs)
 
@@ -747,6 +1318,33 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
 
         self.init_ui()
 
+        self._default_fonts = [edit.document().defaultFont() for edit in (self.parse_edit, self.print_edit)]
+
+    @classmethod
+    def shared(cls, owner: Fidget) -> PlaintextEditWidget:
+        """
+        get the plaintext dialog shared by all the Fidgets in the owner's window, creating it if needed, and target
+        it at the owner.
+        """
+        window = owner.window()
+        ret = window.findChild(cls, cls.SHARED_OBJECT_NAME, Qt.FindDirectChildrenOnly)
+        if ret is None:
+            ret = cls(parent=window)
+            ret.setObjectName(cls.SHARED_OBJECT_NAME)
+        ret.retarget(owner)
+        return ret
+
+    def retarget(self, owner: Fidget):
+        """
+        set the Fidget the dialog reads and writes, resetting the dialog's font if the owner changed
+        """
+        if owner is self.owner:
+            return
+        self.owner = owner
+        self.current_value = self.NO_CURRENT_VALUE
+        for edit, font in zip((self.parse_edit, self.print_edit), self._default_fonts):
+            edit.document().setDefaultFont(font)
+
     def init_ui(self) -> Optional[QBoxLayout]:
         super().init_ui()
         self.setWindowModality(Qt.WindowModal)
@@ -884,7 +1482,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         self.clone_button.setVisible(False)
 
         owner_value = self.owner.value()
-        printers = list(self.owner.plaintext_printers())
+        printers = self.owner.sorted_plaintext_printers()
         if not owner_value.is_ok() or not printers:
             self.print_widget.setVisible(False)
             printers = False
@@ -909,7 +1507,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
             else:
                 self.print_combo.setVisible(False)
 
-            for printer, priority in sort_adapters(printers):
+            for printer, priority in printers:
                 name = printer.__name__
                 if priority < 0:
                     name += '*'
@@ -918,7 +1516,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
             self.print_combo.setCurrentIndex(combo_index)
             self.print_combo.activated[int].emit(combo_index)
 
-        parsers = list(self.owner.plaintext_parsers())
+        parsers = self.owner.sorted_plaintext_parsers()
         if not parsers:
             self.parse_widget.setVisible(False)
         else:
@@ -945,7 +1543,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
             else:
                 self.parse_combo.setVisible(False)
 
-            for parser, priority in sort_adapters(parsers):
+            for parser, priority in parsers:
                 name = parser.__name__
                 if priority < 0:
                     name += '*'
@@ -961,7 +1559,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         if not value.is_ok():
             QMessageBox.critical(self, 'error parsing plaintext', value.details)
         else:
-            self.owner.fill(value.value)
+            self.owner.fill_value(value.value)
             self.close()
 
     def apply_parse(self):
@@ -969,7 +1567,7 @@ class PlaintextEditWidget(Generic[T], Fidget[T]):
         if not value.is_ok():
             QMessageBox.critical(self, 'error parsing plaintext', value.details)
         else:
-            self.owner.fill(value.value)
+            self.owner.fill_value(value.value)
             self.prep_for_show(clear_parse=False, clear_print=False)
             self.parse_edit.setFocus()
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, Union, Callable
 
 from fidget.backend.QtWidgets import QWidget
 from fidget.core.__util__ import error_details, shorten
@@ -33,24 +33,59 @@ class ValidationError(ChildWidgetError, Generic[T]):
     pass
 
 
+class PendingValidation(ChildWidgetError):
+    """
+    an exception class for when a value (or a value it depends on) is still being validated in the background
+    """
+    pass
+
+
+LazyStr = Union[str, Callable[[], str]]
+
+
 class FidgetValue(ABC):
     """
     A value of a Fidget, representing either a valid processed value or an error
     """
     SHORT_WIDTH = 50
 
-    def __init__(self, type_details: str, details: str, short_details: str = ...):
+    def __init__(self, type_details: LazyStr, details: LazyStr, short_details: LazyStr = ...):
         """
         :param type_details: a description of the type of the value's state, either an error name or a type name
         :param details: a detailed description of the value
         :param short_details: a short description of the value
+        :note: all the descriptions can also be zero-argument callables, in which case they are only called (once)
+            when first accessed.
         """
-        self.details = details
-        if short_details is ...:
-            short_details = self.details
-        short_details = shorten(short_details, self.SHORT_WIDTH)
-        self.short_details = short_details
-        self.type_details = type_details
+        self._details = details
+        self._short_details = short_details
+        self._type_details = type_details
+        self._shortened = False
+
+    @property
+    def details(self) -> str:
+        if callable(self._details):
+            self._details = self._details()
+        return self._details
+
+    @property
+    def short_details(self) -> str:
+        if not self._shortened:
+            if self._short_details is ...:
+                short_details = self.details
+            elif callable(self._short_details):
+                short_details = self._short_details()
+            else:
+                short_details = self._short_details
+            self._short_details = shorten(short_details, self.SHORT_WIDTH)
+            self._shortened = True
+        return self._short_details
+
+    @property
+    def type_details(self) -> str:
+        if callable(self._type_details):
+            self._type_details = self._type_details()
+        return self._type_details
 
     @abstractmethod
     def is_ok(self) -> bool:
@@ -59,6 +94,12 @@ class FidgetValue(ABC):
         """
         pass
 
+    def is_pending(self) -> bool:
+        """
+        :return: whether the value is still being validated
+        """
+        return False
+
     def __str__(self):
         return f'{type(self).__name__}: {self.details}'
 
@@ -68,8 +109,8 @@ class GoodValue(Generic[T], FidgetValue):
     A processed value
     """
 
-    def __init__(self, value, details):
-        super().__init__(type(value).__name__, details, str(value))
+    def __init__(self, value, details: LazyStr):
+        super().__init__(lambda: type(value).__name__, details, lambda: str(value))
         self.value = value
 
     def is_ok(self):
@@ -88,9 +129,8 @@ class BadValue(Generic[ET], FidgetValue):
     """
 
     def __init__(self, exc: ET):
-        details = error_details(exc)
-        short = details.splitlines(keepends=False)[0]
-        super().__init__(type(exc).__name__, details, short)
+        super().__init__(type(exc).__name__, lambda: error_details(exc),
+                         lambda: self.details.splitlines(keepends=False)[0])
         self.exception = exc
 
     def is_ok(self):
@@ -102,6 +142,8 @@ class BadValue(Generic[ET], FidgetValue):
             return Unparseable(exc)
         if isinstance(exc, ValidationError):
             return Invalid(exc)
+        if isinstance(exc, PendingValidation):
+            return Pending(exc)
         raise TypeError(f'bad exception type {type(exc)}')
 
 
@@ -111,3 +153,21 @@ class Unparseable(BadValue[ParseError]):
 
 class Invalid(BadValue[ValidationError]):
     pass
+
+
+class Pending(BadValue[PendingValidation]):
+    """
+    A value that is still being validated
+    """
+
+    def __init__(self, exc: PendingValidation, parsed_value=None):
+        """
+        :param exc: the pending exception
+        :param parsed_value: the value being validated, if any
+        """
+        super().__init__(exc)
+        self.parsed_value = parsed_value
+        self.future = None
+
+    def is_pending(self):
+        return True
@@ -113,18 +113,21 @@ def join_parsers(parsers: Callable[[], Iterable[PlaintextParser]]):
     joins parsers together, returning the first value that is processed without errors. skips explicit parsers.
     :param parsers: a callable to generate parsers.
     """
+    return join_sorted_parsers(lambda: sort_adapters(parsers()))
+
+
+def join_sorted_parsers(sorted_parsers: Callable[[], Iterable[Tuple[PlaintextParser, 'AdapterPriority']]]):
+    """
+    like join_parsers, but for parsers that are already sorted and de-duplicated (by sort_adapters).
+    :param sorted_parsers: a callable to generate parser-priority pairs.
+    """
 
     def ret(s):
-        seen = set()
         first_error = None
-        for p, prio in sort_adapters(parsers()):
-            if p in seen:
-                continue
+        for p, prio in sorted_parsers():
             if prio < 0:
                 break
 
-            seen.add(p)
-
             try:
                 return p(s)
             except PlaintextParseError as e:
@@ -140,16 +143,20 @@ def join_printers(printers: Callable[[], Iterable[PlaintextPrinter]]):
     joins printers together, returning the first value that is processed without errors. skips explicit printers.
     :param printers: a callable to generate parsers.
     """
+    return join_sorted_printers(lambda: sort_adapters(printers()))
+
+
+def join_sorted_printers(sorted_printers: Callable[[], Iterable[Tuple[PlaintextPrinter, 'AdapterPriority']]]):
+    """
+    like join_printers, but for printers that are already sorted and de-duplicated (by sort_adapters).
+    :param sorted_printers: a callable to generate printer-priority pairs.
+    """
 
     def ret(s):
-        seen = set()
         first_error = None
-        for p, prio in sort_adapters(printers()):
-            if p in seen:
-                continue
+        for p, prio in sorted_printers():
             if prio < 0:
                 break
-            seen.add(p)
 
             try:
                 ret = p(s)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Tuple, NamedTuple, Optional
+
+from collections import defaultdict
+from math import ceil
+
+if TYPE_CHECKING:
+    from fidget.core.fidget import Fidget
+
+
+class OpStats(NamedTuple):
+    """
+    aggregated timings of an operation of a Fidget, all times are in seconds
+    """
+    count: int
+    total: float
+    p50: float
+    p99: float
+
+
+def _percentile(sorted_samples: List[float], p: float) -> float:
+    # nearest-rank percentile
+    return sorted_samples[max(ceil(p / 100 * len(sorted_samples)) - 1, 0)]
+
+
+class FidgetProfiler:
+    """
+    Collects the durations of the parse, validate, print, fill and init_ui calls of Fidgets. Either of a single
+    Fidget tree (see Fidget.profile), or of all Fidgets if no owner is given. Durations are inclusive, so a Fidget's
+    parse time includes the time spent parsing its inner Fidgets.
+    Usage:
+    >>> with FidgetProfiler() as profiler:
+    ...     ...
+    >>> print(profiler.report())
+    """
+    active: ClassVar[int] = 0
+    """the number of attached profilers, when 0, Fidgets don't bother timing their operations"""
+    global_profilers: ClassVar[List[FidgetProfiler]] = []
+    """all the attached profilers that have no owner"""
+
+    def __init__(self, owner: Optional[Fidget] = None):
+        """
+        :param owner: the root Fidget of the tree to profile, or None to profile all Fidgets
+        """
+        self.owner = owner
+        # (path, operation) -> durations
+        self.samples: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        self.attached = False
+
+    def attach(self):
+        assert not self.attached, 'profiler is already attached'
+        if self.owner is None:
+            self.global_profilers.append(self)
+        else:
+            current = self.owner._profiler
+            assert current is None or not current.attached, 'owner already has an attached profiler'
+            # the profiler stays on the owner after it is detached, so that it can still be reported
+            self.owner._profiler = self
+        self.attached = True
+        type(self).active += 1
+
+    def detach(self):
+        assert self.attached, 'profiler is not attached'
+        if self.owner is None:
+            self.global_profilers.remove(self)
+        self.attached = False
+        type(self).active -= 1
+
+    def __enter__(self):
+        self.attach()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.detach()
+
+    def record(self, path: str, op: str, duration: float):
+        self.samples[path, op].append(duration)
+
+    def clear(self):
+        self.samples.clear()
+
+    def stats(self) -> Dict[Tuple[str, str], OpStats]:
+        """
+        :return: the aggregated timings of every (path, operation) pair, ordered by descending total time
+        """
+        ret = {}
+        for key, samples in self.samples.items():
+            s = sorted(samples)
+            ret[key] = OpStats(len(s), sum(s), _percentile(s, 50), _percentile(s, 99))
+        return dict(sorted(ret.items(), key=lambda kv: kv[1].total, reverse=True))
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        :param limit: the maximum number of rows to include, or None to include all
+        :return: a table of the aggregated timings, slowest first, times in milliseconds
+        """
+        rows = [('path', 'op', 'count', 'total', 'p50', 'p99')]
+        for (path, op), s in list(self.stats().items())[:limit]:
+            rows.append((path, op, str(s.count), f'{s.total * 1e3:.3f}', f'{s.p50 * 1e3:.3f}', f'{s.p99 * 1e3:.3f}'))
+        widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+        return '\n'.join(
+            '  '.join(c.ljust(w) if i < 2 else c.rjust(w) for i, (c, w) in enumerate(zip(row, widths)))
+            for row in rows
+        )
+
+    def __repr__(self):
+        owner = 'all' if self.owner is None else self.owner
+        return f'{type(self).__name__}({owner}, {len(self.samples)} entries)'
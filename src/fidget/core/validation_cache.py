@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple, Hashable, Callable
+
+from collections import OrderedDict
+
+
+class ValidationCache:
+    """
+    A bounded LRU cache of validation results, keyed by the validated value.
+    Hashable values are keyed by their type and value, unhashable values are keyed by their identity (and kept alive
+    by the cache, so that their identity isn't reused).
+    """
+    MISSING = object()
+    """returned by get for values that aren't cached"""
+
+    def __init__(self, max_size: int):
+        """
+        :param max_size: the maximum number of results to store
+        """
+        if max_size <= 0:
+            raise ValueError('max_size must be positive')
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # key -> (value, exception or None)
+        self._results: OrderedDict[Hashable, Tuple[Any, Optional[Exception]]] = OrderedDict()
+
+    @staticmethod
+    def _key(value) -> Hashable:
+        try:
+            # the type is part of the key so that equal values of different types (like 1 and True) aren't mixed up
+            ret = (type(value), value)
+            hash(ret)
+        except TypeError:
+            # value is unhashable
+            ret = ('id', id(value))
+        return ret
+
+    def get(self, value):
+        """
+        :param value: a value to look up
+        :return: the exception the value's validation raised, None if it was valid, or MISSING if it isn't cached
+        """
+        key = self._key(value)
+        entry = self._results.get(key)
+        if entry is None or (key[0] == 'id' and entry[0] is not value):
+            self.misses += 1
+            return self.MISSING
+        self._results.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def store(self, value, exc: Optional[Exception]):
+        """
+        store the result of a validation
+        :param value: the validated value
+        :param exc: the exception raised by the validation, or None if the value is valid
+        """
+        key = self._key(value)
+        self._results[key] = (value, exc)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def validate(self, value, validate_func: Callable[[Any], None], cached_errors: Tuple[type, ...]):
+        """
+        validate a value, using the cached result if there is one
+        :param value: the value to validate
+        :param validate_func: the validation function to call on a cache miss
+        :param cached_errors: the exception types whose results can be cached, all other exceptions are propagated
+            without being stored
+        """
+        exc = self.get(value)
+        if exc is self.MISSING:
+            try:
+                validate_func(value)
+            except cached_errors as e:
+                self.store(value, e)
+                raise
+            self.store(value, None)
+        elif exc is not None:
+            raise exc
+
+    def clear(self):
+        self._results.clear()
+
+    def __len__(self):
+        return len(self._results)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(size={len(self)}/{self.max_size}, hits={self.hits}, misses={self.misses})'
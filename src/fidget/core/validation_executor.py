@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Any, Callable, Set
+
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from fidget.backend.QtCore import QObject, QCoreApplication, pyqtSignal, Qt, __backend__
+
+from fidget.core.fidget_value import Pending, PendingValidation
+
+if TYPE_CHECKING:
+    from fidget.core.fidget import Fidget
+
+if __backend__.__name__ == 'PySide2':
+    from shiboken2 import isValid as _is_alive
+else:
+    from PyQt5.sip import isdeleted
+
+
+    def _is_alive(obj):
+        return not isdeleted(obj)
+
+
+class _ResultRelay(QObject):
+    """
+    A QObject living in the GUI thread, to deliver the results of background validations to it
+    """
+    done = pyqtSignal(object, object, object)
+
+    def __init__(self):
+        super().__init__()
+        # always queued, so that results are delivered only after the pending value is stored in the Fidget
+        self.done.connect(self._deliver, Qt.QueuedConnection)
+
+    def _deliver(self, fidget: Fidget, pending: Pending, future: Future):
+        if not _is_alive(fidget):
+            # the Fidget was deleted while its value was validated
+            return
+        fidget._validation_done(pending, future)
+
+
+class ValidationExecutor:
+    """
+    Runs Fidgets' validation functions in a thread pool, relaying the results back to the GUI thread
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        :param max_workers: the maximum number of worker threads
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._relay: Optional[_ResultRelay] = None
+        # the validations that were submitted and are not done yet
+        self._futures: Set[Future] = set()
+
+    def submit(self, fidget: Fidget, func: Callable[[Any], None], value: Any) -> Pending:
+        """
+        start validating a value in the background, must be called from the GUI thread.
+        :param fidget: the Fidget whose value is validated
+        :param func: the validation function, it must not access any widgets or any state of the Fidget
+        :param value: the parsed value to validate
+        :return: a pending value, the Fidget will be notified (in the GUI thread) with this value once the validation
+            is done
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix='fidget_validation')
+            if self._relay is None:
+                self._relay = _ResultRelay()
+                app = QCoreApplication.instance()
+                if app is not None:
+                    app.aboutToQuit.connect(self.shutdown)
+
+        ret = Pending(PendingValidation('validation in progress', offender=fidget), value)
+        relay = self._relay
+        ret.future = self._pool.submit(func, value)
+        self._futures.add(ret.future)
+
+        def done(f):
+            self._futures.discard(f)
+            relay.done.emit(fidget, ret, f)
+
+        ret.future.add_done_callback(done)
+        return ret
+
+    def shutdown(self):
+        """
+        cancel all the validations that have not started, and let the worker threads exit once the running
+        validations are done. Called when the QApplication is about to quit. Submitting a validation afterwards starts
+        a new thread pool.
+        """
+        if self._pool is None:
+            return
+        for future in list(self._futures):
+            future.cancel()
+        self._pool.shutdown(wait=False)
+        self._pool = None
+
+
+validation_executor = ValidationExecutor()
@@ -1,26 +1,82 @@
-from fidget.widgets.checkbox import FidgetCheckBox
-from fidget.widgets.combo import FidgetCombo
-from fidget.widgets.confirmer import FidgetConfirmer, FidgetQuestion, question
-from fidget.widgets.const_label import FidgetConst
-from fidget.widgets.converter import FidgetConverter, FidgetTransparentConverter
-from fidget.widgets.dict_ import FidgetDict
-from fidget.widgets.edit_combo import FidgetEditCombo
-from fidget.widgets.file_path import FidgetFilePath
-from fidget.widgets.dir_path import FidgetDirPath
-from fidget.widgets.multi_file import FidgetFilePaths
-from fidget.widgets.idiomatic_inner import inner_fidget
-from fidget.widgets.label import FidgetLabel
-from fidget.widgets.line import FidgetLine
-from fidget.widgets.matrix import FidgetMatrix
-from fidget.widgets.minimalist import FidgetMinimal
-from fidget.widgets.optional import FidgetOptional
-from fidget.widgets.text import FidgetPlainText
-from fidget.widgets.spin import FidgetSpin, FidgetDiscreteSpin
-from fidget.widgets.stacked import FidgetStacked
-from fidget.widgets.tabbed import FidgetTabs
-from fidget.widgets.table import FidgetTable
-from fidget.widgets.tuple_ import FidgetTuple
-from fidget.widgets.user_util import FidgetInt, FidgetFloat, FidgetComplex, SimpleLineEdit, template, SimplePlainEdit
+from typing import TYPE_CHECKING
+
+from importlib import import_module
+
+if TYPE_CHECKING:
+    from fidget.widgets.checkbox import FidgetCheckBox
+    from fidget.widgets.combo import FidgetCombo
+    from fidget.widgets.confirmer import FidgetConfirmer, FidgetQuestion, question
+    from fidget.widgets.const_label import FidgetConst
+    from fidget.widgets.converter import FidgetConverter, FidgetTransparentConverter
+    from fidget.widgets.dict_ import FidgetDict
+    from fidget.widgets.edit_combo import FidgetEditCombo
+    from fidget.widgets.file_path import FidgetFilePath
+    from fidget.widgets.dir_path import FidgetDirPath
+    from fidget.widgets.multi_file import FidgetFilePaths
+    from fidget.widgets.idiomatic_inner import inner_fidget
+    from fidget.widgets.label import FidgetLabel
+    from fidget.widgets.line import FidgetLine
+    from fidget.widgets.matrix import FidgetMatrix
+    from fidget.widgets.minimalist import FidgetMinimal
+    from fidget.widgets.optional import FidgetOptional
+    from fidget.widgets.text import FidgetPlainText
+    from fidget.widgets.spin import FidgetSpin, FidgetDiscreteSpin
+    from fidget.widgets.stacked import FidgetStacked
+    from fidget.widgets.tabbed import FidgetTabs
+    from fidget.widgets.table import FidgetTable
+    from fidget.widgets.tuple_ import FidgetTuple
+    from fidget.widgets.user_util import FidgetInt, FidgetFloat, FidgetComplex, SimpleLineEdit, template, SimplePlainEdit
+
+# the widget modules are only imported when one of their members is first accessed
+_member_modules = {
+    'FidgetCheckBox': 'fidget.widgets.checkbox',
+    'FidgetCombo': 'fidget.widgets.combo',
+    'FidgetConfirmer': 'fidget.widgets.confirmer',
+    'FidgetQuestion': 'fidget.widgets.confirmer',
+    'question': 'fidget.widgets.confirmer',
+    'FidgetConst': 'fidget.widgets.const_label',
+    'FidgetConverter': 'fidget.widgets.converter',
+    'FidgetTransparentConverter': 'fidget.widgets.converter',
+    'FidgetDict': 'fidget.widgets.dict_',
+    'FidgetEditCombo': 'fidget.widgets.edit_combo',
+    'FidgetFilePath': 'fidget.widgets.file_path',
+    'FidgetDirPath': 'fidget.widgets.dir_path',
+    'FidgetFilePaths': 'fidget.widgets.multi_file',
+    'inner_fidget': 'fidget.widgets.idiomatic_inner',
+    'FidgetLabel': 'fidget.widgets.label',
+    'FidgetLine': 'fidget.widgets.line',
+    'FidgetMatrix': 'fidget.widgets.matrix',
+    'FidgetMinimal': 'fidget.widgets.minimalist',
+    'FidgetOptional': 'fidget.widgets.optional',
+    'FidgetPlainText': 'fidget.widgets.text',
+    'FidgetSpin': 'fidget.widgets.spin',
+    'FidgetDiscreteSpin': 'fidget.widgets.spin',
+    'FidgetStacked': 'fidget.widgets.stacked',
+    'FidgetTabs': 'fidget.widgets.tabbed',
+    'FidgetTable': 'fidget.widgets.table',
+    'FidgetTuple': 'fidget.widgets.tuple_',
+    'FidgetInt': 'fidget.widgets.user_util',
+    'FidgetFloat': 'fidget.widgets.user_util',
+    'FidgetComplex': 'fidget.widgets.user_util',
+    'SimpleLineEdit': 'fidget.widgets.user_util',
+    'template': 'fidget.widgets.user_util',
+    'SimplePlainEdit': 'fidget.widgets.user_util',
+}
+
+__all__ = list(_member_modules)
+
+
+def __getattr__(name):
+    try:
+        module_name = _member_modules[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    ret = globals()[name] = getattr(import_module(module_name), name)
+    return ret
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
 
 # todo scrollable wrapper?
 # todo multi-file widget
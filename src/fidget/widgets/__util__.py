@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from typing import TypeVar, Optional, Tuple, Iterable, List, Callable, MutableMapping, Generic, Container, Dict, \
-    Iterator
+    Iterator, Type, NamedTuple, Union, Any
 
+from collections import namedtuple
+from functools import lru_cache
 from pathlib import Path
+from weakref import WeakValueDictionary
 import os
 
 from fidget.backend.QtWidgets import QWidget, QFileDialog
@@ -319,6 +322,35 @@ def to_identifier(s: str):
     return '_'
 
 
+@lru_cache(maxsize=None)
+def _namedtuple(typename: str, field_names: Tuple[str, ...]) -> Type[NamedTuple]:
+    ret = namedtuple(typename, field_names, rename=True)
+
+    def __reduce__(self):
+        # the type is not a module attribute, so its instances are pickled along with the type's name and fields
+        return _make_value, (typename, field_names, tuple(self))
+
+    ret.__reduce__ = __reduce__
+    return ret
+
+
+def _make_value(typename: str, field_names: Tuple[str, ...], values: Tuple) -> NamedTuple:
+    """
+    unpickle a value of a value type
+    """
+    return _namedtuple(typename, field_names)._make(values)
+
+
+def value_namedtuple(title: str, field_titles: Iterable[str]) -> Type[NamedTuple]:
+    """
+    get a namedtuple type for the values of a Fidget, all the calls with the same identifiers share the same type.
+    The values can be pickled, even into a process that has not created the type yet.
+    :param title: the title of the Fidget
+    :param field_titles: the titles of the fields
+    """
+    return _namedtuple(to_identifier(title), tuple(to_identifier(f) for f in field_titles))
+
+
 class RememberingFileDialog(QFileDialog):
     """
     A QFileDialog that remembers its last directory
@@ -334,3 +366,70 @@ class RememberingFileDialog(QFileDialog):
         ret = super().exec_()
         self.last_dir = super().directory()
         return ret
+
+
+# (dialog class, file mode) -> dialog, a dialog lives as long as a widget uses it
+_shared_file_dialogs: MutableMapping[Tuple[Type[QFileDialog], int], QFileDialog] = WeakValueDictionary()
+
+
+def shared_file_dialog(dialog_cls: Type[QFileDialog], file_mode) -> QFileDialog:
+    """
+    :param dialog_cls: the class of the dialog
+    :param file_mode: the file mode of the dialog
+    :return: a dialog of the class and file mode, shared between all the callers that request the same class and
+     file mode
+    """
+    key = (dialog_cls, file_mode)
+    ret = _shared_file_dialogs.get(key)
+    if ret is None:
+        ret = _shared_file_dialogs[key] = dialog_cls()
+        ret.setFileMode(file_mode)
+    return ret
+
+
+FileDialogArgs = Union[Callable[..., QFileDialog], Dict[str, Any], QFileDialog]
+
+
+class FileDialogMixin:
+    """
+    A mixin for Fidgets with a browse button that opens a file dialog. The dialog is only created when it is first
+    accessed. Inheritors must set _dialog_arg in init_ui and FILE_MODE.
+    """
+
+    DEFAULT_DIALOG_CLS: Type[QFileDialog] = RememberingFileDialog
+    DIALOG: FileDialogArgs = RememberingFileDialog
+    FILE_MODE: QFileDialog.FileMode = None
+    """the file mode of the dialog, required for all inheritors"""
+
+    _dialog_arg: FileDialogArgs = None
+    _dialog: Optional[QFileDialog] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.FILE_MODE is None:
+            raise TypeError(f'{cls.__qualname__} must set FILE_MODE')
+
+    @property
+    def dialog(self) -> QFileDialog:
+        """
+        the file dialog of the browse button, created on first access
+        """
+        if self._dialog is None:
+            self._dialog = self._args_to_filedialog(self._dialog_arg, self.FILE_MODE)
+        return self._dialog
+
+    @classmethod
+    def _args_to_filedialog(cls, arg, file_mode):
+        if isinstance(arg, type) and issubclass(arg, QFileDialog):
+            # dialogs created from a class are shared between all the widgets with the same file mode
+            return shared_file_dialog(arg, file_mode)
+        if isinstance(arg, QFileDialog):
+            ret = arg
+        elif isinstance(arg, dict):
+            ret = cls.DEFAULT_DIALOG_CLS(**arg)
+        elif callable(arg):
+            ret = arg()
+        else:
+            raise TypeError("can't parse argument as dialog: " + str(arg))
+        ret.setFileMode(file_mode)
+        return ret
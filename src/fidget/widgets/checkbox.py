@@ -2,8 +2,6 @@ from typing import TypeVar, Generic
 
 from fidget.backend.QtWidgets import QCheckBox, QHBoxLayout
 
-from fidget.core.__util__ import first_valid
-
 from fidget.widgets.discrete import FidgetDiscreteChoice
 
 T = TypeVar('T')
@@ -27,7 +25,7 @@ class FidgetCheckBox(Generic[T], FidgetDiscreteChoice[T]):
 
         self.checkbox: QCheckBox = None
 
-        self.update_text = first_valid(update_text=update_text, UPDATE_TEXT=self.UPDATE_TEXT, _self=self)
+        self.update_text = self.resolve_param('update_text', update_text)
 
         self.init_ui()
         self.fill_initial()
@@ -51,6 +49,10 @@ class FidgetCheckBox(Generic[T], FidgetDiscreteChoice[T]):
     def fill_index(self, index):
         self.checkbox.setChecked(index)
 
+    def fill_index_headless(self, index):
+        # like setChecked, any non-zero index checks the box
+        self.fill_value(self.options[bool(index)][1])
+
     def change_value(self, *args):
         super().change_value(*args)
         if self.update_text:
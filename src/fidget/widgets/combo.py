@@ -46,6 +46,10 @@ class FidgetCombo(Generic[T], FidgetDiscreteChoice[T]):
         self.setFocusProxy(self.combo_box)
         return layout
 
+    def parse_headless_default(self):
+        # the combo box starts unset
+        raise ParseError('value is unset', offender=self)
+
     def parse(self):
         if self.combo_box.currentIndex() == -1:
             raise ParseError('value is unset', offender=self.combo_box)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Iterable, Generic, TypeVar, Collection, Any
+from typing import Iterable, Generic, TypeVar, Collection, Any, Set, Hashable
 
 from abc import abstractmethod
+from functools import partial
 
 from fidget.core.plaintext_adapter import high_priority
 
@@ -29,6 +30,10 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
 
         self.inners = None
 
+        # the result of the last successful parse, and the keys of the inners that changed since
+        self._last_parsed = None
+        self._dirty_keys: Set[Hashable] = set()
+
     INNER_TEMPLATES: Iterable[TemplateLike] = None
 
     @classmethod
@@ -43,7 +48,7 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
 
     @classmethod
     @abstractmethod
-    def _make_inners(cls, inner_templates):
+    def _make_inners(cls, inner_templates, headless=False):
         pass
 
     @classmethod
@@ -65,6 +70,16 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
     def insert_result(cls, res, key, value):
         pass
 
+    @classmethod
+    @abstractmethod
+    def copy_result(cls, res):
+        pass
+
+    @classmethod
+    @abstractmethod
+    def patch_result(cls, res, key, value):
+        pass
+
     @classmethod
     @abstractmethod
     def result_zip_subwidget(cls, res, inners):
@@ -78,8 +93,8 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
         if not self.inners:
             raise ValueError('at least one inner fidget must be provided')
 
-        for inner in self.inners_values(self.inners):
-            inner.on_change.connect(self.change_value)
+        for key, inner in self.inners_items(self.inners):
+            inner.on_change.connect(partial(self._inner_changed, key))
 
         self.setFocusProxy(
             next(iter(self.inners_values(self.inners)))
@@ -87,7 +102,20 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
 
         return self.inners
 
+    def init_headless(self):
+        super().init_headless()
+        self.inners = self._make_inners(self.inner_templates, headless=True)
+        for key, inner in self.inners_items(self.inners):
+            inner.add_headless_change_listener(partial(self._inner_changed, key))
+
+    def parse_headless_default(self):
+        return self.parse()
+
     def parse(self):
+        # the last result is kept for the next parse, so callers only ever get copies of it
+        if self._last_parsed is not None:
+            return self.copy_result(self._patch_last_parsed())
+
         d = self.init_result()
         for key, subwidget in self.inners_items(self.inners):
             try:
@@ -95,8 +123,33 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
             except ParseError as e:
                 raise ParseError('error parsing ' + subwidget.title, offender=subwidget) from e
             self.insert_result(d, key, value)
+        self._last_parsed = d
+        self._dirty_keys.clear()
+        return self.copy_result(d)
+
+    def _patch_last_parsed(self):
+        """
+        re-parse only the inners that changed since the last parse, sharing the rest of the previous result
+        """
+        if not self._dirty_keys:
+            return self._last_parsed
+
+        d = self.copy_result(self._last_parsed)
+        for key in self._dirty_keys:
+            subwidget = self.inners[key]
+            try:
+                value = subwidget.maybe_parse()
+            except ParseError as e:
+                raise ParseError('error parsing ' + subwidget.title, offender=subwidget) from e
+            self.patch_result(d, key, value)
+        self._last_parsed = d
+        self._dirty_keys.clear()
         return d
 
+    def _inner_changed(self, key):
+        self._dirty_keys.add(key)
+        self.change_value()
+
     def validate(self, d):
         super().validate(d)
         for (k, v), subwidget in self.result_zip_subwidget(d, self.inners):
@@ -130,6 +183,10 @@ class FidgetCompound(Generic[T], MultiFidgetWrapper[Any, T]):
     def to_json(self, d):
         return self._to_json(d)
 
+    def fill_headless(self, res):
+        for (k, v), subwidget in self.result_zip_subwidget(res, self.inners):
+            subwidget.fill_value(v)
+
     def _fill(self, res):
         for (k, v), subwidget in self.result_zip_subwidget(res, self.inners):
             subwidget.fill(v)
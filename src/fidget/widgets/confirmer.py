@@ -6,7 +6,8 @@ from fidget.backend.QtWidgets import QHBoxLayout, QApplication, QPushButton, QVB
     QWidget
 from fidget.backend.QtCore import Qt, QEventLoop
 
-from fidget.core import Fidget, FidgetTemplate, ParseError, TemplateLike, inner_plaintext_printer, PlaintextPrintError
+from fidget.core import Fidget, FidgetTemplate, ParseError, TemplateLike, inner_plaintext_printer, PlaintextPrintError, \
+    PendingValidation
 from fidget.core.__util__ import first_valid
 
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
@@ -50,12 +51,15 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
         self.cancel_value = cancel_value
         self.make_cancel = cancel_value is not self.NO_CANCEL
         self.cancel_flag = False
+        # whether a confirmation is waiting for a pending value to be validated
+        self.confirm_pending = False
 
-        self.close_on_confirm = first_valid(close_on_confirm=close_on_confirm, CLOSE_ON_CONFIRM=self.CLOSE_ON_CONFIRM, _self=self)
+        self.close_on_confirm = self.resolve_param('close_on_confirm', close_on_confirm)
 
         self.init_ui(layout_cls=layout_cls, ok_text=ok_text, cancel_text=cancel_text, modality=window_modality)
 
-        self._inner_changed()
+        if not self._headless:
+            self._inner_changed()
 
     INNER_TEMPLATE: FidgetTemplate[T] = None
     LAYOUT_CLS = QVBoxLayout
@@ -67,7 +71,7 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
 
     def init_ui(self, layout_cls=None, ok_text=None, cancel_text=None, modality=None):
         super().init_ui()
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
         modality = modality or self.WINDOW_MODALITY
 
         layout: QBoxLayout = layout_cls(self)
@@ -81,7 +85,7 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
 
             btn_layout = QHBoxLayout()
             if self.make_cancel:
-                self.cancel_button = QPushButton(first_valid(cancel_text=cancel_text, CANCEL_TEXT=self.CANCEL_TEXT, _self=self))
+                self.cancel_button = QPushButton(self.resolve_param('cancel_text', cancel_text))
                 self.cancel_button.clicked.connect(self._cancel_btn_clicked)
                 btn_layout.addWidget(self.cancel_button)
 
@@ -99,18 +103,35 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
             #self.setWindowFlags(Qt.WindowMinimizeButtonHint)
 
         self.add_plaintext_delegates(self.inner)
+        self.on_change.connect(self._on_value_change)
         return layout
 
+    def init_headless(self):
+        super().init_headless()
+        self.inner = self.inner_template.headless()
+        self.inner.add_headless_change_listener(self.change_value)
+        self.add_plaintext_delegates(self.inner)
+
+    def parse_headless_default(self):
+        return self.parse()
+
     def parse(self):
         if self.cancel_flag:
             if self.make_cancel:
                 return self.cancel_value
             raise ParseError('invalid cancel value')
         inner_value = self.inner.value()
+        if inner_value.is_pending():
+            raise PendingValidation(offender=self.inner)
         if not inner_value.is_ok():
             raise ParseError(offender=self.inner) from inner_value.exception
         return inner_value.value
 
+    def validate(self, v):
+        super().validate(v)
+        if not (self.make_cancel and v is self.cancel_value):
+            self.inner.maybe_validate(v)
+
     @staticmethod
     def to_widget(w: Union[QWidget, Callable[[], QWidget], None]):
         if not w or isinstance(w, QWidget):
@@ -124,22 +145,34 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
     def _ok_btn_clicked(self, *a):
         self.cancel_flag = False
         self.change_value()
-        if self.close_on_confirm:
-            value = self.value()
-            if value.is_ok():
-                self.close()
-            else:
-                QMessageBox.critical(self, 'error parsing value', value.details)
+        self._confirm()
 
     def _cancel_btn_clicked(self, *a):
         self.cancel_flag = True
         self.change_value()
-        if self.close_on_confirm:
-            value = self.value()
-            if value.is_ok():
-                self.close()
-            else:
-                QMessageBox.critical(self, 'error parsing value', value.details)
+        self._confirm()
+
+    def _confirm(self):
+        """
+        close the widget if the value is valid, waiting for the value if it is still being validated
+        """
+        if not self.close_on_confirm:
+            return
+        value = self.value()
+        if value.is_pending():
+            self.confirm_pending = True
+            self.ok_button.setEnabled(False)
+            return
+        self.confirm_pending = False
+        if value.is_ok():
+            self.close()
+        else:
+            QMessageBox.critical(self, 'error parsing value', value.details)
+            self._inner_changed()
+
+    def _on_value_change(self):
+        if self.confirm_pending:
+            self._confirm()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Return \
@@ -165,6 +198,9 @@ class FidgetConfirmer(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
     def fill(self, v):
         self.inner.fill(v)
 
+    def fill_headless(self, v):
+        self.inner.fill_value(v)
+
 
 class FidgetQuestion(Generic[T, C], FidgetConfirmer[T, C]):
     """
@@ -180,8 +216,14 @@ class FidgetQuestion(Generic[T, C], FidgetConfirmer[T, C]):
         """
         self.show()
         event_loop = QEventLoop()
-        self.on_change.connect(event_loop.quit)
+
+        def on_change():
+            if not self.value().is_pending():
+                event_loop.quit()
+
+        self.on_change.connect(on_change)
         event_loop.exec_()
+        self.on_change.disconnect(on_change)
         return self.value()
 
     exec_ = exec
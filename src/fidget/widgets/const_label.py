@@ -2,8 +2,6 @@ from typing import TypeVar, Generic
 
 from fidget.backend.QtWidgets import QLabel, QHBoxLayout
 
-from fidget.core.__util__ import first_valid, optional_valid
-
 from fidget.widgets.discrete import FidgetDiscreteChoice
 
 T = TypeVar('T')
@@ -22,7 +20,7 @@ class FidgetConst(Generic[T], FidgetDiscreteChoice[T]):
     OPTION = None
 
     def __init__(self, title, option=None, **kwargs):
-        option = optional_valid(_self=self, option=option, OPTION=self.OPTION)
+        option = self.resolve_optional_param('option', option)
         if option:
             if 'options' in kwargs:
                 raise TypeError('"option" and "options" arguments cannot be simultaneously used in FidgetConst')
@@ -82,10 +82,7 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
         if self.inner.plaintext_button:
             self.inner.plaintext_button.clicked.disconnect(self.inner._plaintext_btn_click)
             self.inner.plaintext_button.clicked.connect(self._plaintext_btn_click)
-
-            self._plaintext_widget = self.inner._plaintext_widget
-            self._plaintext_widget.owner = self
-
+            # the inner's button now opens the converter's own plaintext dialog, created when it is first clicked
             self.make_plaintext = True
 
         if self.inner.indicator_label:
@@ -104,12 +101,21 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
 
         return self.layout
 
+    def init_headless(self):
+        super().init_headless()
+        self.inner = self.inner_template.headless()
+        self.inner.add_plaintext_adapters_dependent(self)
+        self.inner.add_headless_change_listener(self.change_value)
+
     def provided_pre(self, *args, **kwargs):
         return self.inner.provided_pre(*args, **kwargs)
 
     def provided_post(self, *args, **kwargs):
         return self.inner.provided_post(*args, **kwargs)
 
+    def parse_headless_default(self):
+        return self.parse()
+
     def parse(self):
         f = self.inner.maybe_parse()
         return self.convert(f)
@@ -174,6 +180,9 @@ class FidgetConverter(Generic[F, T], SingleFidgetWrapper[F, T]):
     def fill(self):
         return (self.inner.fill and self.back_convert) and self._fill
 
+    def fill_headless(self, v: T):
+        self.inner.fill_value(self.back_convert(v))
+
     def template_of(self):
         ret = super().template_of()
         template_args = {}
@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-from typing import Mapping, Iterable, Type
+from typing import Iterable, Type
 
 from fidget.backend.QtWidgets import QVBoxLayout, QFrame, QScrollArea, QWidget, QBoxLayout
 
-from fidget.core import ParseError, ValidationError
-from fidget.core.__util__ import first_valid
-
 from fidget.widgets.mapping import FidgetMapping, NamedTemplate
 
 
@@ -39,10 +36,10 @@ class FidgetDict(FidgetMapping):
     def init_ui(self, frame_style=None, layout_cls=None, scrollable=None):
         super().init_ui()
 
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         owner = self
-        scrollable = first_valid(scrollable=scrollable, SCROLLABLE=self.SCROLLABLE, _self=self)
+        scrollable = self.resolve_param('scrollable', scrollable)
 
         owner_layout = QVBoxLayout()
         owner.setLayout(owner_layout)
@@ -73,22 +70,3 @@ class FidgetDict(FidgetMapping):
         master_layout.addWidget(frame)
 
         return master_layout
-
-    def parse(self):
-        d = {}
-        for key, subwidget in self.inners.items():
-            try:
-                value = subwidget.maybe_parse()
-            except ParseError as e:
-                raise ParseError('error parsing ' + subwidget.title, offender=subwidget) from e
-            d[key] = value
-        return d
-
-    def validate(self, d: Mapping[str, object]):
-        super().validate(d)
-        for k, v in d.items():
-            subwidget = self.inners[k]
-            try:
-                subwidget.maybe_validate(v)
-            except ValidationError as e:
-                raise ValidationError('error validating ' + subwidget.title, offender=subwidget) from e
@@ -4,7 +4,6 @@ from abc import abstractmethod
 
 from fidget.core import Fidget, inner_plaintext_parser, PlaintextPrintError, PlaintextParseError, \
     inner_plaintext_printer
-from fidget.core.__util__ import first_valid
 
 T = TypeVar('T')
 
@@ -32,7 +31,7 @@ class FidgetDiscreteChoice(Generic[T], Fidget[T]):
     def __init__(self, title, options: Iterable[Union[T, Tuple[str, T]]] = None,
                  initial_index: int = None, initial_value=None, **kwargs):
         super().__init__(title, **kwargs)
-        options = first_valid(options=options, OPTIONS=self.OPTIONS, _self=self)
+        options = self.resolve_param('options', options)
         self.options = [parse_option(self, o) for o in options]
         self.name_lookup = {}
         for i, (names, o) in enumerate(self.options):
@@ -41,8 +40,8 @@ class FidgetDiscreteChoice(Generic[T], Fidget[T]):
                 if self.name_lookup.setdefault(name, v) != v:
                     raise ValueError('duplicate name: ' + name)
 
-        self.initial_index = first_valid(initial_index=initial_index, INITIAL_INDEX=self.INITIAL_INDEX, _self=self)
-        self.initial_value = first_valid(initial_value=initial_value, INITIAL_VALUE=self.INITIAL_VALUE, _self=self)
+        self.initial_index = self.resolve_param('initial_index', initial_index)
+        self.initial_value = self.resolve_param('initial_value', initial_value)
 
     INITIAL_INDEX = -1
     INITIAL_VALUE = object()
@@ -56,31 +55,50 @@ class FidgetDiscreteChoice(Generic[T], Fidget[T]):
         else:
             ind = self.initial_index
 
-        self.fill_index(ind)
+        if self._headless:
+            self.fill_index_headless(ind)
+        else:
+            self.fill_index(ind)
 
     @abstractmethod
     def fill_index(self, index):
         pass
 
-    def fill(self, key: Union[T, int, str]):
+    def fill_index_headless(self, index):
+        """
+        fill a headless Fidget with the option at an index, the same way fill_index would fill the widgets
+        :inheritors: override if fill_index treats indices that are out of range differently than leaving the value
+            unset
+        """
+        if 0 <= index < len(self.options):
+            self.fill_value(self.options[index][1])
+
+    def option_index(self, key: Union[T, int, str]) -> int:
+        """
+        :param key: an option value, an option name, or an index
+        :return: the index of the option the key refers to
+        """
         # try by value equation
         for i, (_, option) in enumerate(self.options):
             if option == key:
-                self.fill_index(i)
-                return
+                return i
         # try by name
         if isinstance(key, str):
             for i, (names, _) in enumerate(self.options):
                 if key in names:
-                    self.fill_index(i)
-                    return
+                    return i
         # try by index
         if isinstance(key, int):
-            self.fill_index(key)
-            return
+            return key
 
         raise ValueError('value is not a valid fill value')
 
+    def fill(self, key: Union[T, int, str]):
+        self.fill_index(self.option_index(key))
+
+    def fill_headless(self, key: Union[T, int, str]):
+        super().fill_headless(self.options[self.option_index(key)][1])
+
     @inner_plaintext_parser
     def from_values(self, text):
         try:
@@ -3,7 +3,6 @@ from typing import TypeVar, Iterable, Tuple, Union, Dict
 from fidget.backend.QtWidgets import QComboBox, QHBoxLayout
 
 from fidget.core import inner_plaintext_parser, PlaintextParseError, Fidget
-from fidget.core.__util__ import first_valid
 
 from fidget.widgets.discrete import parse_option
 from fidget.widgets.rawstring import FidgetRawString
@@ -29,7 +28,7 @@ class FidgetEditCombo(FidgetRawString):
         :param kwargs: forwarded to Fidget
         """
         super().__init__(title, **kwargs)
-        self.options = first_valid(options=options, OPTIONS=self.OPTIONS, _self=self)
+        self.options = self.resolve_param('options', options)
 
         self._opt_lookup_name: Dict[str, Tuple[int, T]] = None
 
@@ -47,20 +46,34 @@ class FidgetEditCombo(FidgetRawString):
             self.combo_box.setEditable(True)
             layout.addWidget(self.combo_box)
 
-            self._opt_lookup_name = {}
-
-            for value in self.options:
-                names, value = parse_option(self, value)
-                name = names[0]
-                self.combo_box.addItem(name, value)
-                for n in names:
-                    self._opt_lookup_name[n] = value
+            for names, value in self._parse_options():
+                self.combo_box.addItem(names[0], value)
 
             self.combo_box.editTextChanged.connect(self.change_value)
             self.setFocusProxy(self.combo_box)
 
         return layout
 
+    def init_headless(self):
+        super().init_headless()
+        options = self._parse_options()
+        # the combo box starts with the first option selected
+        self._headless_state = options[0][1] if options else ''
+
+    def _parse_options(self):
+        """
+        parse the options, filling the name lookup
+        :return: a list of the names and value of each option
+        """
+        self._opt_lookup_name = {}
+        ret = []
+        for value in self.options:
+            names, value = parse_option(self, value)
+            for n in names:
+                self._opt_lookup_name[n] = value
+            ret.append((names, value))
+        return ret
+
     def parse(self):
         cur_text = self.combo_box.currentText()
         lookup = self._opt_lookup_name.get(cur_text, None)
@@ -78,6 +91,9 @@ class FidgetEditCombo(FidgetRawString):
     def fill(self, key: T):
         self.combo_box.setEditText(key)
 
+    def fill_headless(self, key: T):
+        super().fill_headless(self._opt_lookup_name.get(key, key))
+
     @inner_plaintext_parser
     def by_name(self, name):
         if name in self._opt_lookup_name:
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Union, Callable, Any, Type
+from typing import Optional
 
 from pathlib import Path
 from glob import iglob
@@ -6,15 +6,11 @@ from glob import iglob
 from fidget.backend.QtWidgets import QHBoxLayout, QLineEdit, QFileDialog, QPushButton
 
 from fidget.core import Fidget, ValidationError, PlaintextParseError, inner_plaintext_parser, explicit
-from fidget.core.__util__ import first_valid
 
-from fidget.widgets.__util__ import filename_valid, RememberingFileDialog
+from fidget.widgets.__util__ import filename_valid, FileDialogMixin, FileDialogArgs
 
 
-FileDialogArgs = Union[Callable[..., QFileDialog], Dict[str, Any], QFileDialog]
-
-
-class FidgetFilePath(Fidget[Path]):
+class FidgetFilePath(FileDialogMixin, Fidget[Path]):
     """
     A Fidget to store a Path to a file
     """
@@ -31,24 +27,21 @@ class FidgetFilePath(Fidget[Path]):
         """
         super().__init__(title, **kwargs)
         self.exist_cond = exist_cond if exist_cond is not None else self.EXIST_COND
+        if self.exist_cond:
+            # only existing files can be chosen
+            self.FILE_MODE = QFileDialog.ExistingFile
 
-        self.dialog: QFileDialog = None
         self.edit: QLineEdit = None
 
         self.init_ui(dialog)
 
-    DEFAULT_DIALOG_CLS : Type[QFileDialog] = RememberingFileDialog
-    DIALOG: FileDialogArgs = RememberingFileDialog
     EXIST_COND = None
+    FILE_MODE = QFileDialog.AnyFile
 
     def init_ui(self, dialog=None):
         super().init_ui()
-        self.dialog = self._args_to_filedialog(first_valid(dialog=dialog, DIALOG=self.DIALOG, _self=self))
-
-        if self.exist_cond:
-            self.dialog.setFileMode(QFileDialog.ExistingFile)
-        else:
-            self.dialog.setFileMode(QFileDialog.AnyFile)
+        # the dialog is only created when browsing
+        self._dialog_arg = self.resolve_param('dialog', dialog)
 
         layout = QHBoxLayout(self)
 
@@ -69,6 +62,10 @@ class FidgetFilePath(Fidget[Path]):
         if self.dialog.exec():
             self.fill_value(self.dialog.selectedFiles()[0])
 
+    def parse_headless_default(self):
+        # the edit starts empty
+        return Path('')
+
     def parse(self):
         return Path(self.edit.text())
 
@@ -122,12 +119,3 @@ class FidgetFilePath(Fidget[Path]):
     def cls_plaintext_parsers(cls):
         yield Path
         yield from super().cls_plaintext_parsers()
-
-    @classmethod
-    def _args_to_filedialog(cls, arg):
-        if isinstance(arg, QFileDialog):
-            return arg
-        if isinstance(arg, dict):
-            return cls.DEFAULT_DIALOG_CLS(**arg)
-        if callable(arg):
-            return arg()
@@ -52,6 +52,10 @@ class FidgetLabel(FidgetRawString):
         self.names, self.__value = parse_option(self, key)
         self.label.setText(self.names[0])
 
+    def fill_headless(self, key):
+        self.names, self.__value = parse_option(self, key)
+        super().fill_headless(self.__value)
+
     @inner_plaintext_parser
     def singleton(self, v):
         if v not in self.names:
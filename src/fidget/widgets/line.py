@@ -1,7 +1,5 @@
 from fidget.backend.QtWidgets import QLineEdit, QHBoxLayout
 
-from fidget.core.__util__ import first_valid
-
 from fidget.widgets.rawstring import FidgetRawString
 
 
@@ -17,7 +15,7 @@ class FidgetLine(FidgetRawString):
                  **kwargs):
         super().__init__(title, **kwargs)
 
-        placeholder = first_valid(placeholder=placeholder, PLACEHOLDER=self.PLACEHOLDER, _self=self)
+        placeholder = self.resolve_param('placeholder', placeholder)
 
         self.edit: QLineEdit = None
 
@@ -24,10 +24,10 @@ class FidgetMapping(FidgetCompound[Mapping]):
         )
 
     @classmethod
-    def _make_inners(cls, inner_templates):
+    def _make_inners(cls, inner_templates, headless=False):
         ret = {}
         for name, template in inner_templates.items():
-            inner = template()
+            inner = template.headless() if headless else template()
 
             if ret.setdefault(name, inner) is not inner:
                 raise TypeError(f'duplicate inner name: {name}')
@@ -49,6 +49,14 @@ class FidgetMapping(FidgetCompound[Mapping]):
     def insert_result(cls, res, key, value):
         res[key] = value
 
+    @classmethod
+    def copy_result(cls, res):
+        return dict(res)
+
+    @classmethod
+    def patch_result(cls, res, key, value):
+        res[key] = value
+
     @classmethod
     def result_zip_subwidget(cls, res, inners):
         for k, v in res.items():
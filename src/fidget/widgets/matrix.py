@@ -1,6 +1,7 @@
-from typing import TypeVar, Generic, List, Iterable, Callable
+from typing import TypeVar, Generic, List, Iterable, Callable, Set, Dict, Tuple, Optional
 
 from itertools import chain
+from functools import partial
 from io import StringIO
 import csv
 
@@ -15,7 +16,7 @@ from fidget.backend.Resources import add_row_above_icon, add_row_below_icon, add
 
 from fidget.core import TemplateLike, Fidget, FidgetTemplate, ParseError, ValidationError, \
     inner_plaintext_printer, inner_plaintext_parser, json_parser, PlaintextPrintError, PlaintextParseError, json_printer
-from fidget.core.__util__ import first_valid, mask, update
+from fidget.core.__util__ import mask, update
 
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
 from fidget.widgets.user_util import FidgetInt
@@ -39,18 +40,16 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
                  column_button_text_func: Callable[[int], str] = None,
                  scrollable=None,
                  **kwargs):
-        self.row_bounds = CountBounds[first_valid(rows=rows, ROWS=self.ROWS, _self=self)]
-        self.column_bounds = CountBounds[first_valid(columns=columns, COLUMNS=self.COLUMNS, _self=self)]
+        self.row_bounds = CountBounds[self.resolve_param('rows', rows)]
+        self.column_bounds = CountBounds[self.resolve_param('columns', columns)]
 
         inner_template = only_valid(inner_template=inner_template, INNER_TEMPLATE=self.INNER_TEMPLATE, _self=self).template_of()
 
         super().__init__(inner_template.title, **kwargs)
 
         self.inner_template = inner_template
-        self.row_button_text_func = first_valid(row_button_text_func=row_button_text_func,
-                                                ROW_BUTTON_TEXT_FUNC=self.ROW_BUTTON_TEXT_FUNC, _self=self)
-        self.column_button_text_func = first_valid(column_button_text_func=column_button_text_func,
-                                                   COLUMN_BUTTON_TEXT_FUNC=self.COLUMN_BUTTON_TEXT_FUNC, _self=self)
+        self.row_button_text_func = self.resolve_param('row_button_text_func', row_button_text_func)
+        self.column_button_text_func = self.resolve_param('column_button_text_func', column_button_text_func)
         if self.column_button_text_func is ...:
             self.column_button_text_func = self.row_button_text_func
 
@@ -58,6 +57,9 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         self.inners: List[List[Fidget[T]]] = None  # first row, then column, self.inners[row][column]
         self.col_btns: List[QPushButton[T]] = None
         self.row_btns: List[QPushButton[T]] = None
+        # the menus of the buttons, shared by all the buttons of each axis and created on first click
+        self.row_menu: QMenu = None
+        self.col_menu: QMenu = None
 
         self.row_offset = None
         self.col_offset = None
@@ -65,6 +67,15 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         self.row_count = 0
         self.column_count = 0
 
+        # the results of the last successful parse and validation, and the inners that changed since
+        self._last_parsed: Optional[List[List[T]]] = None
+        self._last_validated: Optional[List[List[T]]] = None
+        # the copy of _last_parsed that parse last returned, and its rows
+        self._last_returned: Optional[List[List[T]]] = None
+        self._returned_rows: Optional[Tuple[List[T], ...]] = None
+        self._dirty_inners: Set[Fidget[T]] = set()
+        self._inner_positions: Dict[Fidget[T], Tuple[int, int]] = None
+
         self.init_ui(layout_cls=layout_cls, scrollable=scrollable)
 
     INNER_TEMPLATE: FidgetTemplate[T] = None
@@ -77,10 +88,10 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
 
     def init_ui(self, layout_cls=None, scrollable=None):
         super().init_ui()
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         owner = self
-        scrollable = first_valid(scrollable=scrollable, SCROLLABLE=self.SCROLLABLE, _self=self)
+        scrollable = self.resolve_param('scrollable', scrollable)
 
         owner_layout = QVBoxLayout()
         owner.setLayout(owner_layout)
@@ -131,7 +142,17 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
 
         return master_layout
 
+    def init_headless(self):
+        super().init_headless()
+        # all the cells are of the same template, so a single headless inner serves as all of them
+        self.inners = [[self.inner_template.headless()]]
+        self.inners[0][0].add_headless_change_listener(self.change_value)
+        self.row_count = self.row_bounds.initial
+        self.column_count = self.column_bounds.initial
+
     def add_row(self, row):
+        self._structure_changed()
+
         # make room
         for row_to_move in range(self.row_count - 1, row - 1, -1):
             for col, widget in enumerate(self.inners[row_to_move]):
@@ -154,6 +175,8 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
             self.row_btns.append(new_button)
 
     def add_col(self, col):
+        self._structure_changed()
+
         # make room
         for col_to_move in range(self.column_count - 1, col - 1, -1):
             for row in range(self.row_count):
@@ -178,180 +201,135 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         ret = QPushButton(self.row_button_text_func(row_index))
         ret.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         ret.setFocusPolicy(Qt.ClickFocus)
-        menu = QMenu(ret)
-
-        def add_top():
-            self.add_row(row_index)
-            self.apply_matrix()
-
-        def add_many_top():
-            question = FidgetQuestion(
-                FidgetInt('# of rows to add', validation_func=valid_between(1,
-                                                                            None if self.row_bounds.max is None else (
-                                                                                    self.row_bounds.max - self.row_count)
-                                                                            )),
-                cancel_value=None
-            )
-            response = question.exec_()
-            if not response.is_ok():
-                return
-            value = response.value
-            if not value:
-                return
-            for _ in range(value):
-                self.add_row(row_index)
-            self.apply_matrix()
-
-        def add_bottom():
-            self.add_row(row_index + 1)
-            self.apply_matrix()
-
-        def add_many_bottom():
-            question = FidgetQuestion(
-                FidgetInt('# of rows to add', validation_func=valid_between(1,
-                                                                            None if self.row_bounds.max is None else (
-                                                                                    self.row_bounds.max - self.row_count)
-                                                                            )),
-                cancel_value=None
-            )
-            response = question.exec_()
-            if not response.is_ok():
-                return
-            value = response.value
-            if not value:
-                return
-            for _ in range(value):
-                self.add_row(row_index + 1)
-            self.apply_matrix()
-
-        # todo delete many?
-        def del_():
-            self.del_row(row_index)
-            self.apply_matrix()
-
-        # todo check if inner has fill
-        def clone():
-            self.add_row(row_index+1)
-            for c in range(self.column_count):
-                v = self.inners[row_index][c].value()
-                if v.is_ok() and self.inners[row_index+1][c].fill is not None:
-                    self.inners[row_index+1][c].fill_value(v.value)
-            self.apply_matrix()
-
-        ret.add_top_action = menu.addAction(add_row_above_icon(), 'add row above', add_top)
-        ret.add_top_action.setEnabled(False)
-
-        ret.add_many_top_action = menu.addAction('add rows above', add_many_top)
-        ret.add_many_top_action.setEnabled(False)
-
-        ret.add_bottom_action = menu.addAction(add_row_below_icon(), 'add row below',
-                                               add_bottom)
-        ret.add_bottom_action.setEnabled(False)
-
-        ret.add_many_bottom_action = menu.addAction('add rows below', add_many_bottom)
-        ret.add_many_bottom_action.setEnabled(False)
-
-        ret.del_action = menu.addAction(del_row_icon(), 'delete row', del_)
-        ret.del_action.setEnabled(False)
-
-        ret.clone_action = menu.addAction('clone', clone)
-        ret.clone_action.setEnabled(False)
-
-        @ret.clicked.connect
-        def _(a):
-            menu.exec_(QCursor.pos())
-
+        ret.clicked.connect(partial(self._exec_row_menu, row_index))
         return ret
 
     def col_btn(self, col_index):
         ret = QPushButton(self.column_button_text_func(col_index))
         ret.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Fixed)
         ret.setFocusPolicy(Qt.ClickFocus)
-        menu = QMenu(ret)
+        ret.clicked.connect(partial(self._exec_col_menu, col_index))
+        return ret
 
-        def add_left():
-            self.add_col(col_index)
-            self.apply_matrix()
+    def _exec_row_menu(self, row_index):
+        """
+        show the menu of a row button, the menu is shared by all the row buttons and is populated for the row on
+        every click
+        """
+        if not self.row_menu:
+            self.row_menu = QMenu(self)
+        menu = self.row_menu
+        menu.clear()
+
+        can_add = self.row_bounds.in_bounds(self.row_count + 1)
+        can_del = self.row_bounds.in_bounds(self.row_count - 1)
+
+        menu.addAction(add_row_above_icon(), 'add row above', partial(self._add_rows, row_index)) \
+            .setEnabled(can_add)
+        menu.addAction('add rows above', partial(self._add_rows, row_index, ask=True)).setEnabled(can_add)
+        menu.addAction(add_row_below_icon(), 'add row below', partial(self._add_rows, row_index + 1)) \
+            .setEnabled(can_add)
+        menu.addAction('add rows below', partial(self._add_rows, row_index + 1, ask=True)).setEnabled(can_add)
+        # todo delete many?
+        menu.addAction(del_row_icon(), 'delete row', partial(self._del_rows, row_index)).setEnabled(can_del)
+        menu.addAction('clone', partial(self._clone_row, row_index)).setEnabled(can_add)
 
-        def add_many_left():
-            question = FidgetQuestion(
-                FidgetInt('# of columns to add',
-                          validation_func=valid_between(1, None if self.column_bounds.max is None else (
-                                  self.column_bounds.max - self.column_count))),
-                cancel_value=None
-            )
-            response = question.exec_()
-            if not response.is_ok():
-                return
-            value = response.value
-            if not value:
-                return
-            for _ in range(value):
-                self.add_col(col_index)
-            self.apply_matrix()
+        menu.exec_(QCursor.pos())
 
-        def add_right():
-            self.add_col(col_index + 1)
-            self.apply_matrix()
+    def _exec_col_menu(self, col_index):
+        """
+        show the menu of a column button, the menu is shared by all the column buttons and is populated for the
+        column on every click
+        """
+        if not self.col_menu:
+            self.col_menu = QMenu(self)
+        menu = self.col_menu
+        menu.clear()
+
+        can_add = self.column_bounds.in_bounds(self.column_count + 1)
+        can_del = self.column_bounds.in_bounds(self.column_count - 1)
+
+        menu.addAction(add_col_left_icon(), 'add column left', partial(self._add_cols, col_index)) \
+            .setEnabled(can_add)
+        menu.addAction('add columns left', partial(self._add_cols, col_index, ask=True)).setEnabled(can_add)
+        menu.addAction(add_col_right_icon(), 'add column right', partial(self._add_cols, col_index + 1)) \
+            .setEnabled(can_add)
+        menu.addAction('add columns right', partial(self._add_cols, col_index + 1, ask=True)).setEnabled(can_add)
+        # todo delete many?
+        menu.addAction(del_col_icon(), 'delete column', partial(self._del_cols, col_index)).setEnabled(can_del)
+        menu.addAction('clone', partial(self._clone_col, col_index)).setEnabled(can_add)
+
+        menu.exec_(QCursor.pos())
 
-        def add_many_right():
-            question = FidgetQuestion(
-                FidgetInt('# of columns to add',
-                          validation_func=valid_between(1, None if self.column_bounds.max is None else (
-                                  self.column_bounds.max - self.column_count))),
-                cancel_value=None
-            )
-            response = question.exec_()
-            if not response.is_ok():
+    @staticmethod
+    def _ask_count(title, bounds: CountBounds, current_count):
+        """
+        ask the user how many rows or columns to add
+        :return: the number to add, or None if none should be added
+        """
+        question = FidgetQuestion(
+            FidgetInt(title, validation_func=valid_between(1, None if bounds.max is None else (
+                    bounds.max - current_count))),
+            cancel_value=None
+        )
+        response = question.exec_()
+        if not response.is_ok():
+            return None
+        return response.value or None
+
+    def _add_rows(self, row_index, ask=False):
+        if ask:
+            count = self._ask_count('# of rows to add', self.row_bounds, self.row_count)
+            if not count:
                 return
-            value = response.value
-            if not value:
+        else:
+            count = 1
+        for _ in range(count):
+            self.add_row(row_index)
+        self.apply_matrix()
+
+    def _add_cols(self, col_index, ask=False):
+        if ask:
+            count = self._ask_count('# of columns to add', self.column_bounds, self.column_count)
+            if not count:
                 return
-            for _ in range(value):
-                self.add_col(col_index + 1)
-            self.apply_matrix()
+        else:
+            count = 1
+        for _ in range(count):
+            self.add_col(col_index)
+        self.apply_matrix()
 
-        # todo delete many?
-        def del_():
-            self.del_col(col_index)
+    def _del_rows(self, row_index):
+        self.del_row(row_index)
+        self.apply_matrix()
+
+    def _del_cols(self, col_index):
+        self.del_col(col_index)
+        self.apply_matrix()
+
+    # todo check if inner has fill
+    def _clone_row(self, row_index):
+        with self.batch():
+            self.add_row(row_index + 1)
+            for c in range(self.column_count):
+                v = self.inners[row_index][c].value()
+                if v.is_ok() and self.inners[row_index + 1][c].fill is not None:
+                    self.inners[row_index + 1][c].fill_value(v.value)
             self.apply_matrix()
 
-        # todo check if inner has fill
-        def clone():
-            self.add_row(col_index + 1)
+    # todo check if inner has fill
+    def _clone_col(self, col_index):
+        with self.batch():
+            self.add_col(col_index + 1)
             for r in range(self.row_count):
                 v = self.inners[r][col_index].value()
-                if v.is_ok() and self.inners[r][col_index+1].fill is not None:
-                    self.inners[r][col_index+1].fill_value(v.value)
+                if v.is_ok() and self.inners[r][col_index + 1].fill is not None:
+                    self.inners[r][col_index + 1].fill_value(v.value)
             self.apply_matrix()
 
-        ret.add_left_action = menu.addAction(add_col_left_icon(), 'add column left',
-                                             add_left)
-        ret.add_left_action.setEnabled(False)
-
-        ret.add_many_left_action = menu.addAction('add columns left', add_many_left)
-        ret.add_many_left_action.setEnabled(False)
-
-        ret.add_right_action = menu.addAction(add_col_right_icon(), 'add column right',
-                                              add_right)
-        ret.add_right_action.setEnabled(False)
-
-        ret.add_many_right_action = menu.addAction('add columns right', add_many_right)
-        ret.add_many_right_action.setEnabled(False)
-
-        ret.del_action = menu.addAction(del_col_icon(), 'delete column', del_)
-        ret.del_action.setEnabled(False)
-
-        ret.clone_action = menu.addAction('clone', clone)
-        ret.clone_action.setEnabled(False)
-
-        @ret.clicked.connect
-        def _(a):
-            menu.exec_(QCursor.pos())
-
-        return ret
-
     def del_row(self, row):
+        self._structure_changed()
+
         # clear the the row
         for widget in self.inners[row]:
             widget.hide()
@@ -372,6 +350,8 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         btn.hide()
 
     def del_col(self, col):
+        self._structure_changed()
+
         # clear the the column
         for row in self.inners:
             widget = row[col]
@@ -408,35 +388,41 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
                 self.setTabOrder(prev, inner)
                 prev = inner
 
-        can_add_row = self.row_bounds.in_bounds(self.row_count + 1)
-        can_del_row = self.row_bounds.in_bounds(self.row_count - 1)
-        for btn in self.row_btns:
-            btn.add_top_action.setEnabled(can_add_row)
-            btn.add_many_top_action.setEnabled(can_add_row)
-            btn.add_bottom_action.setEnabled(can_add_row)
-            btn.add_many_bottom_action.setEnabled(can_add_row)
-            btn.del_action.setEnabled(can_del_row)
-            btn.clone_action.setEnabled(can_add_row)
-
-        can_add_col = self.column_bounds.in_bounds(self.column_count + 1)
-        can_del_col = self.column_bounds.in_bounds(self.column_count - 1)
-        for btn in self.col_btns:
-            btn.add_left_action.setEnabled(can_add_col)
-            btn.add_many_left_action.setEnabled(can_add_col)
-            btn.add_right_action.setEnabled(can_add_col)
-            btn.add_many_right_action.setEnabled(can_add_col)
-            btn.del_action.setEnabled(can_del_col)
-            btn.clone_action.setEnabled(can_add_col)
-
         self.change_value()
 
     def _make_inner(self):
         ret: Fidget[T] = self.inner_template()
-        ret.on_change.connect(self.change_value)
+        ret.on_change.connect(partial(self._inner_changed, ret))
 
         return ret
 
+    def _inner_changed(self, inner):
+        self._dirty_inners.add(inner)
+        self.change_value()
+
+    def _structure_changed(self):
+        """
+        discard the previous results, since the inners have moved
+        """
+        self._last_parsed = self._last_validated = self._last_returned = self._returned_rows = \
+            self._inner_positions = None
+
+    def parse_headless_default(self):
+        # all the cells hold the default value of the single headless inner
+        if not (self.row_count and self.column_count):
+            return [[] for _ in range(self.row_count)]
+        inner = self.inners[0][0]
+        try:
+            value = inner.maybe_parse()
+        except ParseError as e:
+            raise ParseError('error parsing (0, 0)', offender=inner) from e
+        return [[value] * self.column_count for _ in range(self.row_count)]
+
     def parse(self):
+        if self._last_parsed is not None:
+            previous = self._last_parsed
+            return self._copy_last_parsed(self._patch_last_parsed(), previous)
+
         ret = []
         for i, inner_row in enumerate(self.inners):
             row = []
@@ -446,22 +432,94 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
                 except ParseError as e:
                     raise ParseError(f'error parsing {i, j}', offender=inner) from e
             ret.append(row)
+        self._last_parsed = ret
+        self._dirty_inners.clear()
+        return self._copy_last_parsed(ret)
+
+    def _copy_last_parsed(self, last_parsed, previous=None):
+        """
+        the last result is kept for the next parse, so callers only ever get copies of it. Only the rows that changed
+        since previous (the cached result of the parse before) are copied, the rest are shared with the value that parse
+        returned, so the rows of a returned value must not be mutated in place.
+        """
+        returned = self._returned_rows
+        if previous is None or returned is None:
+            ret = [list(row) for row in last_parsed]
+        else:
+            ret = [
+                r_row if row is p_row else list(row)
+                for (row, p_row, r_row) in zip(last_parsed, previous, returned)
+            ]
+        self._last_returned = ret
+        self._returned_rows = tuple(ret)
+        return ret
+
+    def _patch_last_parsed(self):
+        """
+        re-parse only the inners that changed since the last parse, copying only their rows and sharing the rest
+        """
+        if not self._dirty_inners:
+            return self._last_parsed
+
+        if self._inner_positions is None:
+            self._inner_positions = {
+                inner: (i, j) for (i, row) in enumerate(self.inners) for (j, inner) in enumerate(row)
+            }
+
+        ret = list(self._last_parsed)
+        copied_rows = set()
+        for inner in self._dirty_inners:
+            pos = self._inner_positions.get(inner)
+            if pos is None:
+                # the inner has been removed
+                continue
+            i, j = pos
+            if i not in copied_rows:
+                ret[i] = list(ret[i])
+                copied_rows.add(i)
+            try:
+                ret[i][j] = inner.maybe_parse()
+            except ParseError as e:
+                raise ParseError(f'error parsing {i, j}', offender=inner) from e
+        self._last_parsed = ret
+        self._dirty_inners.clear()
         return ret
 
     def validate(self, value: List[List[T]]):
-        for i, (inner_row, v_row) in enumerate(zip(self.inners, value)):
-            for j, (inner, v) in enumerate(zip(inner_row, v_row)):
+        if not self.row_bounds.in_bounds(len(value)):
+            raise ValidationError(f'row number {len(value)} is out of bounds', offender=self)
+        if not value:
+            # with no rows, there are no columns to check
+            self._last_validated = value
+            return
+        col_count = len(value[0])
+        if not self.column_bounds.in_bounds(col_count):
+            raise ValidationError(f'column number {col_count} is out of bounds', offender=self)
+
+        # the rows of the value parse last returned are copies of the cached rows, which are never mutated, so the
+        # cached rows identify the rows that didn't change since they were last validated
+        rows = self._last_parsed if value is self._last_returned else value
+        prev = self._last_validated
+        for i, (inner_row, v_row, row) in enumerate(zip(repeat_last(self.inners), value, rows)):
+            if len(v_row) != col_count:
+                raise ValidationError(f'{col_count} columns in row 0, but {len(v_row)} in row {i}', offender=self)
+            if prev is not None and i < len(prev) and prev[i] is row:
+                # this row was already validated
+                continue
+            for j, (inner, v) in enumerate(zip(repeat_last(inner_row), v_row)):
                 try:
                     inner.maybe_validate(v)
                 except ValidationError as e:
                     raise ValidationError(f'error validating {i, j}', offender=inner) from e
+        # only the cached rows are known not to be mutated later
+        self._last_validated = rows if rows is self._last_parsed else None
 
     def indication_changed(self, value):
         Fidget.indication_changed(self, value)
 
     def fill(self, v):
         rows = len(v)
-        cols = len(v[0])
+        cols = len(v[0]) if v else self.column_count
         same_dims = 0
 
         if rows < self.row_count:
@@ -489,6 +547,12 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         if same_dims < 2:
             self.apply_matrix()
 
+    def fill_headless(self, v):
+        self.row_count = len(v)
+        if v:
+            self.column_count = len(v[0])
+        super().fill_headless(v)
+
     # todo allow csv dialects
     @inner_plaintext_parser
     def from_csv(self, v):
@@ -578,9 +642,9 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
         size = self.row_count * self.column_count
         i = rec_iter(v)
         ret = []
-        for row_num, inners_row in enumerate(self.inners):
+        for row_num, inners_row in zip(range(self.row_count), repeat_last(self.inners)):
             ret_row = []
-            for col_num, inner in enumerate(inners_row):
+            for col_num, inner in zip(range(self.column_count), repeat_last(inners_row)):
                 try:
                     e = next(i)
                 except StopIteration as exc:
@@ -620,9 +684,9 @@ class FidgetMatrix(Generic[T], SingleFidgetWrapper[T, List[List[T]]]):
 
     def string_matrix(self, v):
         ret = []
-        for row_num, (row, inners_row) in enumerate(zip(v, self.inners)):
+        for row_num, (row, inners_row) in enumerate(zip(v, repeat_last(self.inners))):
             ret_row = []
-            for col_num, (e, inner) in enumerate(zip(row, inners_row)):
+            for col_num, (e, inner) in enumerate(zip(row, repeat_last(inners_row))):
                 try:
                     s = inner.joined_plaintext_printer(e)
                 except PlaintextPrintError as exc:
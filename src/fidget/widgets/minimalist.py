@@ -5,7 +5,6 @@ from typing import TypeVar, Generic
 from fidget.backend.QtWidgets import QHBoxLayout, QPushButton, QBoxLayout, QSizePolicy
 
 from fidget.core import FidgetTemplate, TemplateLike, Fidget
-from fidget.core.__util__ import first_valid
 
 from fidget.widgets.__util__ import only_valid
 from fidget.widgets.label import FidgetLabel
@@ -33,6 +32,7 @@ class FidgetMinimal(Generic[T], SingleFidgetWrapper[T, T]):
 
         self.browse_btn: QPushButton = None
 
+        # the question is only created when it is first needed, see _make_question
         self.question: FidgetQuestion[T] = None
         self.outer: Fidget[T] = None
 
@@ -40,15 +40,14 @@ class FidgetMinimal(Generic[T], SingleFidgetWrapper[T, T]):
 
         self.init_ui(layout_cls=layout_cls)
 
-        initial_value = first_valid(initial_value=initial_value, INITIAL_VALUE=self.INITIAL_VALUE,
-                                    _invalid=self.NOT_INITIAL, _self=self)
-
-        self.fill_value(initial_value)
+        initial_value = initial_value if initial_value is not self.NOT_INITIAL else self.INITIAL_VALUE
+        if initial_value is not self.NOT_INITIAL:
+            self.fill_value(initial_value)
 
     def init_ui(self, layout_cls=None, ok_text=None, cancel_text=None, modality=None,
                 pre_widget=None, post_widget=None):
         super().init_ui()
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         layout: QBoxLayout = layout_cls(self)
         with self.setup_provided(layout):
@@ -61,13 +60,35 @@ class FidgetMinimal(Generic[T], SingleFidgetWrapper[T, T]):
             self.outer.on_change.connect(self.change_value)
             layout.addWidget(self.outer)
 
-            self.question = FidgetQuestion(self.inner_template, parent=self)
-
-        self.outer.add_plaintext_delegates(self.question)
+        self.outer.add_plaintext_parsers_delegate(self.plaintext_parsers)
+        self.outer.add_plaintext_printers_delegate(self.plaintext_printers)
 
         return layout
 
+    def init_headless(self):
+        super().init_headless()
+        self.question = FidgetQuestion.headless(self.inner_template)
+        self.outer = self.outer_template.headless()
+        self.outer.add_headless_change_listener(self.change_value)
+
+    def _make_question(self) -> FidgetQuestion[T]:
+        if self.question is None:
+            self.question = FidgetQuestion(self.inner_template, parent=self)
+            # the plaintext adapters are now the question's, rather than the shared headless question's
+            self.invalidate_plaintext_adapters()
+        return self.question
+
+    def _adapter_source(self) -> FidgetQuestion[T]:
+        """
+        :return: the question whose plaintext adapters are used, until the question is created this is a headless
+            question shared by all the FidgetMinimals of the same inner template
+        """
+        if self.question is not None:
+            return self.question
+        return self.inner_template.headless_instance(FidgetQuestion)
+
     def _browse_btn_clicked(self, event):
+        self._make_question()
         v = self.value()
         if v.is_ok():
             self.question.fill_value(v.value)
@@ -81,17 +102,29 @@ class FidgetMinimal(Generic[T], SingleFidgetWrapper[T, T]):
     def fill(self, value: T):
         self.outer.fill_value(value)
 
+    def fill_headless(self, value: T):
+        self.outer.fill_value(value)
+
+    def parse_headless_default(self):
+        return self.parse()
+
     def parse(self):
         return self.outer.maybe_parse()
 
+    def validate(self, value):
+        super().validate(value)
+        if self._headless:
+            # the value wasn't necessarily validated by the question
+            self.question.validate(value)
+
     def indication_changed(self, value):
         Fidget.indication_changed(self, value)
 
     def plaintext_parsers(self):
-        yield from self.question.plaintext_parsers()
+        yield from self._adapter_source().plaintext_parsers()
 
     def plaintext_printers(self):
-        yield from self.question.plaintext_printers()
+        yield from self._adapter_source().plaintext_printers()
 
     INNER_TEMPLATE: FidgetTemplate[T] = None
     OUTER_TEMPLATE: FidgetTemplate[T] = FidgetLabel.template('outer')
@@ -1,4 +1,4 @@
-from typing import Dict, Union, Callable, Any, Type, List
+from typing import List
 
 from pathlib import Path
 from glob import iglob
@@ -6,22 +6,20 @@ from glob import iglob
 from fidget.backend.QtWidgets import QHBoxLayout, QLineEdit, QFileDialog, QPushButton
 
 from fidget.core import Fidget, ValidationError, inner_plaintext_parser, explicit
-from fidget.core.__util__ import first_valid
 
-from fidget.widgets.__util__ import RememberingFileDialog
-
-FileDialogArgs = Union[Callable[..., QFileDialog], Dict[str, Any], QFileDialog]
+from fidget.widgets.__util__ import FileDialogMixin, FileDialogArgs
 
 
 # todo common superclass with FidgetFilePath
 
-class FidgetFilePaths(Fidget[List[Path]]):
+class FidgetFilePaths(FileDialogMixin, Fidget[List[Path]]):
     """
     A Fidget to store a Path to a file
     """
 
     MAKE_INDICATOR = True
     MAKE_PLAINTEXT = False
+    FILE_MODE = QFileDialog.ExistingFiles
 
     def __init__(self, title: str, dialog: FileDialogArgs = None, **kwargs):
         """
@@ -32,17 +30,14 @@ class FidgetFilePaths(Fidget[List[Path]]):
         """
         super().__init__(title, **kwargs)
 
-        self.dialog: QFileDialog = None
         self.edit: QLineEdit = None
 
         self.init_ui(dialog)
 
-    DEFAULT_DIALOG_CLS: Type[QFileDialog] = RememberingFileDialog
-    DIALOG: FileDialogArgs = RememberingFileDialog
-
     def init_ui(self, dialog=None):
         super().init_ui()
-        self.dialog = self._args_to_filedialog(first_valid(dialog=dialog, DIALOG=self.DIALOG, _self=self))
+        # the dialog is only created when browsing
+        self._dialog_arg = self.resolve_param('dialog', dialog)
 
         layout = QHBoxLayout(self)
 
@@ -63,6 +58,10 @@ class FidgetFilePaths(Fidget[List[Path]]):
         if self.dialog.exec():
             self.fill_value(self.dialog.selectedFiles())
 
+    def parse_headless_default(self):
+        # the edit starts empty
+        return [Path('')]
+
     def parse(self):
         return [Path(s) for s in self.edit.text().split(';;')]
 
@@ -95,16 +94,3 @@ class FidgetFilePaths(Fidget[List[Path]]):
     def cls_plaintext_parsers(cls):
         yield Path
         yield from super().cls_plaintext_parsers()
-
-    @classmethod
-    def _args_to_filedialog(cls, arg):
-        if isinstance(arg, QFileDialog):
-            ret = arg
-        elif isinstance(arg, dict):
-            ret = cls.DEFAULT_DIALOG_CLS(**arg)
-        elif callable(arg):
-            ret = arg()
-        else:
-            raise TypeError("can't parse argument as dialog: " + str(arg))
-        ret.setFileMode(QFileDialog.ExistingFiles)
-        return ret
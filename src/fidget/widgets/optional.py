@@ -11,7 +11,6 @@ from fidget.backend.QtWidgets import QCheckBox, QHBoxLayout, QWidget, QApplicati
 from fidget.backend.QtCore import QObject, QEvent, __backend__
 
 from fidget.core import Fidget, PlaintextPrintError, PlaintextParseError, FidgetTemplate
-from fidget.core.__util__ import first_valid
 
 from fidget.widgets.idiomatic_inner import SingleFidgetWrapper
 from fidget.widgets.__util__ import only_valid, is_trivial_printer
@@ -93,14 +92,18 @@ class FidgetOptional(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
 
         self.init_ui(layout_cls)
 
-        self.not_none_checkbox.setChecked(default_state)
+        if self._headless:
+            if not default_state:
+                self.fill_value(self.none_value)
+        else:
+            self.not_none_checkbox.setChecked(default_state)
 
     INNER_TEMPLATE: FidgetTemplate[T] = None
     LAYOUT_CLS = QHBoxLayout
 
     def init_ui(self, layout_cls=None):
         super().init_ui()
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         layout = layout_cls(self)
 
@@ -124,6 +127,24 @@ class FidgetOptional(Generic[T, C], SingleFidgetWrapper[T, Union[T, C]]):
 
         return layout
 
+    def init_headless(self):
+        super().init_headless()
+        self.inner = self.inner_template.headless()
+        self.inner.add_plaintext_adapters_dependent(self)
+        self.inner.add_headless_change_listener(self.change_value)
+
+    def parse_headless_default(self):
+        # a headless Fidget that starts without a value is filled with the none value on creation
+        return self.inner.maybe_parse()
+
+    def fill_headless(self, v):
+        # the none value is held by the Fidget itself, any other value by the inner
+        if v is self.none_value:
+            super().fill_headless(v)
+        else:
+            self._headless_state = self.NO_HEADLESS_STATE
+            self.inner.fill_value(v)
+
     def parse(self):
         if self.not_none_checkbox.isChecked():
             return self.inner.maybe_parse()
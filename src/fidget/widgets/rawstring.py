@@ -3,7 +3,6 @@ from typing import Optional, Pattern, Union, Container
 import re
 
 from fidget.core import Fidget, ValidationError, inner_plaintext_parser
-from fidget.core.__util__ import first_valid, optional_valid
 
 
 class FidgetRawString(Fidget[str]):
@@ -17,14 +16,12 @@ class FidgetRawString(Fidget[str]):
                  initial=None, **kwargs):
         super().__init__(title, **kwargs)
 
-        pattern = optional_valid(pattern=pattern, PATTERN=self.PATTERN, _self=self)
+        pattern = self.resolve_optional_param('pattern', pattern)
 
         self.pattern: Optional[Pattern[str]] = re.compile(pattern) if isinstance(pattern, str) else pattern
-        self.allowed_characters = optional_valid(allowed_characters=allowed_characters,
-                                                 ALLOWED_CHARACTERS=self.ALLOWED_CHARACTERS, _self=self)
-        self.forbidden_characters = optional_valid(forbidden_characters=forbidden_characters,
-                                                   FORBIDDEN_CHARACTERS=self.FORBIDDEN_CHARACTERS, _self=self)
-        self.initial = first_valid(initial=initial, INITIAL=self.INITIAL, _self=self)
+        self.allowed_characters = self.resolve_optional_param('allowed_characters', allowed_characters)
+        self.forbidden_characters = self.resolve_optional_param('forbidden_characters', forbidden_characters)
+        self.initial = self.resolve_param('initial', initial)
 
     def fill_initial(self):
         self.fill_value(self.initial)
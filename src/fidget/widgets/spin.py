@@ -3,7 +3,6 @@ from typing import Union, TypeVar, Generic, Iterable, Tuple
 from fidget.backend.QtGui import QValidator
 from fidget.backend.QtWidgets import QSpinBox, QDoubleSpinBox, QHBoxLayout
 from fidget.core import Fidget
-from fidget.core.__util__ import first_valid, optional_valid
 from fidget.widgets.discrete import FidgetDiscreteChoice
 from fidget.widgets.user_util import FidgetFloat, FidgetInt
 
@@ -18,24 +17,30 @@ class FidgetSpin(Fidget[float]):
     def __init__(self, title, minimum=None, maximum=None, step=None, force_float=None, prefix=None, suffix=None,
                  decimals=None, initial_value=None, **kwargs):
         super().__init__(title, **kwargs)
-        minimum = first_valid(minimum=minimum, MINIMUM=self.MINIMUM, _self=self)
-        maximum = first_valid(maximum=maximum, MAXIMUM=self.MAXIMUM, _self=self)
-        step = first_valid(step=step, STEP=self.STEP, _self=self)
-        decimals = optional_valid(decimals=decimals, DECIMALS=self.DECIMALS, _self=self)
+        minimum = self.resolve_param('minimum', minimum)
+        maximum = self.resolve_param('maximum', maximum)
+        step = self.resolve_param('step', step)
+        decimals = self.resolve_optional_param('decimals', decimals)
 
-        force_float = first_valid(force_float=force_float, FORCE_FLOAT=self.FORCE_FLOAT, _self=self)
+        force_float = self.resolve_param('force_float', force_float)
 
         self.use_float = force_float or (decimals is not None) \
                          or any(isinstance(i, float) for i in (minimum, maximum, step))
 
-        prefix = optional_valid(prefix=prefix, PREFIX=self.PREFIX, _self=self)
-        suffix = optional_valid(suffix=suffix, SUFFIX=self.SUFFIX, _self=self)
+        prefix = self.resolve_optional_param('prefix', prefix)
+        suffix = self.resolve_optional_param('suffix', suffix)
 
         self.spin: Union[QSpinBox, QDoubleSpinBox] = None
+        self.minimum = minimum
+        self.maximum = maximum
 
         self.init_ui(minimum=minimum, maximum=maximum, step=step, use_float=self.use_float, prefix=prefix,
                      suffix=suffix, decimals=decimals, initial_value=initial_value)
 
+        if self._headless:
+            initial_value = self.resolve_optional_param('initial_value', initial_value)
+            self.fill_value(initial_value or minimum)
+
     def init_ui(self, minimum=None, maximum=None, step=None, use_float=None, prefix=None, suffix=None, decimals=None,
                 initial_value=None):
         super().init_ui()
@@ -67,7 +72,7 @@ class FidgetSpin(Fidget[float]):
         else:
             self.add_plaintext_delegates(FidgetInt)
 
-        initial_value = optional_valid(initial_value=initial_value, INITIAL_VALUE=self.INITIAL_VALUE, _self=self)
+        initial_value = self.resolve_optional_param('initial_value', initial_value)
         if initial_value:
             self.spin.setValue(initial_value)
 
@@ -76,12 +81,23 @@ class FidgetSpin(Fidget[float]):
 
         return layout
 
+    def init_headless(self):
+        super().init_headless()
+        if self.use_float:
+            self.add_plaintext_delegates(FidgetFloat)
+        else:
+            self.add_plaintext_delegates(FidgetInt)
+
     def parse(self):
         return self.spin.value()
 
     def fill(self, v):
         self.spin.setValue(v)
 
+    def fill_headless(self, v):
+        # clamp the value, like the spin box would
+        super().fill_headless(min(max(v, self.minimum), self.maximum))
+
     MINIMUM = 0
     MAXIMUM = 99
     STEP = 1
@@ -102,7 +118,7 @@ class FidgetDiscreteSpin(Generic[T], FidgetDiscreteChoice[T]):
 
     def __init__(self, title, wrap=None, **kwargs):
         super().__init__(title, **kwargs)
-        wrap = first_valid(wrap=wrap, WRAP=self.WRAP, _self=self)
+        wrap = self.resolve_param('wrap', wrap)
 
         self.spin: QSpinBox = None
 
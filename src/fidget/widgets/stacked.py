@@ -2,16 +2,15 @@ from __future__ import annotations
 
 from typing import TypeVar, Generic, Iterable, Tuple, Union, Type, List, Dict
 
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from functools import partial, update_wrapper
 from abc import abstractmethod
 from itertools import chain
 
 from fidget.backend.QtWidgets import QVBoxLayout, QStackedWidget, QComboBox, QFrame, QRadioButton, QGroupBox, \
-    QCheckBox, QBoxLayout
+    QCheckBox, QBoxLayout, QWidget
 
 from fidget.core import Fidget, ParseError, FidgetTemplate, TemplateLike
-from fidget.core.__util__ import first_valid
 
 from fidget.widgets.idiomatic_inner import MultiFidgetWrapper
 from fidget.widgets.__util__ import only_valid
@@ -171,7 +170,7 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
 
     def __init__(self, title, inner_templates: Iterable[NamedTemplate[T]] = None,
                  frame_style=None, selector_cls: Union[Type[Selector], str] = None,
-                 layout_cls: Type[QBoxLayout] = None,
+                 layout_cls: Type[QBoxLayout] = None, lazy: bool = None, max_pages: int = None,
                  **kwargs):
         """
         :param title: the title
@@ -180,6 +179,11 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
         :param selector_cls: the class (or name) of a selector
         :param layout_cls: the class of the layout
         :param scrollable: whether to make the widget scrollable
+        :param lazy: whether to only create each option's Fidget when it is first selected
+        :param max_pages: if not None, the maximum number of options' Fidgets to keep alive (implies lazy). When
+            exceeded, the least recently selected options' Fidgets are destroyed, and re-created (and filled with
+            their last value) when they are selected again. Fidgets that cannot be re-filled (because their value is
+            invalid or they have no fill method) are never destroyed.
         :param kwargs: forwarded to Fidget
         """
         self.inner_templates = dict(
@@ -195,17 +199,30 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
 
         self.selector: FidgetStacked.Selector = None
 
-        selector_cls = first_valid(selector_cls=selector_cls, SELECTOR_CLS=self.SELECTOR_CLS, _self=self)
+        selector_cls = self.resolve_param('selector_cls', selector_cls)
         if isinstance(selector_cls, str):
             selector_cls = self.selectors[selector_cls]
         self.selector_cls = selector_cls
+        self.max_pages = self.resolve_optional_param('max_pages', max_pages)
+        if self.max_pages is not None and self.max_pages < 1:
+            raise ValueError('max_pages must be at least 1')
+        # destroyed pages are re-created the same way lazy pages are created
+        self.lazy = self.max_pages is not None or self.resolve_param('lazy', lazy)
+        # the names of the created options, least recently selected first
+        self._recent_pages: OrderedDict[str, None] = OrderedDict()
+        # the last values of destroyed options, by name
+        self._evicted_values: Dict[str, T] = {}
         self.stacked: QStackedWidget = None
+        # the name of the current inner, for headless Fidgets
+        self._headless_current: str = None
 
         self.init_ui(frame_style=frame_style, layout_cls=layout_cls)
 
     INNER_TEMPLATES: Iterable[NamedTemplate[T]] = None
     LAYOUT_CLS: Type[QBoxLayout] = QVBoxLayout
     SELECTOR_CLS: Union[Type[Selector], str] = 'combo'
+    LAZY = False
+    MAX_PAGES: int = None
 
     def init_ui(self, frame_style=None, layout_cls=None):
         super().init_ui()
@@ -216,7 +233,7 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
         if frame_style is not None:
             frame.setFrameStyle(frame_style)
 
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         layout = layout_cls()
 
@@ -224,21 +241,16 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
             self.selector = self.selector_cls('select option')
             self.stacked = QStackedWidget()
 
+            # in lazy mode, only the options that were selected at least once are in inners
             self.inners = {}
-            for name, inner_template in self.inner_templates.items():
-                inner: Fidget[T] = inner_template()
-                if self.inners.setdefault(name, inner) is not inner:
-                    raise TypeError(f'duplicate inner name: {name}')
-
-                for p in chain(inner.provided_pre(),
-                               inner.provided_post()):
-                    p.hide()
-
-                self.stacked.addWidget(inner)
+            for i, (name, inner_template) in enumerate(self.inner_templates.items()):
+                if self.lazy and i:
+                    # a placeholder page, replaced with the option's Fidget when it is first selected
+                    self.stacked.addWidget(QWidget())
+                else:
+                    self.stacked.addWidget(self._make_inner(name, inner_template))
                 self.selector.add_option(name)
 
-                inner.on_change.connect(self.change_value)
-
             self.selector.on_change.connect(self._selector_changed)
             layout.addWidget(self.selector)
             layout.addWidget(self.stacked)
@@ -254,6 +266,76 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
 
         return master_layout
 
+    def _make_inner(self, name: str, inner_template: FidgetTemplate[T]) -> Fidget[T]:
+        inner: Fidget[T] = inner_template()
+        if self.inners.setdefault(name, inner) is not inner:
+            raise TypeError(f'duplicate inner name: {name}')
+        self._recent_pages[name] = None
+
+        for p in chain(inner.provided_pre(),
+                       inner.provided_post()):
+            p.hide()
+
+        inner.on_change.connect(self.change_value)
+        return inner
+
+    def _materialize(self, index: int) -> Fidget[T]:
+        """
+        get the Fidget of an option, creating it in place of its placeholder page if it wasn't created yet
+        """
+        name = list(self.inner_templates)[index]
+        ret = self.inners.get(name)
+        if ret is None:
+            placeholder = self.stacked.widget(index)
+            ret = self._make_inner(name, self.inner_templates[name])
+            self.stacked.insertWidget(index, ret)
+            self.stacked.removeWidget(placeholder)
+            placeholder.deleteLater()
+            if name in self._evicted_values:
+                ret.fill_value(self._evicted_values.pop(name))
+            # the option's adapters are no longer the class's
+            self.invalidate_plaintext_adapters()
+        return ret
+
+    def _evict_pages(self):
+        """
+        destroy the least recently selected options' Fidgets until at most max_pages are alive, storing their values
+        """
+        current = self.current_subwidget()
+        for name in list(self._recent_pages):
+            if len(self._recent_pages) <= self.max_pages:
+                return
+            inner = self.inners[name]
+            if inner is current or not inner.fill:
+                continue
+            value = inner.value()
+            if not value.is_ok():
+                continue
+            self._evicted_values[name] = value.value
+
+            index = self.stacked.indexOf(inner)
+            self.stacked.insertWidget(index, QWidget())
+            self.stacked.removeWidget(inner)
+            del self.inners[name]
+            del self._recent_pages[name]
+            inner.deleteLater()
+
+    def init_headless(self):
+        super().init_headless()
+        self.inners = {}
+        for name, inner_template in self.inner_templates.items():
+            inner: Fidget[T] = inner_template.headless()
+            if self.inners.setdefault(name, inner) is not inner:
+                raise TypeError(f'duplicate inner name: {name}')
+            inner.add_plaintext_adapters_dependent(self)
+            inner.add_headless_change_listener(self.change_value)
+        if not self.inners:
+            raise ValueError('at least one inner fidget must be provided')
+        self._headless_current = next(iter(self.inners))
+
+    def parse_headless_default(self):
+        return self.parse()
+
     def parse(self):
         return self.current_subwidget().maybe_parse()
 
@@ -269,10 +351,13 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
 
         current = self.current_subwidget()
         yield from current.plaintext_parsers()
-        for n, o in self.inners.items():
+        for n, t in self.inner_templates.items():
+            o = self.inners.get(n)
             if o is current:
                 continue
-            for p in o.plaintext_parsers():
+            # options that weren't created yet only have their class's parsers
+            parsers = o.plaintext_parsers() if o is not None else t.widget_cls.cls_plaintext_parsers()
+            for p in parsers:
                 new_parser = partial(parser_wrap, n, p)
                 update_wrapper(new_parser, p)
 
@@ -280,6 +365,8 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
                 yield new_parser
 
     def current_subwidget(self) -> Fidget[T]:
+        if self._headless:
+            return self.inners[self._headless_current]
         v: Fidget[T] = self.stacked.currentWidget()
         return v
 
@@ -287,9 +374,21 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
         if isinstance(v, self.targeted_fill):
             name = v.option_name
             self.selector.fill_value(name)
+            # the selector's on_change might be deferred, so we sync the current page ourselves
+            self._sync_current_page()
             v = v.value
         self.current_subwidget().fill(v)
 
+    def fill_headless(self, v: Union[T, targeted_fill]):
+        if isinstance(v, self.targeted_fill):
+            if v.option_name not in self.inners:
+                raise KeyError(v.option_name)
+            if v.option_name != self._headless_current:
+                self._headless_current = v.option_name
+                self.invalidate_plaintext_adapters()
+            v = v.value
+        self.current_subwidget().fill_value(v)
+
     @staticmethod
     def _to_name_subtemplate(option: NamedTemplate) -> Tuple[str, FidgetTemplate[T]]:
         try:
@@ -303,9 +402,20 @@ class FidgetStacked(Generic[T], MultiFidgetWrapper[T, T]):
             raise ValueError(f'stacked option {option} must have a title')
         return template.title, template
 
-    def _selector_changed(self):
+    def _sync_current_page(self):
         index = self.selector.value()
         if not index.is_ok():
             raise index.exception
-        self.stacked.setCurrentIndex(index.value)
+        if self.stacked.currentIndex() != index.value:
+            if self.lazy:
+                self._materialize(index.value)
+                self._recent_pages.move_to_end(list(self.inner_templates)[index.value])
+            self.stacked.setCurrentIndex(index.value)
+            if self.max_pages is not None:
+                self._evict_pages()
+            # our adapters depend on the current page
+            self.invalidate_plaintext_adapters()
+
+    def _selector_changed(self):
+        self._sync_current_page()
         self.change_value()
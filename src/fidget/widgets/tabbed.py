@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Dict, Any
+
+from functools import partial
 
 from fidget.backend.QtWidgets import QVBoxLayout, QTabWidget, QWidget
 from fidget.backend.QtCore import Qt
@@ -12,14 +14,26 @@ from fidget.widgets.mapping import FidgetMapping, NamedTemplate
 # todo document
 
 class FidgetTabs(FidgetMapping):
-    def __init__(self, title, inner_templates: Iterable[NamedTemplate] = None, **kwargs):
+    def __init__(self, title, inner_templates: Iterable[NamedTemplate] = None, lazy: bool = None, **kwargs):
+        """
+        :param title: the title
+        :param inner_templates: an iterable of name-templates to act as key-value pairs
+        :param lazy: whether to only create each tab's Fidget when the tab is first shown. Until then, the tab's value
+            is that of a headless Fidget of the same template, which is the value the tab's widgets would start with
+            (or the value last filled into the tab), so the value of a lazy FidgetTabs is the same as an eager one's.
+        :param kwargs: forwarded to FidgetMapping
+        """
         super().__init__(title, inner_templates, **kwargs)
         self.tabbed: QTabWidget = None
         self.summary_layout = None
+        self.lazy = self.resolve_param('lazy', lazy)
+        # the values filled into tabs that weren't created yet, by name
+        self._pending_fills: Dict[str, Any] = {}
 
         self.init_ui()
 
     INNER_TEMPLATES: Iterable[NamedTemplate] = None
+    LAZY = False
 
     def init_ui(self):
         super().init_ui()
@@ -29,9 +43,14 @@ class FidgetTabs(FidgetMapping):
         self.tabbed = QTabWidget()
         self.summary_layout = QVBoxLayout()
 
-        for name, inner in self.make_inners().items():
-            inner.on_change.connect(self.change_value)
-            self.tabbed.addTab(inner, name)
+        if self.lazy:
+            for name, inner in self._make_lazy_inners().items():
+                # tabs that weren't created yet get a placeholder page
+                self.tabbed.addTab(QWidget() if inner.is_headless else inner, name)
+            self.tabbed.currentChanged.connect(self._tab_changed)
+        else:
+            for name, inner in self.make_inners().items():
+                self.tabbed.addTab(inner, name)
 
         with self.setup_provided(self.summary_layout):
             pass
@@ -47,7 +66,71 @@ class FidgetTabs(FidgetMapping):
 
         return layout
 
+    def _make_lazy_inners(self):
+        """
+        create the first tab's Fidget, and headless stand-ins for all the others. Unfilled stand-ins parse to their
+        template's default value (see Fidget.parse_headless_default), filled stand-ins to the value the tab's widgets
+        would hold.
+        """
+        assert self.inners is None, 'inners is already constructed!'
+        if not self.inner_templates:
+            raise ValueError('at least one inner fidget must be provided')
+
+        self.inners = {}
+        for i, (name, template) in enumerate(self.inner_templates.items()):
+            if i:
+                stand_in = self.inners[name] = template.headless()
+                stand_in.add_headless_change_listener(partial(self._inner_changed, name))
+            else:
+                self.inners[name] = self._make_tab_inner(name)
+
+        self.setFocusProxy(
+            next(iter(self.inners.values()))
+        )
+        return self.inners
+
+    def _make_tab_inner(self, name):
+        inner = self.inner_templates[name]()
+        inner.on_change.connect(partial(self._inner_changed, name))
+        return inner
+
+    def _tab_changed(self, index):
+        if index >= len(self.inners):
+            # the summary tab
+            return
+        name = self.tabbed.tabText(index)
+        if not self.inners[name].is_headless:
+            return
+
+        placeholder = self.tabbed.widget(index)
+        inner = self._make_tab_inner(name)
+        if name in self._pending_fills:
+            inner.fill_value(self._pending_fills.pop(name))
+        self.inners[name] = inner
+
+        # swapping the pages changes the current tab, so we block the signal while doing so
+        self.tabbed.blockSignals(True)
+        self.tabbed.insertTab(index, inner, name)
+        self.tabbed.removeTab(index + 1)
+        self.tabbed.setCurrentIndex(index)
+        self.tabbed.blockSignals(False)
+        placeholder.deleteLater()
+
+        # the adapters of the stand-in are no longer the tab's
+        self.invalidate_plaintext_adapters()
+        self._inner_changed(name)
+
+    def _fill(self, res):
+        for (k, v), subwidget in self.result_zip_subwidget(res, self.inners):
+            if subwidget.is_headless:
+                # the stand-in holds the value until the tab is created, and is then filled with it
+                self._pending_fills[k] = v
+                subwidget.fill_value(v)
+            else:
+                subwidget.fill(v)
+
     def indication_changed(self, value):
+        # the value (and so the icon) of tabs that weren't created yet is that of their stand-ins
         if self.summary_layout:
             icon = ok_icon if value.is_ok() else error_icon
             self.tabbed.setTabIcon(len(self.inners), icon())
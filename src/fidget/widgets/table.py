@@ -1,9 +1,9 @@
-from typing import TypeVar, Generic, List, Iterable, Callable, NamedTuple, Type
+from typing import TypeVar, Generic, List, Iterable, Callable, NamedTuple, Type, Optional, Set, Dict, Tuple
 
 from itertools import chain
+from functools import partial
 from io import StringIO
 import csv
-from collections import namedtuple
 
 from fidget.core.plaintext_adapter import high_priority
 
@@ -15,13 +15,13 @@ from fidget.backend.Resources import add_row_below_icon, add_row_above_icon, del
 
 from fidget.core import TemplateLike, Fidget, FidgetTemplate, ParseError, ValidationError, \
     inner_plaintext_printer, inner_plaintext_parser, json_parser, PlaintextPrintError, PlaintextParseError, json_printer
-from fidget.core.__util__ import first_valid, update
+from fidget.core.__util__ import update, mask
 
 from fidget.widgets.idiomatic_inner import MultiFidgetWrapper
 from fidget.widgets.user_util import FidgetInt
 from fidget.widgets.confirmer import FidgetQuestion
 from fidget.widgets.__util__ import only_valid, last_focus_proxy, repeat_last, valid_between, CountBounds, \
-    table_printer, to_identifier
+    table_printer, value_namedtuple
 
 T = TypeVar('T')
 
@@ -38,7 +38,7 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
                  row_button_text_func: Callable[[int], str] = None,
                  scrollable=None,
                  **kwargs):
-        self.row_bounds = CountBounds[first_valid(rows=rows, ROWS=self.ROWS, _self=self)]
+        self.row_bounds = CountBounds[self.resolve_param('rows', rows)]
 
         inner_templates = tuple(
             t.template_of() for t in
@@ -48,13 +48,14 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
         super().__init__(title, **kwargs)
 
         self.inner_templates = inner_templates
-        self.row_button_text_func = first_valid(row_button_text_func=row_button_text_func,
-                                                ROW_BUTTON_TEXT_FUNC=self.ROW_BUTTON_TEXT_FUNC, _self=self)
+        self.row_button_text_func = self.resolve_param('row_button_text_func', row_button_text_func)
 
         self.grid_layout: QGridLayout = None
         self.inners: List[List[Fidget[T]]] = None  # first row, then column, self.inners[row][column]
         self.col_labels: List[QLabel[T]] = None
         self.row_btns: List[QPushButton[T]] = None
+        # the menu of the row buttons, shared by all of them and created on first click
+        self.row_menu: QMenu = None
 
         self.row_offset = 1
         self.col_offset = None
@@ -64,6 +65,12 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
 
         self.value_type: Type[NamedTuple] = None
 
+        # the results of the last successful parse and validation, and the inners that changed since
+        self._last_parsed: Optional[List[NamedTuple]] = None
+        self._last_validated: Optional[List[NamedTuple]] = None
+        self._dirty_inners: Set[Fidget] = set()
+        self._inner_positions: Dict[Fidget, Tuple[int, int]] = None
+
         self.init_ui(layout_cls=layout_cls, scrollable=scrollable)
 
     INNER_TEMPLATES: Iterable[FidgetTemplate[T]] = None
@@ -74,10 +81,10 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
 
     def init_ui(self, layout_cls=None, scrollable=None):
         super().init_ui()
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         owner = self
-        scrollable = first_valid(scrollable=scrollable, SCROLLABLE=self.SCROLLABLE, _self=self)
+        scrollable = self.resolve_param('scrollable', scrollable)
 
         owner_layout = QVBoxLayout()
         owner.setLayout(owner_layout)
@@ -111,24 +118,18 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
         with self.setup_provided(master_layout, exclude=exclude), self.suppress_update(call_on_exit=False):
             self.grid_layout = QGridLayout()
 
-            field_names = []
-            for i, column_template in enumerate(self.inner_templates):
-                title = column_template.title or '_' + str(i)
+            for i, title in enumerate(self._field_titles()):
                 label = QLabel(title)
-                field_names.append(title)
                 self.col_labels.append(label)
                 self.grid_layout.addWidget(label, 0, i + self.col_offset)
 
-            self.column_count = len(self.inner_templates)
+            self._make_value_type()
 
             for i in range(self.row_bounds.initial):
                 self.add_row(i)
 
             master_layout.addLayout(self.grid_layout)
 
-        self.value_type = namedtuple(to_identifier(self.title), (to_identifier(i.title) for i in self.inners),
-                                     rename=True)
-
         if title_in_grid and self.title_label:
             self.grid_layout.addWidget(self.title_label, 0, 0)
 
@@ -137,7 +138,25 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
 
         return master_layout
 
+    def init_headless(self):
+        super().init_headless()
+        # all the rows are of the same templates, so a single row of headless inners serves as all of them
+        self.inners = [[t.headless() for t in self.inner_templates]]
+        for inner in self.inners[0]:
+            inner.add_headless_change_listener(self.change_value)
+        self._make_value_type()
+        self.row_count = self.row_bounds.initial
+
+    def _field_titles(self):
+        return [column_template.title or '_' + str(i) for i, column_template in enumerate(self.inner_templates)]
+
+    def _make_value_type(self):
+        self.column_count = len(self.inner_templates)
+        self.value_type = value_namedtuple(self.title, self._field_titles())
+
     def add_row(self, row):
+        self._structure_changed()
+
         # make room
         for row_to_move in range(self.row_count - 1, row - 1, -1):
             for col, widget in enumerate(self.inners[row_to_move]):
@@ -162,80 +181,60 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
     def row_btn(self, row_index):
         ret = QPushButton(self.row_button_text_func(row_index))
         ret.setFocusPolicy(Qt.ClickFocus)
-        menu = QMenu(ret)
-
-        def add_top():
-            self.add_row(row_index)
-            self.apply_matrix()
+        ret.clicked.connect(partial(self._exec_row_menu, row_index))
+        return ret
 
-        def add_many_top():
-            question = FidgetQuestion(
-                FidgetInt('# of rows to add', validation_func=valid_between(1,
-                                                                            None if self.row_bounds.max is None else (
-                                                                                    self.row_bounds.max - self.row_count)
-                                                                            )),
-                cancel_value=None
-            )
-            response = question.exec_()
-            if not response.is_ok():
-                return
-            value = response.value
-            if not value:
-                return
-            for _ in range(value):
-                self.add_row(row_index)
-            self.apply_matrix()
+    def _exec_row_menu(self, row_index):
+        """
+        show the menu of a row button, the menu is shared by all the row buttons and is populated for the row on
+        every click
+        """
+        if not self.row_menu:
+            self.row_menu = QMenu(self)
+        menu = self.row_menu
+        menu.clear()
+
+        can_add = self.row_bounds.in_bounds(self.row_count + 1)
+        can_del = self.row_bounds.in_bounds(self.row_count - 1)
+
+        menu.addAction(add_row_above_icon(), 'add row above', partial(self._add_rows, row_index)) \
+            .setEnabled(can_add)
+        menu.addAction('add rows above', partial(self._add_rows, row_index, ask=True)).setEnabled(can_add)
+        menu.addAction(add_row_below_icon(), 'add row below', partial(self._add_rows, row_index + 1)) \
+            .setEnabled(can_add)
+        menu.addAction('add rows below', partial(self._add_rows, row_index + 1, ask=True)).setEnabled(can_add)
+        # todo delete many?
+        menu.addAction(del_row_icon(), 'delete row', partial(self._del_rows, row_index)).setEnabled(can_del)
 
-        def add_bottom():
-            self.add_row(row_index + 1)
-            self.apply_matrix()
+        menu.exec_(QCursor.pos())
 
-        def add_many_bottom():
+    def _add_rows(self, row_index, ask=False):
+        if ask:
             question = FidgetQuestion(
-                FidgetInt('# of rows to add', validation_func=valid_between(1,
-                                                                            None if self.row_bounds.max is None else (
-                                                                                    self.row_bounds.max - self.row_count)
-                                                                            )),
+                FidgetInt('# of rows to add',
+                          validation_func=valid_between(1, None if self.row_bounds.max is None else (
+                                  self.row_bounds.max - self.row_count))),
                 cancel_value=None
             )
             response = question.exec_()
             if not response.is_ok():
                 return
-            value = response.value
-            if not value:
+            count = response.value
+            if not count:
                 return
-            for _ in range(value):
-                self.add_row(row_index + 1)
-            self.apply_matrix()
-
-        # todo delete many?
-        def del_():
-            self.del_row(row_index)
-            self.apply_matrix()
-
-        ret.add_top_action = menu.addAction(add_row_above_icon(), 'add row above', add_top)
-        ret.add_top_action.setEnabled(False)
-
-        ret.add_many_top_action = menu.addAction('add rows above', add_many_top)
-        ret.add_many_top_action.setEnabled(False)
-
-        ret.add_bottom_action = menu.addAction(add_row_below_icon(), 'add row below',
-                                               add_bottom)
-        ret.add_bottom_action.setEnabled(False)
-
-        ret.add_many_bottom_action = menu.addAction('add rows below', add_many_bottom)
-        ret.add_many_bottom_action.setEnabled(False)
-
-        ret.del_action = menu.addAction(del_row_icon(), 'delete row', del_)
-        ret.del_action.setEnabled(False)
-
-        @ret.clicked.connect
-        def _(a):
-            menu.exec_(QCursor.pos())
+        else:
+            count = 1
+        for _ in range(count):
+            self.add_row(row_index)
+        self.apply_matrix()
 
-        return ret
+    def _del_rows(self, row_index):
+        self.del_row(row_index)
+        self.apply_matrix()
 
     def del_row(self, row):
+        self._structure_changed()
+
         # clear the the row
         for widget in self.inners[row]:
             widget.hide()
@@ -269,24 +268,43 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
                 self.setTabOrder(prev, inner)
                 prev = inner
 
-        can_add_row = self.row_bounds.in_bounds(self.row_count + 1)
-        can_del_row = self.row_bounds.in_bounds(self.row_count - 1)
-        for btn in self.row_btns:
-            btn.add_top_action.setEnabled(can_add_row)
-            btn.add_many_top_action.setEnabled(can_add_row)
-            btn.add_bottom_action.setEnabled(can_add_row)
-            btn.add_many_bottom_action.setEnabled(can_add_row)
-            btn.del_action.setEnabled(can_del_row)
-
         self.change_value()
 
     def _make_inner(self, column_number):
         ret: Fidget[T] = self.inner_templates[column_number]()
-        ret.on_change.connect(self.change_value)
+        ret.on_change.connect(partial(self._inner_changed, ret))
 
         return ret
 
+    def _inner_changed(self, inner):
+        self._dirty_inners.add(inner)
+        self.change_value()
+
+    def _structure_changed(self):
+        """
+        discard the previous results, since the inners have moved
+        """
+        self._last_parsed = self._last_validated = self._inner_positions = None
+
+    def parse_headless_default(self):
+        # all the rows hold the default values of the single row of headless inners
+        if not self.row_count:
+            return []
+        row = []
+        for field_name, inner in zip(self.value_type._fields, self.inners[0]):
+            try:
+                row.append(inner.maybe_parse())
+            except ParseError as e:
+                raise ParseError(f'error parsing 0[{field_name}]', offender=inner) from e
+        row = self.value_type._make(row)
+        return [row] * self.row_count
+
     def parse(self):
+        # the last result is kept for the next parse, so callers only ever get copies of it. The rows are immutable,
+        # so they are shared.
+        if self._last_parsed is not None:
+            return list(self._patch_last_parsed())
+
         ret = []
         for i, inner_row in enumerate(self.inners):
             row = []
@@ -296,15 +314,61 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
                 except ParseError as e:
                     raise ParseError(f'error parsing {i}[{field_name}]', offender=inner) from e
             ret.append(self.value_type._make(row))
+        self._last_parsed = ret
+        self._dirty_inners.clear()
+        return list(ret)
+
+    def _patch_last_parsed(self):
+        """
+        re-parse only the inners that changed since the last parse, re-making only their rows and sharing the rest
+        """
+        if not self._dirty_inners:
+            return self._last_parsed
+
+        if self._inner_positions is None:
+            self._inner_positions = {
+                inner: (i, j) for (i, row) in enumerate(self.inners) for (j, inner) in enumerate(row)
+            }
+
+        ret = list(self._last_parsed)
+        patched_rows = {}
+        for inner in self._dirty_inners:
+            pos = self._inner_positions.get(inner)
+            if pos is None:
+                # the inner has been removed
+                continue
+            i, j = pos
+            row = patched_rows.get(i)
+            if row is None:
+                row = patched_rows[i] = list(ret[i])
+            try:
+                row[j] = inner.maybe_parse()
+            except ParseError as e:
+                raise ParseError(f'error parsing {i}[{self.value_type._fields[j]}]', offender=inner) from e
+        for i, row in patched_rows.items():
+            ret[i] = self.value_type._make(row)
+        self._last_parsed = ret
+        self._dirty_inners.clear()
         return ret
 
     def validate(self, value: List[List[T]]):
-        for i, (inner_row, v_row) in enumerate(zip(self.inners, value)):
+        if not self.row_bounds.in_bounds(len(value)):
+            raise ValidationError(f'row number {len(value)} is out of bounds', offender=self)
+
+        prev = self._last_validated
+        for i, (inner_row, v_row) in enumerate(zip(repeat_last(self.inners), value)):
+            if len(v_row) != self.column_count:
+                raise ValidationError(f'column number mismatch {len(v_row)} in row {i} (expected {self.column_count})',
+                                      offender=self)
+            if prev is not None and i < len(prev) and prev[i] is v_row:
+                # this row was already validated
+                continue
             for field_name, (inner, v) in zip(self.value_type._fields, zip(inner_row, v_row)):
                 try:
                     inner.maybe_validate(v)
                 except ValidationError as e:
                     raise ValidationError(f'error validating {i}[{field_name}]', offender=inner) from e
+        self._last_validated = value
 
     def fill(self, v):
         rows = len(v)
@@ -326,6 +390,10 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
         if same_dims < 1:
             self.apply_matrix()
 
+    def fill_headless(self, v):
+        self.row_count = len(v)
+        super().fill_headless([self.value_type._make(row) for row in v])
+
     # todo allow csv dialects
     @inner_plaintext_parser
     def from_csv(self, v):
@@ -415,7 +483,7 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
         size = self.row_count * self.column_count
         i = rec_iter(v)
         ret = []
-        for row_num, inners_row in enumerate(self.inners):
+        for row_num, inners_row in zip(range(self.row_count), repeat_last(self.inners)):
             ret_row = []
             for col_num, inner in enumerate(inners_row):
                 try:
@@ -447,11 +515,11 @@ class FidgetTable(Generic[T], MultiFidgetWrapper[object, List[NamedTuple]]):
 
     def plaintext_parsers(self):
         yield from super().plaintext_parsers()
-        yield maks(self.from_json_reshape, __explicit__=not self.is_constant_size)
+        yield mask(self.from_json_reshape, __explicit__=not self.is_constant_size)
 
     def string_matrix(self, v):
         ret = []
-        for row_num, (row, inners_row) in enumerate(zip(v, self.inners)):
+        for row_num, (row, inners_row) in enumerate(zip(v, repeat_last(self.inners))):
             ret_row = []
             for col_num, (e, inner) in enumerate(zip(row, inners_row)):
                 try:
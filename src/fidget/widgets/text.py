@@ -1,7 +1,6 @@
 from typing import Type
 
 from fidget.backend.QtWidgets import QPlainTextEdit, QHBoxLayout
-from fidget.core.__util__ import first_valid
 from fidget.widgets.rawstring import FidgetRawString
 
 
@@ -19,7 +18,7 @@ class FidgetPlainText(FidgetRawString):
                  **kwargs):
         super().__init__(title, **kwargs)
 
-        placeholder = first_valid(placeholder=placeholder, PLACEHOLDER=self.PLACEHOLDER, _self = self)
+        placeholder = self.resolve_param('placeholder', placeholder)
 
         self.edit: QPlainTextEdit = None
 
@@ -32,7 +31,7 @@ class FidgetPlainText(FidgetRawString):
         layout = QHBoxLayout(self)
 
         with self.setup_provided(layout):
-            edit_cls = first_valid(edit_cls=edit_cls, EDIT_CLS=self.EDIT_CLS, _self=self)
+            edit_cls = self.resolve_param('edit_cls', edit_cls)
             self.edit = edit_cls()
             if placeholder:
                 self.edit.setPlaceholderText(self.title)
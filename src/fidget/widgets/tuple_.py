@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from collections import namedtuple
 from typing import Type, Iterable, Tuple, NamedTuple
 
 from fidget.backend.QtWidgets import QVBoxLayout, QFrame, QBoxLayout
 from fidget.core import PlaintextPrintError, PlaintextParseError, TemplateLike
-from fidget.core.__util__ import first_valid
-from fidget.widgets.__util__ import to_identifier
+from fidget.widgets.__util__ import value_namedtuple
 from fidget.widgets.compound import FidgetCompound
 
 
@@ -42,7 +40,9 @@ class FidgetTuple(FidgetCompound[tuple]):
         return inner_templates
 
     @classmethod
-    def _make_inners(cls, inner_templates):
+    def _make_inners(cls, inner_templates, headless=False):
+        if headless:
+            return [i.headless() for i in inner_templates]
         return [i() for i in inner_templates]
 
     @classmethod
@@ -61,6 +61,14 @@ class FidgetTuple(FidgetCompound[tuple]):
     def insert_result(cls, res, key, value):
         res.append(value)
 
+    @classmethod
+    def copy_result(cls, res):
+        return list(res)
+
+    @classmethod
+    def patch_result(cls, res, key, value):
+        res[key] = value
+
     @classmethod
     def result_zip_subwidget(cls, res, inners):
         return zip(enumerate(res), inners)
@@ -68,7 +76,7 @@ class FidgetTuple(FidgetCompound[tuple]):
     def init_ui(self, frame_style=None, layout_cls: Type[QBoxLayout] = None):
         super().init_ui()
 
-        layout_cls = first_valid(layout_cls=layout_cls, LAYOUT_CLS=self.LAYOUT_CLS, _self=self)
+        layout_cls = self.resolve_param('layout_cls', layout_cls)
 
         master_layout = layout_cls(self)
 
@@ -81,15 +89,20 @@ class FidgetTuple(FidgetCompound[tuple]):
         with self.setup_provided(master_layout, layout):
             for inner in self.make_inners():
                 layout.addWidget(inner)
-            self.value_type = namedtuple(to_identifier(self.title), (to_identifier(i.title) for i in self.inners),
-                                         rename=True)
-
+            self._make_value_type()
 
         frame.setLayout(layout)
         master_layout.addWidget(frame)
 
         return master_layout
 
+    def init_headless(self):
+        super().init_headless()
+        self._make_value_type()
+
+    def _make_value_type(self):
+        self.value_type = value_namedtuple(self.title, (i.title for i in self.inners))
+
     def parse(self):
         seq = super().parse()
         return self.value_type._make(seq)
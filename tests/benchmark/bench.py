@@ -0,0 +1,378 @@
+"""
+Offscreen benchmarks of Fidget construction, keystroke latency, bulk filling, plaintext round-trips and import
+time.
+
+usage (from the repository root):
+    python -m tests.benchmark.bench [-k filter] [-o results.json] [--baseline [path]] [--threshold 0.25] [--strict]
+        [--save]
+
+Results are written as JSON. Timings are absolute, so they are only comparable between runs on the same machine.
+If a baseline is given (--baseline alone uses tests/benchmark/baseline.json), every benchmark's median time is
+compared against the baseline's, and benchmarks that regressed by more than the threshold (a fraction) are reported.
+Regressions only fail the run (with exit code 1) if --strict is given. Benchmarks that raise are recorded with their
+error, and always fail the run, and a run with errors is never saved as a baseline.
+Like timeit, the garbage collector is disabled while a repetition is timed, since collecting the Qt wrappers kept alive
+by earlier repetitions and benchmarks would otherwise dominate (and randomize) the timings of the larger benchmarks.
+"""
+from typing import Callable, NamedTuple, Dict, Any, List
+
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+from fidget.backend.QtWidgets import QApplication, QLineEdit, QWidget
+from fidget.backend.QtGui import QKeyEvent
+from fidget.backend.QtCore import QEvent, Qt, __backend__
+
+from fidget.core import Fidget
+from fidget.core.__util__ import error_details
+from fidget.widgets import FidgetDict, FidgetMatrix, FidgetInt
+
+DEFAULT_BASELINE = Path(__file__).with_name('baseline.json')
+
+app = QApplication.instance() or QApplication([])
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    """returns the function to time, called once per repetition"""
+    repeat: int
+    self_timed: bool = False
+    """if true, the function returns its own duration in seconds, instead of being timed"""
+
+
+benchmarks: List[Benchmark] = []
+
+
+def benchmark(name: str, repeat: int = 5, self_timed: bool = False):
+    def ret(setup):
+        benchmarks.append(Benchmark(name, setup, repeat, self_timed))
+        return setup
+
+    return ret
+
+
+def scaled(cls, rows, columns=None, **kwargs):
+    """
+    create a subclass of a matrix or table Fidget with constant dimensions
+    """
+    attrs = {'ROWS': (rows, 1, None), 'SCROLLABLE': False, **kwargs}
+    if columns is not None:
+        attrs['COLUMNS'] = (columns, 1, None)
+    return type(cls.__name__, (cls,), attrs)
+
+
+def leaf_edit(fidget: Fidget) -> QLineEdit:
+    ret = fidget.findChild(QLineEdit)
+    if ret is None:
+        raise LookupError(f'{fidget} has no line edit')
+    return ret
+
+
+def keystroke(root: Fidget, edit: QLineEdit):
+    """
+    :return: a function that types a key into edit, and returns once root's indicator is up to date
+    """
+    keys = iter(range(10 ** 9))
+
+    def ret():
+        char = str(next(keys) % 10)
+        QApplication.sendEvent(edit, QKeyEvent(QEvent.KeyPress, Qt.Key_0 + int(char), Qt.NoModifier, char))
+        QApplication.sendEvent(edit, QKeyEvent(QEvent.KeyRelease, Qt.Key_0 + int(char), Qt.NoModifier, char))
+        # flush any coalesced change notifications
+        QApplication.processEvents()
+        root.value()
+
+    return ret
+
+
+# region construction
+def construct(cls_factory, *args):
+    def setup():
+        cls = cls_factory()
+        return lambda: cls(*args)
+
+    return setup
+
+
+def gui_scenario(module_name, attr_name):
+    def ret():
+        module = __import__(f'tests.gui.{module_name}', fromlist=[attr_name])
+        return getattr(module, attr_name)
+
+    return ret
+
+
+benchmark('construct/point', repeat=20)(construct(gui_scenario('point', 'PointWidget'), 'sample'))
+benchmark('construct/dict_', repeat=20)(construct(gui_scenario('dict_', 'PointWidget'), 'sample'))
+benchmark('construct/tabs', repeat=20)(construct(gui_scenario('tabs', 'PointWidget'), 'sample'))
+benchmark('construct/table_200', repeat=3)(
+    construct(lambda: scaled(gui_scenario('table', 'MyTable')(), 200), 'sample'))
+benchmark('construct/matrix_int_50x50', repeat=3)(
+    construct(lambda: scaled(gui_scenario('matrix_int', 'MyMatrix')(), 50, 50)))
+benchmark('construct/matrix_point_50x50', repeat=3)(
+    construct(lambda: scaled(gui_scenario('matrix_point', 'MyMatrix')(), 50, 50)))
+
+
+# endregion
+
+# region keystroke latency
+def nested_dict(outer: int, inner: int):
+    return FidgetDict(
+        'root',
+        [
+            FidgetDict.template(f'group {i}', [FidgetInt.template(f'field {i}.{j}') for j in range(inner)],
+                                make_title=True, make_indicator=True, make_plaintext=False)
+            for i in range(outer)
+        ],
+        make_title=True, make_indicator=True, make_plaintext=True, scrollable=False
+    )
+
+
+@benchmark('keystroke/dict_30x10', repeat=50)
+def _():
+    root = nested_dict(30, 10)
+    root.show()
+    return keystroke(root, leaf_edit(root.inners['group 29'].inners['field 29.9']))
+
+
+@benchmark('keystroke/matrix_30x30', repeat=50)
+def _():
+    root = scaled(FidgetMatrix, 30, 30, MAKE_TITLE=True, MAKE_INDICATOR=True, MAKE_PLAINTEXT=True)(
+        FidgetInt.template('cell'))
+    root.show()
+    return keystroke(root, leaf_edit(root.inners[-1][-1]))
+
+
+@benchmark('keystroke/dict_of_matrix', repeat=50)
+def _():
+    cell = FidgetInt.template('cell')
+    root = FidgetDict('root', [
+        scaled(FidgetMatrix, 10, 10).template(cell, make_title=True, make_indicator=True, make_plaintext=False)
+        for _ in range(5)
+    ], make_title=True, make_indicator=True, make_plaintext=True, scrollable=False)
+    root.show()
+    matrix = list(root.inners.values())[-1]
+    return keystroke(root, leaf_edit(matrix.inners[-1][-1]))
+
+
+# endregion
+
+# region bulk fill
+def int_matrix(rows, columns):
+    return scaled(FidgetMatrix, rows, columns, MAKE_TITLE=True, MAKE_INDICATOR=True, MAKE_PLAINTEXT=True)(
+        FidgetInt.template('cell'))
+
+
+@benchmark('fill/matrix_100x100', repeat=3)
+def _():
+    matrix = int_matrix(100, 100)
+    values = [[(i * 100 + j) for j in range(100)] for i in range(100)]
+    other = [[-v for v in row] for row in values]
+    toggle = iter(range(10 ** 9))
+
+    def ret():
+        matrix.fill_value(values if next(toggle) % 2 else other)
+        matrix.value()
+
+    return ret
+
+
+@benchmark('fill/matrix_from_csv_100x100', repeat=3)
+def _():
+    matrix = int_matrix(100, 100)
+    csv_text = '\n'.join(','.join(str(i * 100 + j) for j in range(100)) for i in range(100))
+
+    def ret():
+        matrix.fill_value(matrix.from_csv(csv_text))
+        matrix.value()
+
+    return ret
+
+
+# endregion
+
+# region plaintext round-trips
+@benchmark('plaintext/dict_roundtrip', repeat=200)
+def _():
+    root = gui_scenario('dict_', 'PointWidget')()('sample')
+    root.fill_value({'X': 1.5, 'Y': -2.0, 'Z': 3.25})
+
+    def ret():
+        text = root.joined_plaintext_printer(root.value().value)
+        root.fill_from_text(text)
+        root.value()
+
+    return ret
+
+
+@benchmark('plaintext/matrix_roundtrip_20x20', repeat=20)
+def _():
+    matrix = int_matrix(20, 20)
+    matrix.fill_value([[i * 20 + j for j in range(20)] for i in range(20)])
+
+    def ret():
+        text = matrix.joined_plaintext_printer(matrix.value().value)
+        matrix.fill_from_text(text)
+        matrix.value()
+
+    return ret
+
+
+# endregion
+
+# region import time
+def import_times(statement: str) -> Dict[str, int]:
+    """
+    :return: the self import time (in microseconds) of every module imported by a new interpreter running statement
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    ret = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, _, name = line[len('import time:'):].split('|')
+        if self_time.strip().isdigit():
+            ret[name.strip()] = int(self_time)
+    return ret
+
+
+def import_time(statement: str):
+    """
+    :return: a setup for a self-timed benchmark of the total import time of the modules imported by statement, not
+        counting the modules imported by the interpreter's startup
+    """
+    def setup():
+        startup = import_times('pass').keys()
+
+        def ret():
+            return sum(t for (m, t) in import_times(statement).items() if m not in startup) / 1e6
+
+        return ret
+
+    return setup
+
+
+benchmark('import/fidget.core', self_timed=True)(import_time('import fidget.core'))
+benchmark('import/fidget.widgets', self_timed=True)(import_time('import fidget.widgets'))
+benchmark('import/one_widget', self_timed=True)(import_time('from fidget.widgets import FidgetInt'))
+benchmark('import/all_widgets', self_timed=True)(import_time('from fidget.widgets import *'))
+
+
+# endregion
+
+
+def run_benchmark(bench: Benchmark) -> Dict[str, Any]:
+    try:
+        func = bench.setup()
+        times = []
+        # the results are kept alive until all the repetitions are done, and are then deleted by Qt
+        results = []
+        gc.collect()
+        for _ in range(bench.repeat):
+            gc.disable()
+            try:
+                start = perf_counter()
+                result = func()
+                elapsed = perf_counter() - start
+            finally:
+                gc.enable()
+            if bench.self_timed:
+                elapsed = result
+            else:
+                results.append(result)
+            times.append(elapsed)
+            QApplication.processEvents()
+        for r in results:
+            if isinstance(r, QWidget):
+                r.deleteLater()
+        del results
+        QApplication.processEvents()
+    except Exception as e:
+        return {'error': error_details(e)}
+    return {'median': median(times), 'min': min(times), 'max': max(times), 'repeat': bench.repeat}
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], threshold: float) \
+        -> List[str]:
+    """
+    :return: descriptions of all the benchmarks that regressed
+    """
+    ret = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or 'median' not in base or 'median' not in result:
+            continue
+        ratio = result['median'] / base['median']
+        if ratio > 1 + threshold:
+            ret.append(f'{name}: {result["median"] * 1e3:.3f}ms vs {base["median"] * 1e3:.3f}ms ({ratio:.2f}x)')
+    return ret
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmark.bench')
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('-o', '--output', default=None, help='write the results to this JSON file')
+    parser.add_argument('--baseline', nargs='?', default=None, const=str(DEFAULT_BASELINE),
+                        help='compare to a baseline JSON file, recorded on the same machine (default file: '
+                             f'{DEFAULT_BASELINE.name})')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='the allowed relative slowdown from the baseline (default: 0.25)')
+    parser.add_argument('--strict', action='store_true', help='exit with code 1 if any benchmark regressed')
+    parser.add_argument('--save', action='store_true',
+                        help='overwrite the baseline (the default baseline if none is given) with the results')
+    args = parser.parse_args(args)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for bench in benchmarks:
+        if args.filter not in bench.name:
+            continue
+        result = results[bench.name] = run_benchmark(bench)
+        if 'error' in result:
+            print(f'{bench.name}: ERROR {result["error"].splitlines()[0]}', file=sys.stderr)
+        else:
+            print(f'{bench.name}: {result["median"] * 1e3:.3f}ms', file=sys.stderr)
+
+    report = {
+        'meta': {'python': platform.python_version(), 'backend': __backend__.__name__,
+                 'platform': platform.platform()},
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    errors = [name for (name, result) in results.items() if 'error' in result]
+    if errors:
+        print(f'{len(errors)} benchmark(s) failed: {", ".join(errors)}', file=sys.stderr)
+    if args.save:
+        if errors:
+            print('not saving a baseline with errors', file=sys.stderr)
+            return 1
+        Path(args.baseline or DEFAULT_BASELINE).write_text(json.dumps(report, indent=2))
+        return 0
+
+    if not args.baseline:
+        return 1 if errors else 0
+    baseline_path = Path(args.baseline)
+    if not baseline_path.exists():
+        print(f'baseline {baseline_path} not found, nothing to compare to', file=sys.stderr)
+        return 1 if errors else 0
+    regressions = compare(results, json.loads(baseline_path.read_text())['results'], args.threshold)
+    for r in regressions:
+        print('REGRESSION ' + r, file=sys.stderr)
+    return 1 if (errors or (regressions and args.strict)) else 0
+
+
+if __name__ == '__main__':
+    exit(main())
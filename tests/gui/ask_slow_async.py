@@ -0,0 +1,21 @@
+from time import sleep
+
+from fidget.core import ValidationError
+
+from fidget.widgets import FidgetInt, FidgetConfirmer, inner_fidget
+
+from tests.gui.__util__ import test_as_main
+
+
+def slow_validation(value):
+    if isinstance(value, int):
+        sleep(1)
+        if value == 0:
+            raise ValidationError('value cannot be 0')
+
+
+@test_as_main(close_on_confirm=True, cancel_value=None, async_validation=True, validation_func=slow_validation)
+class AskInt(FidgetConfirmer):
+    @inner_fidget('sample', help='i am help')
+    class _(FidgetInt):
+        pass
@@ -0,0 +1,18 @@
+from fidget.core import ValidationError
+from fidget.widgets import FidgetInt, FidgetFloat, FidgetLine, FidgetDict, FidgetTuple, FidgetStacked, FidgetOptional
+
+PROVIDED = dict(make_title=True, make_indicator=True, make_plaintext=True)
+
+
+def reject_negative(v):
+    if v < 0:
+        raise ValidationError('value cannot be negative')
+
+
+nested_template = FidgetDict.template('nested', [
+    FidgetTuple.template('pt', [FidgetFloat.template('x', **PROVIDED), FidgetFloat.template('y', **PROVIDED)],
+                         **PROVIDED),
+    FidgetStacked.template('st', [FidgetLine.template('s', **PROVIDED), FidgetInt.template('i', **PROVIDED)],
+                           **PROVIDED),
+    FidgetOptional.template(FidgetInt.template('opt', validation_func=reject_negative, **PROVIDED)),
+], **PROVIDED)
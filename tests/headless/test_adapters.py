@@ -0,0 +1,120 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from functools import partial
+from types import MethodType
+
+from fidget.backend.QtWidgets import QApplication
+
+import fidget.widgets as widgets
+from fidget.core import Fidget, inner_plaintext_parser
+from fidget.core.plaintext_adapter import sort_adapters, high_priority
+from fidget.widgets import FidgetInt, FidgetQuestion, FidgetDict, FidgetStacked, FidgetLine
+
+from tests.headless.__util__ import PROVIDED, nested_template
+
+app = QApplication.instance() or QApplication([])
+
+
+def fidget_classes():
+    for name in widgets.__all__:
+        getattr(widgets, name)
+    stack = [Fidget]
+    seen = set()
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        yield cls
+        stack.extend(cls.__subclasses__())
+
+
+def describe(adapter):
+    """
+    :return: a description of an adapter that is equal for equivalent adapters, since instance adapters (such as
+        closures and partials) are re-created each time they are requested
+    """
+    if isinstance(adapter, partial):
+        return describe(adapter.func), tuple(describe(a) if callable(a) else a for a in adapter.args)
+    if isinstance(adapter, MethodType):
+        return describe(adapter.__func__), id(adapter.__self__)
+    return getattr(adapter, '__qualname__', adapter)
+
+
+def describe_chain(chain):
+    return [(describe(adapter), priority) for (adapter, priority) in chain]
+
+
+def assert_compiled(fidget):
+    assert describe_chain(fidget.sorted_plaintext_parsers()) \
+        == describe_chain(sort_adapters(fidget.plaintext_parsers()))
+    assert describe_chain(fidget.sorted_plaintext_printers()) \
+        == describe_chain(sort_adapters(fidget.plaintext_printers()))
+
+
+def test_class_chains_match_sort_adapters():
+    for cls in fidget_classes():
+        assert cls.sorted_cls_plaintext_parsers() == tuple(sort_adapters(cls.cls_plaintext_parsers())), cls
+        assert cls.sorted_cls_plaintext_printers() == tuple(sort_adapters(cls.cls_plaintext_printers())), cls
+
+
+def test_subclass_adapters_are_compiled():
+    class Sub(FidgetInt):
+        @inner_plaintext_parser
+        @staticmethod
+        def hex_(text):
+            return int(text, 16)
+
+    assert Sub.hex_ in [p for (p, _) in Sub.sorted_cls_plaintext_parsers()]
+    assert Sub.hex_ not in [p for (p, _) in FidgetInt.sorted_cls_plaintext_parsers()]
+    assert Sub.sorted_cls_plaintext_parsers() == tuple(sort_adapters(Sub.cls_plaintext_parsers()))
+
+
+def test_instance_chains_match_sort_adapters():
+    for fidget in (FidgetInt('i', **PROVIDED), nested_template(), nested_template.headless(),
+                   FidgetQuestion(FidgetInt.template('i', **PROVIDED))):
+        assert_compiled(fidget)
+
+
+def test_added_delegate_recompiles_chain():
+    fidget = FidgetInt('i', **PROVIDED)
+    before = fidget.sorted_plaintext_parsers()
+
+    @high_priority
+    def parse_hex(text):
+        return int(text, 16)
+
+    fidget.add_plaintext_parsers_delegate(lambda: [parse_hex])
+    after = fidget.sorted_plaintext_parsers()
+    assert after is not before
+    assert parse_hex in [p for (p, _) in after]
+    assert_compiled(fidget)
+    assert fidget.joined_plaintext_parser('ff') == 255
+
+
+def test_invalidation_reaches_ancestors_and_dependents():
+    root = FidgetDict('root', [FidgetInt.template('a', **PROVIDED)], **PROVIDED)
+    question = FidgetQuestion(FidgetInt.template('i', **PROVIDED))
+    inner = root.inners['a']
+    for fidget in (root, inner, question, question.inner):
+        fidget.sorted_plaintext_parsers()
+
+    inner.invalidate_plaintext_adapters()
+    assert root._sorted_plaintext_parsers is None
+    question.inner.invalidate_plaintext_adapters()
+    assert question._sorted_plaintext_parsers is None
+    for fidget in (root, inner, question, question.inner):
+        assert_compiled(fidget)
+
+
+def test_stacked_page_change_recompiles_chain():
+    stacked = FidgetStacked('st', [FidgetLine.template('s', **PROVIDED), FidgetInt.template('i', **PROVIDED)],
+                            **PROVIDED)
+    stacked.fill_value(FidgetStacked.targeted_fill('s', 'text'))
+    assert_compiled(stacked)
+    before = stacked.sorted_plaintext_parsers()
+    stacked.fill_value(FidgetStacked.targeted_fill('i', 3))
+    assert stacked.sorted_plaintext_parsers() is not before
+    assert_compiled(stacked)
@@ -0,0 +1,56 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import json
+
+from fidget.backend.QtWidgets import QApplication
+
+from fidget.batch import evaluate
+from fidget.widgets import FidgetInt
+
+from tests.headless.__util__ import PROVIDED, nested_template
+
+app = QApplication.instance() or QApplication([])
+
+records = [
+    {'pt': json.dumps(['1', '2']), 'st': 'i:5', 'opt': '3'},
+    {'pt': json.dumps(['0.5', '-1']), 'st': 'hello', 'opt': 'none'},
+    {'pt': json.dumps(['1', '2']), 'st': 'i:5', 'opt': '-3'},
+    {'pt': json.dumps(['1', 'y']), 'st': 'i:5', 'opt': '3'},
+    'not json',
+]
+
+
+def gui_result(text):
+    gui = nested_template()
+    try:
+        gui.fill_from_text(text)
+    except Exception:
+        return False, None
+    value = gui.value()
+    return value.is_ok(), value.details if value.is_ok() else None
+
+
+def test_batch_matches_gui():
+    texts = [r if isinstance(r, str) else json.dumps(r) for r in records]
+    for workers in (0, 2):
+        results = list(evaluate(nested_template, texts, workers=workers, chunk_size=2))
+        assert [r['index'] for r in results] == list(range(len(texts)))
+        for text, result in zip(texts, results):
+            ok, details = gui_result(text)
+            assert result['ok'] == ok, text
+            if ok:
+                assert result['value'] == details, text
+
+
+def raise_on_zero(v):
+    if v == 0:
+        raise ZeroDivisionError('not a validation error')
+
+
+def test_batch_reports_unexpected_errors():
+    template = FidgetInt.template('i', validation_func=raise_on_zero, **PROVIDED)
+    results = list(evaluate(template, ['1', '0', '2'], workers=0))
+    assert [r['ok'] for r in results] == [True, False, True]
+    assert results[1]['error'] == 'ZeroDivisionError'
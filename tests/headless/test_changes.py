@@ -0,0 +1,91 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fidget.backend.QtWidgets import QApplication
+
+from fidget.widgets import FidgetInt, FidgetDict, FidgetMatrix
+
+from tests.headless.__util__ import PROVIDED
+
+app = QApplication.instance() or QApplication([])
+
+
+def int_dict(**kwargs):
+    return FidgetDict('root', [FidgetInt.template(name, **PROVIDED) for name in 'abc'], **PROVIDED, **kwargs)
+
+
+def count_changes(fidget):
+    ret = []
+    fidget.on_change.connect(lambda: ret.append(None))
+    return ret
+
+
+def test_scheduler_coalesces_fills():
+    root = int_dict(coalesce_changes=True)
+    changes = count_changes(root)
+    for i in range(10):
+        root.fill_value({'a': i, 'b': i, 'c': i})
+    assert not changes
+    QApplication.processEvents()
+    assert len(changes) == 1
+    assert root.value().value == {'a': 9, 'b': 9, 'c': 9}
+
+
+def test_scheduler_coalesces_inner_edits():
+    root = int_dict(coalesce_changes=True)
+    root.fill_value({'a': 0, 'b': 0, 'c': 0})
+    QApplication.processEvents()
+    changes = count_changes(root)
+    inner_changes = count_changes(root.inners['a'])
+    for i in range(10):
+        root.inners['a'].fill_value(i)
+        root.inners['b'].fill_value(-i)
+    QApplication.processEvents()
+    assert len(changes) == 1
+    assert len(inner_changes) == 1
+    assert root.value().value == {'a': 9, 'b': -9, 'c': 0}
+
+
+def test_value_reads_unflushed_fills():
+    root = int_dict(coalesce_changes=True)
+    root.fill_value({'a': 1, 'b': 2, 'c': 3})
+    assert root.value().value == {'a': 1, 'b': 2, 'c': 3}
+
+
+def test_batch_fill_emits_once():
+    root = int_dict()
+    changes = count_changes(root)
+    with root.batch():
+        root.fill_value({'a': 1, 'b': 2, 'c': 3})
+        root.inners['c'].fill_value(4)
+        assert not changes
+    assert len(changes) == 1
+    assert root.value().value == {'a': 1, 'b': 2, 'c': 4}
+
+
+def test_batch_matrix_fill_emits_once():
+    matrix = FidgetMatrix(FidgetInt.template('i', **PROVIDED), rows=(3, 1, None), columns=(3, 1, None),
+                          scrollable=False, **PROVIDED)
+    changes = count_changes(matrix)
+    with matrix.batch():
+        matrix.fill_value([[i * 3 + j for j in range(3)] for i in range(3)])
+        for row in matrix.inners:
+            for inner in row:
+                inner.fill_value(7)
+    assert len(changes) == 1
+    assert matrix.value().value == [[7] * 3] * 3
+
+
+def test_nested_batches_flush_on_outermost_exit():
+    root = int_dict()
+    changes = count_changes(root)
+    with root.batch():
+        with root.inners['a'].batch():
+            root.inners['a'].fill_value(1)
+        assert not changes
+        with root.batch():
+            root.inners['b'].fill_value(2)
+        assert not changes
+    assert len(changes) == 1
+    assert root._change_scheduler is None
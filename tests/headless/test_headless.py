@@ -0,0 +1,63 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fidget.backend.QtWidgets import QApplication
+
+from fidget.widgets import FidgetInt, FidgetQuestion, FidgetMatrix, FidgetTabs, FidgetStacked
+
+from tests.headless.__util__ import PROVIDED, reject_negative, nested_template
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_fill_matches_gui():
+    text = '{"pt": "[\\"1\\", \\"2\\"]", "st": "i:5", "opt": "3"}'
+    gui = nested_template()
+    gui.fill_from_text(text)
+    headless = nested_template.headless()
+    headless.fill_from_text(text)
+
+    gui_value = gui.value()
+    headless_value = headless.value()
+    assert gui_value.is_ok() and headless_value.is_ok()
+    assert headless_value.value == gui_value.value
+    assert type(headless_value.value['pt']) is type(gui_value.value['pt'])
+
+
+def test_fill_twice_revalidates_inner():
+    template = FidgetQuestion.template(FidgetInt.template('i', validation_func=reject_negative, **PROVIDED))
+    question = template.headless()
+    question.fill_value(2)
+    assert question.value().is_ok()
+    question.fill_value(-3)
+    assert not question.value().is_ok()
+
+
+def test_matrix_cells_are_validated():
+    template = FidgetMatrix.template(FidgetInt.template('i', validation_func=reject_negative, **PROVIDED),
+                                     rows=(1, 1, None), columns=(2, 1, None), **PROVIDED)
+    matrix = template.headless()
+    matrix.fill_value([[1, 2]])
+    assert matrix.value().is_ok()
+    matrix.fill_value([[1, -2]])
+    assert not matrix.value().is_ok()
+
+
+def test_lazy_tabs_match_eager_tabs():
+    inner_templates = [('first', nested_template), ('second', nested_template)]
+    value = {
+        'first': {'pt': (1, 2), 'st': FidgetStacked.targeted_fill('i', 5), 'opt': 3},
+        'second': {'pt': (3, 4), 'st': 'text', 'opt': None},
+    }
+    eager = FidgetTabs('tabs', inner_templates, **PROVIDED)
+    lazy = FidgetTabs('tabs', inner_templates, lazy=True, **PROVIDED)
+    eager.fill_value(value)
+    lazy.fill_value(value)
+    assert lazy.inners['second'].is_headless
+    assert lazy.value().value == eager.value().value
+    assert type(lazy.value().value['second']['pt']) is type(eager.value().value['second']['pt'])
+
+    lazy.tabbed.setCurrentIndex(1)
+    assert not lazy.inners['second'].is_headless
+    assert lazy.value().value == eager.value().value
@@ -0,0 +1,250 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fidget.backend.QtWidgets import QApplication, QLineEdit, QFileDialog
+from fidget.backend.QtCore import QTimer
+
+from fidget.core.fidget import PlaintextEditWidget
+from fidget.widgets import FidgetInt, FidgetDict, FidgetStacked, FidgetLine, FidgetFloat, FidgetTabs, FidgetMatrix, \
+    FidgetTable, FidgetFilePath, FidgetDirPath, FidgetMinimal, FidgetQuestion
+from fidget.widgets.__util__ import shared_file_dialog, RememberingFileDialog
+
+from tests.headless.__util__ import PROVIDED
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_plaintext_dialog_is_shared_per_window():
+    window = FidgetDict('root', [FidgetInt.template('a', **PROVIDED), FidgetInt.template('b', **PROVIDED)],
+                        **PROVIDED)
+    a, b = window.inners['a'], window.inners['b']
+    a.fill_value(1)
+    b.fill_value(2)
+
+    a._plaintext_btn_click()
+    dialog = a._plaintext_widget
+    assert dialog.owner is a
+    b._plaintext_btn_click()
+    assert b._plaintext_widget is dialog
+    assert dialog.owner is b
+    assert dialog.current_value == 2
+    window._plaintext_btn_click()
+    assert window._plaintext_widget is dialog
+    assert len(window.findChildren(PlaintextEditWidget)) == 1
+
+    other = FidgetInt('c', **PROVIDED)
+    other._plaintext_btn_click()
+    assert other._plaintext_widget is not dialog
+    dialog.hide()
+    other._plaintext_widget.hide()
+
+
+def stacked_options():
+    return [FidgetInt.template('i', **PROVIDED), FidgetFloat.template('f', **PROVIDED),
+            FidgetLine.template('s', **PROVIDED)]
+
+
+def test_lazy_stacked_builds_options_on_selection():
+    stacked = FidgetStacked('st', stacked_options(), lazy=True, **PROVIDED)
+    assert list(stacked.inners) == ['i']
+
+    stacked.selector.fill_value(2)
+    assert list(stacked.inners) == ['i', 's']
+    assert stacked.current_subwidget() is stacked.inners['s']
+    assert stacked.stacked.currentWidget() is stacked.inners['s']
+
+
+def test_lazy_stacked_builds_options_on_fill():
+    stacked = FidgetStacked('st', stacked_options(), lazy=True, **PROVIDED)
+    stacked.fill_value(FidgetStacked.targeted_fill('s', 'text'))
+    assert list(stacked.inners) == ['i', 's']
+    assert stacked.value().value == 'text'
+
+    # the parsers of options that weren't built yet are available
+    stacked.fill_value(FidgetStacked.targeted_fill('i', 0))
+    stacked.fill_from_text('1.5')
+    assert list(stacked.inners) == ['i', 's', 'f']
+    assert stacked.value().value == 1.5
+
+
+def test_lazy_stacked_matches_eager():
+    eager = FidgetStacked('st', stacked_options(), **PROVIDED)
+    lazy = FidgetStacked('st', stacked_options(), lazy=True, **PROVIDED)
+    for fidget in (eager, lazy):
+        fidget.fill_value(FidgetStacked.targeted_fill('f', 7.5))
+    assert lazy.value().value == eager.value().value
+    assert [p.__name__ for p in lazy.plaintext_parsers()] == [p.__name__ for p in eager.plaintext_parsers()]
+
+
+def test_eviction_keeps_current_page():
+    stacked = FidgetStacked('st', stacked_options(), max_pages=1, **PROVIDED)
+    stacked.fill_value(FidgetStacked.targeted_fill('i', 3))
+    stacked.fill_value(FidgetStacked.targeted_fill('f', 1.5))
+    assert list(stacked.inners) == ['f']
+    assert stacked.value().value == 1.5
+
+    stacked.selector.fill_value(0)
+    # the evicted page is re-created with its last value
+    assert list(stacked.inners) == ['i']
+    assert stacked.current_subwidget() is stacked.inners['i']
+    assert stacked.value().value == 3
+
+
+def test_eviction_evicts_least_recently_selected():
+    stacked = FidgetStacked('st', stacked_options(), max_pages=2, **PROVIDED)
+    for name, value in (('i', 1), ('f', 2.5), ('i', 4), ('s', 'text')):
+        stacked.fill_value(FidgetStacked.targeted_fill(name, value))
+    assert sorted(stacked.inners) == ['i', 's']
+    stacked.selector.fill_value(1)
+    assert sorted(stacked.inners) == ['f', 's']
+    assert stacked.value().value == 2.5
+
+
+def test_eviction_keeps_invalid_pages():
+    stacked = FidgetStacked('st', stacked_options(), max_pages=1, **PROVIDED)
+    stacked.inners['i'].findChild(QLineEdit).setText('not an int')
+    stacked.fill_value(FidgetStacked.targeted_fill('f', 1.5))
+    assert sorted(stacked.inners) == ['f', 'i']
+    stacked.selector.fill_value(0)
+    assert stacked.inners['i'].findChild(QLineEdit).text() == 'not an int'
+
+
+def lazy_tabs():
+    return FidgetTabs('tabs', [FidgetInt.template('a', **PROVIDED), FidgetInt.template('b', **PROVIDED),
+                               FidgetLine.template('c', **PROVIDED)], lazy=True, **PROVIDED)
+
+
+def test_lazy_tab_is_built_when_shown():
+    tabs = lazy_tabs()
+    assert not tabs.inners['a'].is_headless
+    assert tabs.inners['b'].is_headless and tabs.inners['c'].is_headless
+
+    tabs.tabbed.setCurrentIndex(2)
+    inner = tabs.inners['c']
+    assert not inner.is_headless
+    assert tabs.tabbed.widget(2) is inner
+    assert tabs.tabbed.currentIndex() == 2
+    assert tabs.inners['b'].is_headless
+
+
+def test_lazy_tab_fill_is_applied_when_built():
+    tabs = lazy_tabs()
+    tabs.fill_value({'a': 1, 'b': 2, 'c': 'text'})
+    assert tabs.inners['b'].is_headless
+    assert tabs.value().value == {'a': 1, 'b': 2, 'c': 'text'}
+
+    tabs.tabbed.setCurrentIndex(1)
+    inner = tabs.inners['b']
+    assert not inner.is_headless
+    assert inner.findChild(QLineEdit).text() == '2'
+    assert tabs.value().value == {'a': 1, 'b': 2, 'c': 'text'}
+
+
+def test_lazy_tab_edit_updates_value():
+    tabs = lazy_tabs()
+    tabs.fill_value({'a': 1, 'b': 2, 'c': 'text'})
+    tabs.tabbed.setCurrentIndex(1)
+    tabs.inners['b'].findChild(QLineEdit).setText('5')
+    assert tabs.value().value['b'] == 5
+
+
+def click_menu(button, menu_attr, owner, action_text=None):
+    """
+    click a grid button, and trigger an action of the menu it opens (or just close the menu)
+    :return: the menu, and the enablement of its actions by their text
+    """
+    ret = {}
+
+    def act():
+        menu = getattr(owner, menu_attr)
+        ret['menu'] = menu
+        ret['enabled'] = {a.text(): a.isEnabled() for a in menu.actions()}
+        if action_text:
+            next(a for a in menu.actions() if a.text() == action_text).trigger()
+        menu.close()
+
+    QTimer.singleShot(0, act)
+    button.click()
+    return ret['menu'], ret['enabled']
+
+
+def test_grid_buttons_share_one_menu():
+    matrix = FidgetMatrix(FidgetInt.template('i', **PROVIDED), rows=(2, 1, 4), columns=(2, 2, None),
+                          scrollable=False, **PROVIDED)
+    matrix.fill_value([[1, 2], [3, 4]])
+    assert matrix.row_menu is None and matrix.col_menu is None
+
+    menu, enabled = click_menu(matrix.row_btns[0], 'row_menu', matrix, 'add row below')
+    assert enabled['delete row'] and enabled['add row below']
+    assert matrix.row_count == 3
+    assert matrix.col_menu is None
+
+    second_menu, enabled = click_menu(matrix.row_btns[1], 'row_menu', matrix, 'delete row')
+    assert second_menu is menu
+    # the menu is re-populated for each click, not appended to
+    assert len(menu.actions()) == len(enabled) == 6
+    # the row count is at its maximum
+    assert not enabled['add row below'] and enabled['delete row']
+    # the empty row added below the first row was deleted
+    assert matrix.row_count == 2
+
+    _, enabled = click_menu(matrix.col_btns[1], 'col_menu', matrix)
+    # the column count is at its minimum
+    assert not enabled['delete column'] and enabled['add column right']
+    assert matrix.value().value == [[1, 2], [3, 4]]
+
+
+def test_table_row_buttons_share_one_menu():
+    table = FidgetTable('table', [FidgetInt.template('x', **PROVIDED), FidgetInt.template('y', **PROVIDED)],
+                        rows=(1, 1, None), scrollable=False, **PROVIDED)
+    assert table.row_menu is None
+    menu, enabled = click_menu(table.row_btns[0], 'row_menu', table, 'add row below')
+    assert not enabled['delete row']
+    second_menu, enabled = click_menu(table.row_btns[1], 'row_menu', table)
+    assert second_menu is menu
+    assert enabled['delete row']
+    assert len(menu.actions()) == len(enabled)
+
+
+def test_shared_file_dialog_per_class_and_mode():
+    dialog = shared_file_dialog(RememberingFileDialog, QFileDialog.AnyFile)
+    assert shared_file_dialog(RememberingFileDialog, QFileDialog.AnyFile) is dialog
+    assert dialog.fileMode() == QFileDialog.AnyFile
+    assert shared_file_dialog(RememberingFileDialog, QFileDialog.ExistingFile) is not dialog
+    assert shared_file_dialog(QFileDialog, QFileDialog.AnyFile) is not dialog
+
+
+def test_path_dialogs_are_created_on_first_use_and_shared():
+    first = FidgetFilePath('first', **PROVIDED)
+    second = FidgetFilePath('second', **PROVIDED)
+    existing = FidgetFilePath('existing', exist_cond=True, **PROVIDED)
+    directory = FidgetDirPath('dir', **PROVIDED)
+    private = FidgetFilePath('private', dialog={'caption': 'private'}, **PROVIDED)
+    assert first._dialog is None
+
+    assert first.dialog is second.dialog
+    assert first.dialog is shared_file_dialog(RememberingFileDialog, QFileDialog.AnyFile)
+    assert existing.dialog is not first.dialog
+    assert existing.dialog.fileMode() == QFileDialog.ExistingFile
+    assert directory.dialog.fileMode() == QFileDialog.DirectoryOnly
+    assert private.dialog is not first.dialog
+    assert private.dialog.fileMode() == QFileDialog.AnyFile
+
+
+def test_minimal_question_is_created_on_first_browse():
+    inner = FidgetInt.template('i', **PROVIDED)
+    first = FidgetMinimal(inner, initial_value=1, **PROVIDED)
+    second = FidgetMinimal(inner, initial_value=2, **PROVIDED)
+    assert first.question is None and second.question is None
+    # until then, both use the adapters of one headless question
+    assert first._adapter_source() is second._adapter_source()
+    assert first._adapter_source() is inner.headless_instance(FidgetQuestion)
+
+    QTimer.singleShot(0, lambda: first.question.ok_button.click())
+    first.browse_btn.click()
+    assert first.question is not None and not first.question.is_headless
+    assert first.question.inner.value().value == 1
+    assert first._adapter_source() is first.question
+    assert second.question is None
+    assert first.value().value == 1
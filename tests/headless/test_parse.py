@@ -0,0 +1,43 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from fidget.backend.QtWidgets import QApplication
+
+from fidget.widgets import FidgetInt, FidgetMatrix
+
+from tests.headless.__util__ import PROVIDED
+
+app = QApplication.instance() or QApplication([])
+
+
+def int_matrix(rows, columns):
+    return FidgetMatrix(FidgetInt.template('i', **PROVIDED), rows=(rows, 1, None),
+                        columns=(columns, 1, None), scrollable=False, **PROVIDED)
+
+
+def test_matrix_edit_shares_untouched_rows():
+    matrix = int_matrix(4, 3)
+    matrix.fill_value([[i * 3 + j for j in range(3)] for i in range(4)])
+    previous = matrix.value().value
+
+    matrix.inners[2][1].fill_value(-1)
+    result = matrix.value().value
+    assert result == [[0, 1, 2], [3, 4, 5], [6, -1, 8], [9, 10, 11]]
+    assert result is not previous
+    assert result[2] is not previous[2]
+    assert previous[2] == [6, 7, 8]
+    for i in (0, 1, 3):
+        assert result[i] is previous[i]
+
+
+def test_matrix_results_are_not_the_cache():
+    matrix = int_matrix(2, 2)
+    matrix.fill_value([[1, 2], [3, 4]])
+    result = matrix.value().value
+    assert result is not matrix._last_parsed
+    assert not any(row is cached for (row, cached) in zip(result, matrix._last_parsed))
+    result[0] = [100, 200]
+
+    matrix.inners[1][1].fill_value(5)
+    assert matrix.value().value == [[1, 2], [3, 5]]
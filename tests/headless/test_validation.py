@@ -0,0 +1,165 @@
+import os
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from threading import Event
+from time import monotonic
+
+from fidget.backend.QtWidgets import QApplication
+
+from fidget.core import ValidationError, ValidationCache
+from fidget.widgets import FidgetInt
+
+from tests.headless.__util__ import PROVIDED, reject_negative
+
+app = QApplication.instance() or QApplication([])
+
+
+def wait_for_value(fidget, timeout=5):
+    """
+    process events until the value of fidget is no longer pending
+    """
+    end = monotonic() + timeout
+    while fidget.value().is_pending():
+        assert monotonic() < end, 'validation timed out'
+        QApplication.processEvents()
+    return fidget.value()
+
+
+def test_async_value_is_pending():
+    release = Event()
+
+    def validation_func(v):
+        release.wait(5)
+        reject_negative(v)
+
+    fidget = FidgetInt('i', validation_func=validation_func, async_validation=True, **PROVIDED)
+    fidget.fill_value(3)
+    value = fidget.value()
+    assert value.is_pending()
+    assert value.parsed_value == 3
+    release.set()
+    assert wait_for_value(fidget).value == 3
+
+    fidget.fill_value(-3)
+    assert not wait_for_value(fidget).is_ok()
+
+
+def test_async_superseded_result_is_dropped():
+    releases = {1: Event(), 2: Event()}
+    validated = []
+
+    def validation_func(v):
+        releases[v].wait(5)
+        validated.append(v)
+        if v == 1:
+            raise ValidationError('1 is invalid')
+
+    fidget = FidgetInt('i', validation_func=validation_func, async_validation=True, **PROVIDED)
+    fidget.fill_value(1)
+    first = fidget.value()
+    fidget.fill_value(2)
+    assert fidget.value() is not first
+    releases[1].set()
+    assert isinstance(first.future.exception(5), ValidationError)
+    QApplication.processEvents()
+    # the result of the first validation must not replace the second's pending value
+    assert fidget.value().is_pending()
+    releases[2].set()
+    assert wait_for_value(fidget).value == 2
+    assert validated == [1, 2]
+
+
+def test_async_unexpected_error_is_invalid():
+    def validation_func(v):
+        raise ZeroDivisionError('not a validation error')
+
+    fidget = FidgetInt('i', validation_func=validation_func, async_validation=True, **PROVIDED)
+    changes = []
+    fidget.on_change.connect(lambda: changes.append(fidget.value()))
+    fidget.fill_value(1)
+    value = wait_for_value(fidget)
+    assert not value.is_ok()
+    assert isinstance(value.exception, ValidationError)
+    assert isinstance(value.exception.__cause__, ZeroDivisionError)
+    assert changes and not changes[-1].is_pending()
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ValidationCache(2)
+    cache.store(1, None)
+    cache.store(2, None)
+    assert cache.get(1) is None
+    cache.store(3, None)
+    assert len(cache) == 2
+    assert cache.get(2) is ValidationCache.MISSING
+    assert cache.get(1) is None
+    assert cache.get(3) is None
+
+
+def test_cache_keys_by_type():
+    cache = ValidationCache(4)
+    cache.store(1, None)
+    assert cache.get(True) is ValidationCache.MISSING
+    assert cache.get(1.0) is ValidationCache.MISSING
+
+
+def test_cache_keys_unhashable_values_by_identity():
+    cache = ValidationCache(4)
+    value = [1, 2]
+    cache.store(value, None)
+    assert cache.get(value) is None
+    assert cache.get([1, 2]) is ValidationCache.MISSING
+
+
+def test_cache_hit_skips_validation_func():
+    validated = []
+
+    def validation_func(v):
+        validated.append(v)
+        reject_negative(v)
+
+    fidget = FidgetInt('i', validation_func=validation_func, validation_cache_size=8, **PROVIDED)
+    for v in (1, 2, 1, 2, 1):
+        fidget.fill_value(v)
+        assert fidget.value().value == v
+    assert validated == [1, 2]
+    assert (fidget.validation_cache.hits, fidget.validation_cache.misses) == (3, 2)
+
+
+def test_cache_raises_cached_errors_again():
+    validated = []
+
+    def validation_func(v):
+        validated.append(v)
+        reject_negative(v)
+
+    fidget = FidgetInt('i', validation_func=validation_func, validation_cache_size=8, **PROVIDED)
+    fidget.fill_value(-1)
+    first = fidget.value()
+    fidget.fill_value(1)
+    assert fidget.value().is_ok()
+    fidget.fill_value(-1)
+    second = fidget.value()
+    assert not first.is_ok() and not second.is_ok()
+    assert second.exception is first.exception
+    assert validated == [-1, 1]
+
+
+def test_cache_does_not_store_unexpected_errors():
+    calls = []
+
+    def validation_func(v):
+        calls.append(v)
+        raise ZeroDivisionError('not a validation error')
+
+    cache = ValidationCache(4)
+    for _ in range(2):
+        try:
+            cache.validate(1, validation_func, (ValidationError,))
+        except ZeroDivisionError:
+            pass
+        else:
+            assert False, 'the error was swallowed'
+    assert calls == [1, 1]
+    assert len(cache) == 0